@@ -48,8 +48,6 @@ a = Analysis(
         'ctypes',
         'jinja2',
         'langchain_core',
-        'langchain_openai',
-        'openai',
         'pydantic',
         'markdown_it',
         'yfinance',
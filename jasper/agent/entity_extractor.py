@@ -1,9 +1,9 @@
 from typing import List, Any, Literal
-from pydantic import BaseModel, ValidationError
+from pydantic import BaseModel, TypeAdapter, ValidationError
 from langchain_core.prompts import ChatPromptTemplate
-import json
-import re
 from ..observability.logger import SessionLogger
+from .json_utils import parse_llm_json
+from ..core.llm_cache import LLMCache, cacheable_system_message
 
 
 # --- Entity Model ---
@@ -21,15 +21,18 @@ class QueryIntent(BaseModel):
     reasoning: str = ""
 
 
+# Batch validator: one pydantic-core call for the whole entity list
+_ENTITY_LIST = TypeAdapter(List[Entity])
+
+
 # Combined extraction result
 class ExtractionResult(BaseModel):
     entities: List[Entity]
     intent: QueryIntent
 
 
-NER_PROMPT = """
-Extract financial entities from the user query AND classify query intent.
-
+# Entity/intent rules are shared with the Planner's fused single-call prompt
+NER_RULES = """
 Rules for entities:
 - Identify companies, indices, sectors, macro indicators
 - Include ticker if confidently known
@@ -47,19 +50,26 @@ Examples:
 - "How does Amazon make money?" → qualitative
 - "Compare Tesla and Ford operating margins" → quantitative
 - "What is Microsoft's strategy AND revenue growth?" → mixed
+"""
 
+# Static instructions go first so providers can reuse the cached prompt prefix;
+# only the query changes between calls.
+NER_SYSTEM_PROMPT = """
+Extract financial entities from the user query AND classify query intent.
+""" + NER_RULES + """
 Return JSON only in this format:
-{{
+{
   "entities": [
-    {{"name": "Company Name", "type": "company", "ticker": "TICKER"}}
+    {"name": "Company Name", "type": "company", "ticker": "TICKER"}
   ],
-  "intent": {{
+  "intent": {
     "category": "quantitative|qualitative|mixed",
     "reasoning": "Brief explanation of intent classification"
-  }}
-}}
+  }
+}
+"""
 
-Query:
+NER_HUMAN_PROMPT = """Query:
 {query}
 """
 
@@ -67,37 +77,18 @@ Query:
 # --- Entity Extractor ---
 # Handles the interpretation of user queries to identify financial entities and intent
 class EntityExtractor:
-    def __init__(self, llm: Any, logger: SessionLogger | None = None):
+    def __init__(self, llm: Any, logger: SessionLogger | None = None, cache: LLMCache | None = None):
         # FIX 6: Verify LLM is deterministic
         if hasattr(llm, 'temperature') and llm.temperature != 0:
             raise ValueError(f"EntityExtractor requires deterministic LLM (temperature=0), got {llm.temperature}")
         
         self.llm = llm
         self.logger = logger or SessionLogger()
-
-    def _extract_json(self, text: str) -> str:
-        """Extract JSON from text, handling markdown code blocks."""
-        # Remove markdown code block markers
-        text = re.sub(r'```json\s*', '', text)
-        text = re.sub(r'```\s*$', '', text)
-        text = text.strip()
-        
-        # Find the first { and match it with the last }
-        start_idx = text.find('{')
-        if start_idx == -1:
-            return text
-        
-        # Find matching closing brace by counting
-        brace_count = 0
-        for i in range(start_idx, len(text)):
-            if text[i] == '{':
-                brace_count += 1
-            elif text[i] == '}':
-                brace_count -= 1
-                if brace_count == 0:
-                    return text[start_idx:i+1]
-        
-        return text[start_idx:]
+        self.cache = cache or LLMCache()
+        self.prompt = ChatPromptTemplate.from_messages([
+            cacheable_system_message(NER_SYSTEM_PROMPT),
+            ("human", NER_HUMAN_PROMPT),
+        ])
 
     async def extract(self, query: str) -> ExtractionResult:
         """
@@ -107,28 +98,35 @@ class EntityExtractor:
             ExtractionResult with both entities and intent classification
         """
         self.logger.log("ENTITY_EXTRACTION_STARTED", {"query": query})
-        prompt = ChatPromptTemplate.from_template(NER_PROMPT)
-        generate_result = await self.llm.agenerate([prompt.format_messages(query=query)])
-        raw = generate_result.generations[0][0].text
+        raw = await self.cache.generate(self.llm, self.prompt.format_messages(query=query), query=query, namespace="ner")
 
         # Extract JSON from markdown or plain text
-        json_text = self._extract_json(raw)
-
         try:
-            data = json.loads(json_text)
-        except Exception as e:
-            self.logger.log("ENTITY_EXTRACTION_PARSE_ERROR", {"raw": raw, "json_text": json_text, "error": str(e)})
+            data = parse_llm_json(raw)
+        except ValueError as e:
+            self.logger.log("ENTITY_EXTRACTION_PARSE_ERROR", {"raw": raw, "error": str(e)})
             raise RuntimeError("Failed to parse entity extractor output as JSON") from e
 
+        result = self.parse_result(data)
+        self.logger.log("ENTITY_EXTRACTION_COMPLETED", {"count": len(result.entities), "intent": result.intent.category})
+        return result
+
+    def parse_result(self, data: dict) -> ExtractionResult:
+        """Build an ExtractionResult from parsed `entities`/`intent` JSON fields."""
         # Extract entities
-        entities = []
-        for e in data.get("entities", []):
-            try:
-                ent = Entity(**e)
-                entities.append(ent)
-            except ValidationError as ve:
-                # skip invalid entities but log
-                self.logger.log("ENTITY_VALIDATION_ERROR", {"entity": e, "error": ve.errors()})
+        raw_entities = data.get("entities", [])
+        try:
+            entities = _ENTITY_LIST.validate_python(raw_entities)
+        except ValidationError:
+            # Fall back to per-item validation so one bad entity doesn't drop the rest
+            entities = []
+            for e in raw_entities:
+                try:
+                    ent = Entity(**e)
+                    entities.append(ent)
+                except ValidationError as ve:
+                    # skip invalid entities but log
+                    self.logger.log("ENTITY_VALIDATION_ERROR", {"entity": e, "error": ve.errors()})
 
         # Extract intent
         intent_data = data.get("intent", {})
@@ -139,6 +137,4 @@ class EntityExtractor:
             self.logger.log("INTENT_EXTRACTION_ERROR", {"intent_data": intent_data})
             intent = QueryIntent(category="quantitative", reasoning="Defaulted due to extraction error")
 
-        result = ExtractionResult(entities=entities, intent=intent)
-        self.logger.log("ENTITY_EXTRACTION_COMPLETED", {"count": len(entities), "intent": intent.category})
-        return result
+        return ExtractionResult(entities=entities, intent=intent)
@@ -1,4 +1,6 @@
-﻿from ..core.state import Task, Jasperstate
+﻿import re
+
+from ..core.state import Task, Jasperstate
 from ..tools.financials import FinancialDataRouter, FinancialDataError
 from ..observability.logger import SessionLogger
 
@@ -9,6 +11,10 @@ class Executor:
     def __init__(self, financial_router: FinancialDataRouter, logger: SessionLogger | None = None):
         self.financial_router = financial_router
         self.logger = logger or SessionLogger()
+        # tool_name -> async fetcher taking a ticker; new tools only need an entry here
+        self._dispatch = {
+            "income_statement": self.financial_router.fetch_income_statement,
+        }
 
     def _validate_financial_data(self, data):
         """Ensure data structure is valid before storing."""
@@ -27,18 +33,33 @@ class Executor:
         
         return True
 
+    @staticmethod
+    def _resolve_ticker(state: Jasperstate, task: Task) -> str | None:
+        """Fall back to the planner's resolved entities when a task has no ticker argument."""
+        words = task.description.lower().split()
+        for name, ticker in state.resolved_entities.items():
+            # Whole words only, so "Meta" does not match "metadata" or "Apple" "pineapple".
+            # Lookarounds rather than \b so names ending in punctuation ("Amazon.com Inc.") still match
+            if re.search(rf"(?<!\w){re.escape(name)}(?!\w)", task.description, re.IGNORECASE) or ticker.lower() in words:
+                return ticker
+        tickers = set(state.resolved_entities.values())
+        # A single resolved company is unambiguous
+        return tickers.pop() if len(tickers) == 1 else None
+
     async def execute_task(self, state: Jasperstate, task: Task) -> None:
         task.status = "in_progress"
 
         try:
             # Rely on explicit tool_name
-            tool = (task.tool_name or "").lower()
+            fetch = self._dispatch.get(task.tool_name or "")
 
-            if tool == "income_statement":
+            if fetch is not None:
                 # Extract ticker from tool_args if available
                 ticker = None
                 if task.tool_args:
                     ticker = task.tool_args.get("ticker")
+                if not ticker:
+                    ticker = self._resolve_ticker(state, task)
                 
                 if not ticker:
                     # Fallback or error
@@ -51,7 +72,7 @@ class Executor:
                 attempts = 0
                 while attempts <= state.max_retries:
                     try:
-                        result = await self.financial_router.fetch_income_statement(ticker)
+                        result = await fetch(ticker)
                         
                         # Validate the result before processing
                         if not result or (isinstance(result, list) and len(result) == 0):
@@ -64,6 +85,7 @@ class Executor:
                             raise FinancialDataError(f"Invalid financial data structure: {str(ve)}") from ve
 
                         state.task_results[task.id] = result
+                        state.financials.append_reports(ticker.upper(), result, task.id)
                         task.status = "completed"
                         self.logger.log("TASK_EXECUTED", {"task_id": task.id, "status": task.status})
                         break
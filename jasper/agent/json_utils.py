@@ -0,0 +1,82 @@
+import json
+from typing import Any, List
+
+
+_DECODER = json.JSONDecoder()
+
+
+def parse_llm_json(raw: str) -> Any:
+    """
+    Parse the first JSON object in an LLM response.
+
+    Decoding starts at the first '{' and stops at the end of that object, so
+    ```json fences and surrounding prose are skipped without a separate strip
+    pass, and the C decoder does the brace matching (including braces inside
+    strings) in one scan.
+
+    Raises:
+        json.JSONDecodeError: If no valid JSON object is found
+    """
+    start = raw.find("{")
+    if start == -1:
+        # Let the decoder produce a proper error for non-object output
+        return json.loads(raw)
+
+    obj, _ = _DECODER.raw_decode(raw, start)
+    return obj
+
+
+# --- Streaming Array Parser ---
+# Yields the items of a top-level JSON array (e.g. "tasks") while the response
+# is still streaming, so consumers can act on each item as soon as it is complete.
+class StreamingArrayParser:
+    def __init__(self, key: str):
+        self._marker = f'"{key}"'
+        self._buffer = ""
+        self._pos = -1  # Index just past the last consumed item; -1 until the array opens
+        self.done = False
+
+    def _find_array_start(self) -> int:
+        search_from = 0
+        while True:
+            idx = self._buffer.find(self._marker, search_from)
+            if idx == -1:
+                return -1
+            # An escaped quote means the marker is inside a string value, not a key
+            if idx == 0 or self._buffer[idx - 1] != "\\":
+                rest = self._buffer[idx + len(self._marker):].lstrip()
+                if rest[:1] == ":":
+                    rest = rest[1:].lstrip()
+                    if rest[:1] == "[":
+                        return len(self._buffer) - len(rest) + 1
+                    if not rest:
+                        return -1  # Wait for more input
+            search_from = idx + 1
+
+    def feed(self, chunk: str) -> List[Any]:
+        """Append a chunk and return every array item completed by it."""
+        if self.done:
+            return []
+        self._buffer += chunk
+        if self._pos == -1:
+            self._pos = self._find_array_start()
+            if self._pos == -1:
+                return []
+
+        items = []
+        while True:
+            # Skip separators between items
+            while self._pos < len(self._buffer) and self._buffer[self._pos] in " \t\r\n,":
+                self._pos += 1
+            if self._pos >= len(self._buffer):
+                break
+            if self._buffer[self._pos] == "]":
+                self.done = True
+                break
+            try:
+                item, end = _DECODER.raw_decode(self._buffer, self._pos)
+            except json.JSONDecodeError:
+                break  # Item not complete yet
+            items.append(item)
+            self._pos = end
+        return items
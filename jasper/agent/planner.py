@@ -1,27 +1,32 @@
-﻿import uuid
-from typing import List, Any, Tuple
+﻿from typing import List, Any, Callable, Dict, Optional, Tuple
+from pydantic import BaseModel, Field, TypeAdapter
 from langchain_core.prompts import ChatPromptTemplate
 from ..core.state import Task, ReportMode
-from .entity_extractor import EntityExtractor
-import json
-import re
+from .entity_extractor import EntityExtractor, NER_RULES
 from ..observability.logger import SessionLogger
+from .json_utils import parse_llm_json, StreamingArrayParser
+from ..core.llm_cache import LLMCache, cacheable_system_message
 
 
 # FIX 7: Define available tools
 AVAILABLE_TOOLS = ["income_statement"]
 
+# Validates a whole task list in pydantic-core instead of one Task(...) call per item
+_TASK_LIST = TypeAdapter(List[Task])
 
-PLANNER_PROMPT = """
+
+# Static instructions go first so providers can reuse the cached prompt prefix;
+# the query and its keyword-derived mode stay in the dynamic tail.
+# Entity extraction, intent classification and task planning share one LLM round-trip.
+PLANNER_SYSTEM_PROMPT = """
 You are a financial research planner.
-ACTIVE REPORT MODE: {report_mode}
 
-Query Intent: {intent}
-Extracted Entities:
-{entities}
+Step 1: Extract financial entities from the user question AND classify query intent.
+""" + NER_RULES + """
+Step 2: Plan research tasks for the question using the extracted entities and intent.
 
 Available Tools:
-{available_tools}
+""" + ", ".join(AVAILABLE_TOOLS) + """
 
 Your job:
 - Strictly adhere to the ACTIVE REPORT MODE. Do NOT generate tasks outside this scope.
@@ -40,62 +45,65 @@ For QUANTITATIVE tasks:
 - Do NOT assume data exists
 - Do NOT compute results
 - Do NOT answer the question
+- Tasks run in parallel unless ordered: set "depends_on" to the 0-based positions of earlier tasks
+  whose results this task needs; leave it empty for independent data fetches
 
 Output JSON ONLY in this format:
-{{
+{
+  "entities": [
+    {"name": "Company Name", "type": "company", "ticker": "TICKER"}
+  ],
+  "intent": {
+    "category": "quantitative|qualitative|mixed",
+    "reasoning": "Brief explanation of intent classification"
+  },
   "tasks": [
-    {{
+    {
       "description": "Fetch income statement for AAPL",
       "tool_name": "income_statement",
-      "tool_args": {{"ticker": "AAPL"}},
+      "tool_args": {"ticker": "AAPL"},
+      "depends_on": [],
       "status": "pending"
-    }}
+    }
   ]
-}}
+}
 
 For QUALITATIVE or MIXED queries with no quantitative component:
-- Return: {{"tasks": []}}
+- Return an empty "tasks" list: "tasks": []
+"""
+
+PLANNER_HUMAN_PROMPT = """ACTIVE REPORT MODE: {report_mode}
 
 User question:
 {query}
 """
 
 
+# --- Combined Plan ---
+# Everything the fused entity + planning call produces
+class CombinedPlan(BaseModel):
+    tasks: List[Task]
+    report_mode: ReportMode
+    resolved_entities: Dict[str, str] = Field(default_factory=dict, description="Entity name -> ticker")
+
+
 # --- Planner ---
 # Orchestrates the research process by breaking down queries into tasks
 class Planner:
-    def __init__(self, llm: Any, logger: SessionLogger | None = None):
+    def __init__(self, llm: Any, logger: SessionLogger | None = None, cache: LLMCache | None = None):
         # FIX 6: Verify LLM is deterministic
         if hasattr(llm, 'temperature') and llm.temperature != 0:
             raise ValueError(f"Planner requires deterministic LLM (temperature=0), got {llm.temperature}")
         
         self.llm = llm
         self.logger = logger or SessionLogger()
-        self.extractor = EntityExtractor(llm, logger=self.logger)
-
-    def _extract_json(self, text: str) -> str:
-        """Extract JSON from text, handling markdown code blocks."""
-        # Remove markdown code block markers
-        text = re.sub(r'```json\s*', '', text)
-        text = re.sub(r'```\s*$', '', text)
-        text = text.strip()
-        
-        # Find the first { and match it with the last }
-        start_idx = text.find('{')
-        if start_idx == -1:
-            return text
-        
-        # Find matching closing brace by counting
-        brace_count = 0
-        for i in range(start_idx, len(text)):
-            if text[i] == '{':
-                brace_count += 1
-            elif text[i] == '}':
-                brace_count -= 1
-                if brace_count == 0:
-                    return text[start_idx:i+1]
-        
-        return text[start_idx:]
+        self.cache = cache or LLMCache()
+        self.extractor = EntityExtractor(llm, logger=self.logger, cache=self.cache)
+        # FIX 7: Available tools live in the static system prompt
+        self.prompt = ChatPromptTemplate.from_messages([
+            cacheable_system_message(PLANNER_SYSTEM_PROMPT),
+            ("human", PLANNER_HUMAN_PROMPT),
+        ])
 
     def _infer_mode(self, query: str, intent_category: str) -> ReportMode:
         """Determines report mode based on query keywords and intent."""
@@ -115,14 +123,97 @@ class Planner:
             
         return ReportMode.GENERAL
 
-    async def plan(self, query: str) -> Tuple[List[Task], ReportMode]:
+    def _mode_hint(self, query: str) -> str:
+        """Report mode for the prompt; falls back to intent-based rules when no keyword decides it."""
+        keyword_mode = self._infer_mode(query, "")
+        if keyword_mode != ReportMode.GENERAL:
+            return keyword_mode.value
+        return "derive from intent (quantitative → financial_evidence, qualitative → business_model, mixed → general)"
+
+    def _task_spec(self, t: Any) -> dict:
+        """Check one raw task object from the LLM and return the fields used to build a Task."""
+        if not isinstance(t, dict) or "description" not in t:
+            self.logger.log("PLANNER_TASK_SCHEMA_ERROR", {"task": t})
+            raise ValueError("Each task must be an object with at least a 'description' field")
+
+        # FIX 7: Validate tool_name is known
+        tool_name = t.get("tool_name", "")
+        if tool_name and tool_name not in AVAILABLE_TOOLS:
+            raise ValueError(f"Unknown tool: {tool_name}. Available: {AVAILABLE_TOOLS}")
+
+        return {
+            "description": t["description"],
+            "tool_name": tool_name,
+            "tool_args": t.get("tool_args", {}),
+            "status": t.get("status", "pending"),
+            "error": t.get("error", None),
+        }
+
+    @staticmethod
+    def _link_dependencies(task: Task, raw: Any, earlier: List[Task]) -> None:
+        """Map positional dependencies onto the IDs of earlier tasks; ignore forward/invalid refs."""
+        task.depends_on = [
+            earlier[d].id for d in raw.get("depends_on") or []
+            if isinstance(d, int) and 0 <= d < len(earlier)
+        ]
+
+    async def plan(
+        self,
+        query: str,
+        on_task: Optional[Callable[[Task], None]] = None,
+    ) -> Tuple[List[Task], ReportMode]:
+        """Plan tasks for `query`; see `plan_combined` for the full single-call result."""
+        combined = await self.plan_combined(query, on_task=on_task)
+        return combined.tasks, combined.report_mode
+
+    async def plan_combined(
+        self,
+        query: str,
+        on_task: Optional[Callable[[Task], None]] = None,
+    ) -> CombinedPlan:
+        """
+        Extract entities, classify intent and plan tasks in one streamed LLM call.
+
+        If `on_task` is given it is called with each Task as soon as its JSON object
+        has streamed in, so callers can start work before the response is complete.
+        The returned plan contains those same Task objects.
+        """
         self.logger.log("PLANNER_STARTED", {"query": query})
 
-        # Preprocessing: Extract entities AND intent
-        extraction_result = await self.extractor.extract(query)
+        # Single round-trip: entities, intent and tasks come back in one JSON object
+        messages = self.prompt.format_messages(query=query, report_mode=self._mode_hint(query))
+        chunks: List[str] = []
+        task_stream = StreamingArrayParser("tasks")
+        streamed: List[Task] = []
+        async for chunk in self.cache.stream(self.llm, messages, query=query, namespace="planner"):
+            chunks.append(chunk)
+            for t in task_stream.feed(chunk):
+                task = Task.model_validate(self._task_spec(t))
+                self._link_dependencies(task, t, streamed)
+                streamed.append(task)
+                if on_task is not None:
+                    on_task(task)
+        response = "".join(chunks)
+
+        # Extract JSON from markdown or plain text
+        try:
+            parsed = parse_llm_json(response)
+        except ValueError as e:
+            self.logger.log("PLANNER_PARSE_ERROR", {"raw": response, "error": str(e)})
+            raise RuntimeError("Planner output is not valid JSON") from e
+
+        if not isinstance(parsed, dict) or "tasks" not in parsed or not isinstance(parsed["tasks"], list):
+            self.logger.log("PLANNER_SCHEMA_ERROR", {"parsed": parsed})
+            raise ValueError("Planner output must be a JSON object with a 'tasks' list")
+
+        extraction_result = self.extractor.parse_result(parsed)
         entities = extraction_result.entities
         intent = extraction_result.intent
-        
+        self.logger.log("ENTITY_EXTRACTION_COMPLETED", {"count": len(entities), "intent": intent.category})
+
+        # Entity name -> ticker, resolved in the same call so execution never re-asks the LLM
+        resolved = {e.name: e.ticker.upper() for e in entities if e.ticker}
+
         # Infer mode
         report_mode = self._infer_mode(query, intent.category)
         self.logger.log("MODE_INFERRED", {"mode": report_mode.value})
@@ -131,64 +222,27 @@ class Planner:
         if not entities:
             self.logger.log("PLANNER_NO_ENTITIES", {"query": query})
             raise ValueError("Could not extract financial entities from query. Please provide company names or tickers (e.g., 'Apple' or 'AAPL')")
-        
-        entities_str = "\n".join([f"- {e.name} ({e.type}): {e.ticker or 'N/A'}" for e in entities])
-        
-        # FIX 7: Include available tools and intent in prompt
-        tools_str = ", ".join(AVAILABLE_TOOLS)
-        prompt = ChatPromptTemplate.from_template(PLANNER_PROMPT)
-        generate_result = await self.llm.agenerate([prompt.format_messages(
-            query=query, 
-            entities=entities_str, 
-            available_tools=tools_str,
-            intent=intent.category,
-            report_mode=report_mode.value
-        )])
-        response = generate_result.generations[0][0].text
-
-        # Extract JSON from markdown or plain text
-        json_text = self._extract_json(response)
-
-        try:
-            parsed = json.loads(json_text)
-        except Exception as e:
-            self.logger.log("PLANNER_PARSE_ERROR", {"raw": response, "json_text": json_text, "error": str(e)})
-            raise RuntimeError("Planner output is not valid JSON") from e
-
-        if not isinstance(parsed, dict) or "tasks" not in parsed or not isinstance(parsed["tasks"], list):
-            self.logger.log("PLANNER_SCHEMA_ERROR", {"parsed": parsed})
-            raise ValueError("Planner output must be a JSON object with a 'tasks' list")
 
-        tasks: List[Task] = []
-        
         # FIX: For qualitative queries, empty task list is valid
         if intent.category == "qualitative" and len(parsed.get("tasks", [])) == 0:
             self.logger.log("PLANNER_QUALITATIVE_NO_TASKS", {
                 "intent": intent.category,
                 "reasoning": intent.reasoning
             })
-            return tasks, report_mode  # Return empty task list for qualitative queries
-        
-        for t in parsed.get("tasks", []):
-            if not isinstance(t, dict) or "description" not in t:
-                self.logger.log("PLANNER_TASK_SCHEMA_ERROR", {"task": t})
-                raise ValueError("Each task must be an object with at least a 'description' field")
-
-            # FIX 7: Validate tool_name is known
-            tool_name = t.get("tool_name", "")
-            if tool_name and tool_name not in AVAILABLE_TOOLS:
-                raise ValueError(f"Unknown tool: {tool_name}. Available: {AVAILABLE_TOOLS}")
-
-            tasks.append(
-                Task(
-                    id=str(uuid.uuid4()),
-                    description=t["description"],
-                    tool_name=tool_name,
-                    tool_args=t.get("tool_args", {}),
-                    status=t.get("status", "pending"),
-                    error=t.get("error", None),
-                )
-            )
+            # Return empty task list for qualitative queries
+            return CombinedPlan(tasks=[], report_mode=report_mode, resolved_entities=resolved)
+
+        if task_stream.done and len(streamed) == len(parsed["tasks"]):
+            tasks = streamed
+        else:
+            # Streaming did not see the whole array (e.g. unusual layout); build the rest from the
+            # full parse. Streamed tasks are kept by position since `on_task` may already be running
+            # them; new IDs come from Task's default factory
+            tasks = streamed[:len(parsed["tasks"])]
+            remaining = parsed["tasks"][len(tasks):]
+            for task, t in zip(_TASK_LIST.validate_python([self._task_spec(t) for t in remaining]), remaining):
+                self._link_dependencies(task, t, tasks)
+                tasks.append(task)
 
         # For qualitative queries, empty task list is allowed
         if intent.category != "qualitative" and not tasks:
@@ -196,4 +250,4 @@ class Planner:
             raise ValueError("Planner produced empty task list for non-qualitative query")
 
         self.logger.log("PLANNER_COMPLETED", {"task_count": len(tasks), "intent": intent.category})
-        return tasks, report_mode
+        return CombinedPlan(tasks=tasks, report_mode=report_mode, resolved_entities=resolved)
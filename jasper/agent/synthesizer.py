@@ -2,29 +2,10 @@ from typing import Any
 from langchain_core.prompts import ChatPromptTemplate
 from ..core.state import Jasperstate
 from ..observability.logger import SessionLogger
+from ..core.llm_cache import LLMCache
 
 
-# --- Synthesizer ---
-# Combines task results into a final answer with confidence breakdown
-class Synthesizer:
-  def __init__(self, llm: Any, logger: SessionLogger | None = None):
-    self.llm = llm
-    self.logger = logger or SessionLogger()
-
-  async def synthesize(self, state: Jasperstate) -> str:
-    self.logger.log("SYNTHESIS_STARTED", {"plan_length": len(state.plan)})
-    
-    # Ensure validation passed
-    if not state.validation or not state.validation.is_valid:
-        raise ValueError("Cannot synthesize without passing validation")
-    
-    data_context = ""
-    for task_id, result in state.task_results.items():
-        task = next((t for t in state.plan if t.id == task_id), None)
-        desc = task.description if task else "Unknown Task"
-        data_context += f"Task: {desc}\nData: {result}\n\n"
-
-    prompt = ChatPromptTemplate.from_template("""
+SYNTHESIS_PROMPT = """
     ROLE: You are Jasper, a deterministic financial intelligence engine for institutional analysts.
     ACTIVE REPORT MODE: {report_mode}
     TASK: Synthesize research data into a professional analyst memo matching the ACTIVE REPORT MODE.
@@ -82,14 +63,44 @@ class Synthesizer:
     - Visual hierarchy: Use ## for sections, ### for subsections.
     
     Analysis:
-    """)
+    """
+
+
+# --- Synthesizer ---
+# Combines task results into a final answer with confidence breakdown
+class Synthesizer:
+  def __init__(self, llm: Any, logger: SessionLogger | None = None, cache: LLMCache | None = None):
+    self.llm = llm
+    self.logger = logger or SessionLogger()
+    # Template is parsed once; the exact-hash cache makes repeats of the same query + data free
+    self.prompt = ChatPromptTemplate.from_template(SYNTHESIS_PROMPT)
+    self.cache = cache or LLMCache()
+
+  async def synthesize(self, state: Jasperstate) -> str:
+    self.logger.log("SYNTHESIS_STARTED", {"plan_length": len(state.plan)})
     
-    chain = prompt | self.llm
-    response = await chain.ainvoke({
-        "query": state.query, 
-        "data": data_context,
-        "report_mode": state.report_mode.value
-    })
+    # Ensure validation passed
+    if not state.validation or not state.validation.is_valid:
+        raise ValueError("Cannot synthesize without passing validation")
+    
+    descriptions = {t.id: t.description for t in state.plan}
+    data_context = "".join(
+        f"Task: {descriptions.get(task_id, 'Unknown Task')}\nData: {result}\n\n"
+        for task_id, result in state.task_results.items()
+    )
+
+    messages = self.prompt.format_messages(
+        query=state.query,
+        data=data_context,
+        report_mode=state.report_mode.value,
+    )
+    # No semantic tier here: a similar query with different data must not reuse a memo.
+    # Tokens are forwarded as they arrive so the CLI can render the memo while it is written.
+    chunks = []
+    async for chunk in self.cache.stream(self.llm, messages, namespace="synthesis"):
+      chunks.append(chunk)
+      self.logger.log_stream("SYNTHESIS_TOKEN", chunk)
+    response = "".join(chunks)
     
     self.logger.log("SYNTHESIS_COMPLETED", {"confidence": state.validation.confidence})
-    return response.content
+    return response
@@ -1,7 +1,13 @@
-﻿from ..core.state import Jasperstate, validationresult, ConfidenceBreakdown
+﻿import math
+from collections import Counter
+
+from ..core.state import Jasperstate, validationresult, ConfidenceBreakdown, FinancialColumns
 from ..observability.logger import SessionLogger
 
 
+_MISSING = object()
+
+
 class validator:
     def __init__(self, logger: SessionLogger | None = None):
         self.logger = logger or SessionLogger()
@@ -11,20 +17,24 @@ class validator:
         issues = []
 
         # 1. Task completion AND error checking
+        # 2. Data sanity checks
+        # Both run in a single pass over the plan; data issues are reported after task issues.
+        data_issues = []
         for task in state.plan:
-            if task.status != "completed":
+            completed = task.status == "completed"
+            if not completed:
                 issues.append(f"Incomplete task: {task.description}")
             
             if task.error:
                 issues.append(f"Task error: {task.description} - {task.error}")
 
-        # 2. Data sanity checks
-        for task in state.plan:
-            if task.id not in state.task_results:
-                if task.status == "completed":
-                    issues.append(f"Missing data for completed task: {task.description}")
-            elif not state.task_results[task.id]:
-                issues.append(f"Empty data for task: {task.description}")
+            result = state.task_results.get(task.id, _MISSING)
+            if result is _MISSING:
+                if completed:
+                    data_issues.append(f"Missing data for completed task: {task.description}")
+            elif not result:
+                data_issues.append(f"Empty data for task: {task.description}")
+        issues.extend(data_issues)
 
         # 3. Financial logic checks
         self._validate_financial_consistency(state, issues)
@@ -39,18 +49,14 @@ class validator:
             data_quality = 0.85  # Default for knowledge-based responses
             inference_strength = 0.8
         else:
-            data_coverage = len(state.task_results) / len(state.plan) if state.plan else 0.0
+            data_coverage = len(state.task_results) / len(state.plan)
             
-            data_quality = 1.0
             if state.task_results:
-                qualities = []
-                for res in state.task_results.values():
-                    if isinstance(res, list):
-                        # Expecting at least 3 years for quality
-                        qualities.append(min(1.0, len(res) / 3.0))
-                    else:
-                        qualities.append(0.5)
-                data_quality = sum(qualities) / len(qualities)
+                # Expecting at least 3 years for quality; non-list results score 0.5
+                data_quality = sum(
+                    min(1.0, len(res) / 3.0) if isinstance(res, list) else 0.5
+                    for res in state.task_results.values()
+                ) / len(state.task_results)
             else:
                 data_quality = 0.0
 
@@ -76,17 +82,35 @@ class validator:
         self.logger.log("VALIDATION_COMPLETED", {"is_valid": result.is_valid, "issues": result.issues, "confidence": overall_confidence})
         return result
 
+    @staticmethod
+    def _financial_columns(state: Jasperstate) -> FinancialColumns:
+        """
+        Columns filled by the Executor, if they hold exactly the rows of the current results.
+
+        Retries, deduped tasks and discarded early tasks can leave the columns out of step
+        with task_results; the results are authoritative, so the columns are rebuilt then.
+        """
+        expected = Counter()
+        for task in state.plan:
+            if task.id in state.task_results:
+                result = state.task_results[task.id]
+                reports = result if isinstance(result, list) else [result]
+                expected[task.id] = sum(isinstance(report, dict) for report in reports)
+        if Counter(state.financials.task_id) == +expected:
+            return state.financials
+
+        columns = FinancialColumns()
+        for task in state.plan:
+            if task.id in state.task_results:
+                ticker = (task.tool_args or {}).get("ticker") or ""
+                columns.append_reports(ticker.upper(), state.task_results[task.id], task.id)
+        return columns
+
     def _validate_financial_consistency(self, state: Jasperstate, issues: list):
-        # Example: revenue must be non-negative
-        for result in state.task_results.values():
-            # Assuming result might be a list of reports or a single report
-            reports = result if isinstance(result, list) else [result]
-            for report in reports:
-                if isinstance(report, dict):
-                    revenue = report.get("totalRevenue")
-                    if revenue is not None:
-                        try:
-                            if float(revenue) < 0:
-                                issues.append("Negative revenue detected")
-                        except (ValueError, TypeError):
-                            pass
+        # Example: revenue must be non-negative (NaN rows compare False and are skipped)
+        revenue = self._financial_columns(state).total_revenue
+        # min() scans the column in C; only a negative (or a leading NaN, which
+        # min() gets stuck on) needs the per-row Python pass.
+        lowest = min(revenue, default=0.0)
+        if lowest < 0 or math.isnan(lowest):
+            issues.extend("Negative revenue detected" for value in revenue if value < 0)
@@ -1,4 +1,5 @@
 from datetime import datetime, timezone
+import functools
 import time
 from rich.console import Group
 from rich.panel import Panel
@@ -46,9 +47,11 @@ def _fix_markdown_tables(text: str) -> str:
         new_lines.append(line)
     return '\n'.join(new_lines)
 
+@functools.cache
 def render_banner():
     """
     Renders the ASCII banner with a gradient, borderless.
+    Built once; the static renderable is reused by every command and REPL turn.
     """
     # Create Text object from raw ASCII
     text = Text(BANNER_ART)
@@ -74,58 +77,126 @@ def render_banner():
     
     return header_group
 
-def render_mission_board(tasks, overall_status=""):
+def render_synthesis_preview(board, text: str, max_lines: int = 12):
     """
-    Renders the mission progress using a Live Tree structure.
+    Shows the tail of the memo being generated below the mission board.
+    Only the last lines are rendered so the live region stays small.
     """
-    tree = Tree(f"[bold {THEME['Brand']}] MISSION CONTROL[/bold {THEME['Brand']}]", guide_style="dim")
-    
-    # Status Phase with Animation
-    if overall_status:
-        style = f"bold {THEME['Accent']}"
+    tail = "\n".join(text.splitlines()[-max_lines:])
+    preview = Panel(
+        Text(tail, style=THEME["Primary Text"]),
+        title=f"[bold {THEME['Accent']}]DRAFTING MEMO[/bold {THEME['Accent']}]",
+        title_align="left",
+        border_style="dim",
+        box=box.SIMPLE,
+    )
+    return Group(board, preview)
+
+class _Pulse:
+    """Text that alternates between two styles `rate` times per second, resolved at render time."""
+
+    def __init__(self, text: str, on_style: str, off_style: str, rate: float):
+        self.text = text
+        self.on_style = on_style
+        self.off_style = off_style
+        self.rate = rate
+
+    def __rich__(self):
+        style = self.on_style if int(time.time() * self.rate) % 2 == 0 else self.off_style
+        return Text(self.text, style=style)
+
+
+_TASK_ICONS = {"running": "►", "success": "✔", "failed": "✖"}
+_TASK_STYLES = {
+    "success": f"bold {THEME['Success']}",
+    "failed": f"bold {THEME['Error']}",
+    "pending": f"dim {THEME['Primary Text']}",
+}
+
+
+def _task_label(description: str, status: str):
+    label = f"{_TASK_ICONS.get(status, '○')} {description}"
+    if status == "running":
+        # Shimmer effect for active task
+        return _Pulse(label, f"bold {THEME['Accent']}", "bold white", rate=5)
+    return Text(label, style=_TASK_STYLES.get(status, THEME["Primary Text"]))
+
+
+# --- Mission Board ---
+# Live Tree that is built once and mutated per event: a status change swaps one
+# node's label instead of reconstructing every row. Animated labels resolve their
+# style when rendered, so they keep pulsing between events.
+class MissionBoard:
+    def __init__(self, overall_status: str = ""):
+        self.tree = Tree(f"[bold {THEME['Brand']}] MISSION CONTROL[/bold {THEME['Brand']}]", guide_style="dim")
         # Pulsing effect for the phase status
-        if int(time.time() * 2) % 2 == 0:
-            style = "bold white"
-        tree.add(Text(overall_status, style=style))
-    
-    # Task List
-    if tasks:
-        task_tree = tree.add(f"[bold {THEME['Primary Text']}]RESEARCH PLAN[/bold {THEME['Primary Text']}]")
+        self._status = _Pulse("", "bold white", f"bold {THEME['Accent']}", rate=2)
+        self._status_node = Tree(self._status, guide_style="dim")
+        self._plan_node = None
+        self._nodes = {}  # task ID -> Tree node
+        self._descriptions = {}  # task ID -> description
+        self.panel = Panel(
+            self.tree,
+            border_style=THEME["Brand"],
+            padding=(1, 2),
+            style=f"on {THEME['Background']}"
+        )
+        self.set_status(overall_status)
+
+    def __contains__(self, task_id) -> bool:
+        return task_id in self._nodes
+
+    def __rich__(self):
+        return self.panel
+
+    def set_status(self, overall_status: str) -> None:
+        self._status.text = overall_status
+        shown = bool(self.tree.children) and self.tree.children[0] is self._status_node
+        # Swap whole lists so the Live refresh thread never sees a half-edited one
+        if overall_status and not shown:
+            self.tree.children = [self._status_node, *self.tree.children]
+        elif not overall_status and shown:
+            self.tree.children = self.tree.children[1:]
+
+    def set_plan(self, tasks) -> None:
+        """Show `tasks` (dicts with id/description) in plan order, keeping the state of known ones."""
         for task in tasks:
-            status = task.get("status", "pending")
-            description = task.get("description", "")
-            detail = task.get("detail", "")
-            
-            icon = "○"
-            style = THEME["Primary Text"]
-            
-            if status == "running":
-                # Shimmer effect for active task
-                icon = "►"
-                if int(time.time() * 5) % 2 == 0:
-                    style = f"bold {THEME['Accent']}"
-                else:
-                    style = "bold white"
-            elif status == "success":
-                icon = "✔"
-                style = f"bold {THEME['Success']}"
-            elif status == "failed":
-                icon = "✖"
-                style = f"bold {THEME['Error']}"
-            elif status == "pending":
-                style = f"dim {THEME['Primary Text']}"
-
-            node = task_tree.add(Text(f"{icon} {description}", style=style))
-            
-            if status == "running" and detail:
-                node.add(Text(f"{detail}", style=f"italic {THEME['Accent']}"))
-                
-    return Panel(
-        tree,
-        border_style=THEME["Brand"],
-        padding=(1, 2),
-        style=f"on {THEME['Background']}"
-    )
+            if task.get("id") not in self._nodes:
+                self.update_task(task.get("id"), description=task.get("description", "Unknown Task"))
+        self._plan().children = [self._nodes[task.get("id")] for task in tasks]
+
+    def update_task(self, task_id, description=None, status="pending", detail="") -> None:
+        """Set a task's status; unknown tasks are added only when a description is given."""
+        node = self._nodes.get(task_id)
+        if node is None:
+            if description is None:
+                return
+            node = self._nodes[task_id] = self._plan().add("")
+            self._descriptions[task_id] = description
+        node.label = _task_label(self._descriptions[task_id], status)
+        node.children = []
+        if status == "running" and detail:
+            node.add(Text(detail, style=f"italic {THEME['Accent']}"))
+
+    def _plan(self) -> Tree:
+        if self._plan_node is None:
+            self._plan_node = self.tree.add(f"[bold {THEME['Primary Text']}]RESEARCH PLAN[/bold {THEME['Primary Text']}]")
+        return self._plan_node
+
+
+def render_mission_board(tasks, overall_status=""):
+    """
+    Renders the mission progress using a Live Tree structure.
+    """
+    board = MissionBoard(overall_status)
+    for index, task in enumerate(tasks):
+        board.update_task(
+            task.get("id", index),
+            description=task.get("description", ""),
+            status=task.get("status", "pending"),
+            detail=task.get("detail", ""),
+        )
+    return board.panel
 
 def render_final_report(body_text, tickers, sources):
     """
@@ -1,31 +1,84 @@
 import typer
 import asyncio
+import functools
+import importlib.util
 import os
-from typing import Optional
+from typing import TYPE_CHECKING, Any, NamedTuple, Optional
 from rich.console import Console
 from rich.live import Live
 from rich.prompt import Prompt
 from pathlib import Path
 
-# Import core components
-from ..core.controller import JasperController
-from ..agent.planner import Planner
-from ..agent.executor import Executor
-from ..agent.validator import validator
-from ..agent.synthesizer import Synthesizer
-from ..tools.financials import FinancialDataRouter
-from ..tools.providers.alpha_vantage import AlphaVantageClient
-from ..tools.providers.yfinance import YFinanceClient
-from ..core.llm import get_llm
+# Lightweight core components only. Agents, providers (yfinance -> pandas/numpy),
+# the LLM client and PDF export are imported where first used, so `--help`,
+# `version` and failed preflight checks never pay for them.
+from ..tools.tool_cache import ToolResultCache
 from ..observability.logger import SessionLogger
 from ..core.state import Jasperstate, FinalReport
-from ..export.pdf import export_report_to_pdf, export_report_html
 
 # Import UI components
-from .interface import render_banner, render_mission_board, render_final_report, render_forensic_report
-from ..core.config import THEME
+from .interface import MissionBoard, render_banner, render_mission_board, render_synthesis_preview, render_final_report, render_forensic_report
+from ..core.config import THEME, get_llm_cache_ttl, get_sem_cache_threshold
+
+if TYPE_CHECKING:
+    import httpx
+    from ..core.llm_cache import LLMCache
+    from ..core.semantic_cache import ReportCache
+    from ..tools.financials import FinancialDataRouter
 
 console = Console()
+
+
+# Theme markup tags, interpolated once instead of on every print
+class S:
+    ERR = f"[bold {THEME['Error']}]"
+    ERR_END = f"[/bold {THEME['Error']}]"
+    ACCENT = f"[{THEME['Accent']}]"
+    ACCENT_END = f"[/{THEME['Accent']}]"
+    TEXT = f"[{THEME['Primary Text']}]"
+    TEXT_END = f"[/{THEME['Primary Text']}]"
+    REPL_PROMPT = f"{ACCENT}?{ACCENT_END} Enter Financial Query"
+
+
+def _error_hint(title: str, explanation: str, suggestion: str) -> tuple:
+    return (f"[yellow]⚠ {title}:[/yellow]", f"[dim]{explanation}[/dim]", f"[dim]Suggestion: {suggestion}[/dim]")
+
+# Failure guidance keyed by Jasperstate.error_source; unknown sources print the bare error
+ERROR_HINTS = {
+    "llm_service": _error_hint(
+        "LLM Service Error",
+        "The AI model (OpenRouter) is temporarily unavailable or rate-limited.",
+        "Wait a moment and try again, or check your OpenRouter quota.",
+    ),
+    "llm_auth": _error_hint(
+        "LLM Authentication Error",
+        "Your OPENROUTER_API_KEY may be invalid or expired.",
+        "Check your .env file and ensure the key is correct.",
+    ),
+    "llm_timeout": _error_hint(
+        "LLM Timeout",
+        "The request to the AI model took too long.",
+        "Try again, or try a simpler query.",
+    ),
+    "llm_unknown": _error_hint(
+        "Answer Synthesis Error",
+        "Failed to generate the final answer. Data was fetched but answer generation failed.",
+        "Try again or simplify your query.",
+    ),
+    "data_provider": _error_hint(
+        "Data Provider Error",
+        "Could not fetch financial data from available providers.",
+        "Check the ticker symbol (e.g., AAPL, RELIANCE.NS, INFY.NS) or try a different company.",
+    ),
+    "query": _error_hint(
+        "Query Error",
+        "The query could not be understood or mapped to a tool.",
+        "Try rephrasing with a company name or ticker symbol.",
+    ),
+}
+ERROR_HINTS["llm"] = ERROR_HINTS["llm_unknown"]
+
+
 app = typer.Typer(
     help="Institutional Financial research agent.",
     no_args_is_help=False
@@ -34,6 +87,108 @@ app = typer.Typer(
 # Session cache for last report (for export)
 _last_report: Optional[FinalReport] = None
 
+# LLM response cache shared across REPL turns (semantic tier opt-in via JASPER_SEMANTIC_CACHE=1)
+_llm_cache: Optional["LLMCache"] = None
+LLM_CACHE_PATH = Path.home() / ".jasper" / "llm_cache.db"
+
+# Finished reports keyed by query meaning, reused for paraphrased re-asks
+_report_cache: Optional["ReportCache"] = None
+REPORT_CACHE_PATH = Path.home() / ".jasper" / "sem_cache" / "reports.jsonl"
+
+
+# Provider results shared across REPL turns so repeated tickers skip the network
+_tool_cache = ToolResultCache()
+PROVIDER_CACHE_PATH = Path.home() / ".jasper" / "provider_cache"
+
+
+class Runtime(NamedTuple):
+    llm: Any
+    router: "FinancialDataRouter"
+    http_client: "httpx.AsyncClient"
+
+
+@functools.cache
+def get_runtime() -> Runtime:
+    """Build the LLM, HTTP client and provider router once per process and reuse them."""
+    import httpx
+    from ..core.llm import get_llm
+    from ..tools.cache import ResponseCache
+    from ..tools.financials import FinancialDataRouter
+    from ..tools.providers.alpha_vantage import AlphaVantageClient
+    from ..tools.providers.yfinance import YFinanceClient
+
+    http_client = httpx.AsyncClient(
+        timeout=10,
+        limits=httpx.Limits(max_connections=64, max_keepalive_connections=20),
+        # Multiplex requests over one connection when the optional h2 package is installed
+        http2=importlib.util.find_spec("h2") is not None,
+    )
+    # Raw provider responses persist on disk so re-runs skip rate-limited APIs
+    response_cache = ResponseCache(PROVIDER_CACHE_PATH)
+    av_client = AlphaVantageClient(api_key=os.getenv("ALPHA_VANTAGE_API_KEY", "demo"), client=http_client, response_cache=response_cache)
+    yfinance_client = YFinanceClient(response_cache=response_cache)
+    router = FinancialDataRouter(providers=[av_client, yfinance_client], cache=_tool_cache)
+    return Runtime(llm=get_llm(temperature=0), router=router, http_client=http_client)
+
+
+def get_llm_cache() -> "LLMCache":
+    from ..core.llm_cache import LLMCache, SQLiteBackend, load_default_embedder
+
+    global _llm_cache
+    if _llm_cache is None:
+        embedder = load_default_embedder() if os.getenv("JASPER_SEMANTIC_CACHE") == "1" else None
+        ttl = get_llm_cache_ttl()
+        # Deterministic (temperature=0) responses persist across runs unless the TTL is 0
+        backend = SQLiteBackend(str(LLM_CACHE_PATH)) if ttl else None
+        _llm_cache = LLMCache(backend=backend, ttl=ttl or None, embedder=embedder)
+    return _llm_cache
+
+def get_report_cache() -> Optional["ReportCache"]:
+    """Paraphrase-level cache of finished reports (opt-in via JASPER_SEMANTIC_CACHE=1, needs fastembed)."""
+    global _report_cache
+    if _report_cache is None and os.getenv("JASPER_SEMANTIC_CACHE") == "1":
+        from ..core.llm_cache import load_default_embedder
+        from ..core.semantic_cache import ReportCache
+
+        embedder = load_default_embedder()
+        if embedder is not None:
+            _report_cache = ReportCache(embedder, threshold=get_sem_cache_threshold(), path=REPORT_CACHE_PATH)
+    return _report_cache
+
+class _QuietLogger(SessionLogger):
+    """Drops events from background work that must not draw over the prompt."""
+
+    def log(self, event_type: str, payload: dict):
+        pass
+
+def make_speculative_prompt() -> Optional[tuple]:
+    """
+    Prompt session that plans the query while it is typed (opt-in via JASPER_SPECULATIVE_PLAN=1).
+
+    Returns (PromptSession, SpeculativePlanner), or None when disabled or prompt_toolkit is missing.
+    Discarded speculations still cost tokens, hence the opt-in.
+    """
+    if os.getenv("JASPER_SPECULATIVE_PLAN") != "1":
+        return None
+    try:
+        from prompt_toolkit import PromptSession
+        from prompt_toolkit.formatted_text import HTML
+    except ImportError:
+        return None
+    from ..agent.planner import Planner
+    from ..core.llm_cache import LLMCache
+    from .speculative import SpeculativePlanner
+
+    # Share the exact-match tier only, so partial inputs never enter the semantic index
+    shared = get_llm_cache()
+    cache = LLMCache(backend=shared.backend, ttl=shared.ttl)
+    planner = Planner(get_runtime().llm, logger=_QuietLogger(), cache=cache)
+    speculator = SpeculativePlanner(planner.plan_combined)
+
+    session = PromptSession(HTML(f'<style fg="{THEME["Accent"]}">?</style> Enter Financial Query: '))
+    session.default_buffer.on_text_changed += lambda buffer: speculator.on_text_changed(buffer.text)
+    return session, speculator
+
 @app.callback()
 def main_callback(ctx: typer.Context):
     """
@@ -46,128 +201,136 @@ def main_callback(ctx: typer.Context):
         console.print("Deterministic research instrument for institutional analysts.\n")
         console.print("[dim]Usage: python -m jasper [COMMAND] [ARGS]...[/dim]\n")
         console.print("Available Commands:")
-        console.print(f"  [{THEME['Accent']}]ask[/{THEME['Accent']}]         Execute a financial query directly.")
-        console.print(f"  [{THEME['Accent']}]interactive[/{THEME['Accent']}] Starting the interactive research session.")
-        console.print(f"  [{THEME['Accent']}]doctor[/{THEME['Accent']}]      Run system diagnostics.")
-        console.print(f"  [{THEME['Accent']}]version[/{THEME['Accent']}]     Display system version information.\n")
-        console.print(f"Run '[{THEME['Accent']}]python -m jasper ask --help[/{THEME['Accent']}]' for more information on a command.")
+        console.print(f"  {S.ACCENT}ask{S.ACCENT_END}         Execute a financial query directly.")
+        console.print(f"  {S.ACCENT}interactive{S.ACCENT_END} Starting the interactive research session.")
+        console.print(f"  {S.ACCENT}doctor{S.ACCENT_END}      Run system diagnostics.")
+        console.print(f"  {S.ACCENT}version{S.ACCENT_END}     Display system version information.\n")
+        console.print(f"Run '{S.ACCENT}python -m jasper ask --help{S.ACCENT_END}' for more information on a command.")
 
 class RichLogger(SessionLogger):
     def __init__(self, live: Live):
         super().__init__()
         self.live = live
-        self.tasks = [] # List of task dicts for render_mission_board
-        self.overall_status = "[PLANNING] Initializing research engine..."
+        # Board is built once; events mutate the affected node in place
+        self.board = MissionBoard("[PLANNING] Initializing research engine...")
+        self.draft = ""  # Memo text streamed so far during synthesis
+        self.drafting = False
+        # Token events only mark the preview stale; Live's refresh (10/s) rebuilds it at most
+        # once per frame through __rich__, so bursts of tokens coalesce into one render.
+        self._preview = None
+        self.live.update(self)
 
     def log(self, event_type: str, payload: dict):
         # Override to update UI instead of printing JSON
         
         if event_type == "PLANNER_STARTED":
-            self.overall_status = "[PLANNING] Analyzing query and requirements..."
+            self.board.set_status("[PLANNING] Analyzing query and requirements...")
 
         elif event_type == "PLAN_CREATED":
-            # Initialize tasks from plan
-            self.tasks = [
-                {"description": t.get("description", "Unknown Task"), "status": "pending", "detail": ""}
-                for t in payload.get("plan", [])
-            ]
-            count = len(self.tasks)
-            self.overall_status = f"[PLANNING] Decomposing query into {count} sub-tasks..."
-            self.live.update(render_mission_board(self.tasks, self.overall_status))
+            # Show tasks in plan order, keeping the state of tasks that started while the plan streamed
+            plan = payload.get("plan", [])
+            self.board.set_plan(plan)
+            self.board.set_status(f"[PLANNING] Decomposing query into {len(plan)} sub-tasks...")
 
         elif event_type == "TASK_STARTED":
-            # Update task status to running
-            desc = payload.get("description")
-            for t in self.tasks:
-                if t["description"] == desc:
-                    t["status"] = "running"
-                    t["detail"] = "Executing..."
-                    break
-            self.overall_status = "[EXECUTING] Fetching live market data..."
-            self.live.update(render_mission_board(self.tasks, self.overall_status))
+            # Tasks may run concurrently (and before PLAN_CREATED), so match by ID
+            self.board.update_task(
+                payload.get("task_id"),
+                description=payload.get("description", "Unknown Task"),
+                status="running",
+                detail="Executing...",
+            )
+            self.board.set_status("[EXECUTING] Fetching live market data...")
 
         elif event_type == "TASK_COMPLETED":
-            # Find the running task and mark completed
-            status = payload.get("status")
-            for t in self.tasks:
-                if t["status"] == "running":
-                    t["status"] = "success" if status == "completed" else "failed"
-                    t["detail"] = ""
-                    break
-            self.live.update(render_mission_board(self.tasks, self.overall_status))
+            status = "success" if payload.get("status") == "completed" else "failed"
+            self.board.update_task(payload.get("task_id"), status=status)
 
         elif event_type == "VALIDATION_STARTED":
-            self.overall_status = "[VALIDATING] Verifying data integrity..."
-            self.live.update(render_mission_board(self.tasks, self.overall_status))
+            self.board.set_status("[VALIDATING] Verifying data integrity...")
 
         elif event_type == "SYNTHESIS_STARTED":
-            self.overall_status = "[SYNTHESIZING] Compiling executive report..."
-            self.live.update(render_mission_board(self.tasks, self.overall_status))
+            self.board.set_status("[SYNTHESIZING] Compiling executive report...")
+            self.draft = ""
+            self.drafting = True
+            self._preview = None
+
+        elif event_type == "SYNTHESIS_COMPLETED":
+            # The full report is rendered after the Live block; drop the draft preview
+            self.drafting = False
+
+    def log_stream(self, event_type: str, delta: str):
+        if event_type == "SYNTHESIS_TOKEN":
+            self.draft += delta
+            self._preview = None
+
+    def __rich__(self):
+        if not self.drafting:
+            return self.board
+        if self._preview is None:
+            self._preview = render_synthesis_preview(self.board, self.draft)
+        return self._preview
 
 async def execute_research(query: str, console: Console) -> Jasperstate:
+    from ..core.controller import JasperController
+    from ..agent.planner import Planner
+    from ..agent.executor import Executor
+    from ..agent.validator import validator
+    from ..agent.synthesizer import Synthesizer
+
     # Setup Live display with initial empty board
     # Initialize with default status for immediate visual feedback
-    with Live(render_mission_board([], "[PLANNING] Initializing research engine..."), refresh_per_second=10, console=console) as live:
-        
-        # Initialize Logger with Live reference
-        logger = RichLogger(live)
-        
-        # Initialize Components
-        llm = get_llm(temperature=0)
-        av_client = AlphaVantageClient(api_key=os.getenv("ALPHA_VANTAGE_API_KEY", "demo"))
-        yfinance_client = YFinanceClient()
-        router = FinancialDataRouter(providers=[av_client, yfinance_client])
-
-        controller = JasperController(
-            Planner(llm, logger=logger),
-            Executor(router, logger=logger),
-            validator(logger=logger),
-            Synthesizer(llm, logger=logger),
-            logger=logger,
+    report_cache = get_report_cache()
+    cached_report = report_cache.lookup(query) if report_cache else None
+    if cached_report is not None:
+        # Paraphrase of an earlier query: reuse its report instead of re-running the pipeline
+        console.print(f"[dim]Reusing report from a similar earlier query ({cached_report.query})[/dim]")
+        state = Jasperstate(
+            query=query,
+            report_mode=cached_report.report_mode,
+            status="Completed",
+            final_answer=cached_report.synthesis_text,
+            report=cached_report,
         )
+    else:
+        with Live(render_mission_board([], "[PLANNING] Initializing research engine..."), refresh_per_second=10, console=console) as live:
+            
+            # Initialize Logger with Live reference
+            logger = RichLogger(live)
+            
+            # Reuse process-wide components so connections stay warm across queries
+            runtime = get_runtime()
+            llm, router = runtime.llm, runtime.router
+
+            controller = JasperController(
+                Planner(llm, logger=logger, cache=get_llm_cache()),
+                Executor(router, logger=logger),
+                validator(logger=logger),
+                Synthesizer(llm, logger=logger, cache=get_llm_cache()),
+                logger=logger,
+            )
 
-        # Run Controller
-        state = await controller.run(query)
+            # Run Controller
+            state = await controller.run(query)
+
+        if report_cache and state.status == "Completed" and state.report and state.report.is_valid:
+            report_cache.store(query, state.report, state.resolved_entities)
         
     # After Live block, show results
     await asyncio.sleep(0.2) # Short pause to give report "weight"
     console.print("\n")
     
     if state.status == "Failed":
-        console.print(f"[bold {THEME['Error']}]Research Failed[/bold {THEME['Error']}]")
+        console.print(f"{S.ERR}Research Failed{S.ERR_END}")
         if state.error:
-            error_source = state.error_source or "unknown"
-            
-            # LLM Service Errors
-            if error_source == "llm_service":
-                console.print(f"[yellow]⚠ LLM Service Error:[/yellow] {state.error}")
-                console.print("[dim]The AI model (OpenRouter) is temporarily unavailable or rate-limited.[/dim]")
-                console.print("[dim]Suggestion: Wait a moment and try again, or check your OpenRouter quota.[/dim]")
-            elif error_source == "llm_auth":
-                console.print(f"[yellow]⚠ LLM Authentication Error:[/yellow] {state.error}")
-                console.print("[dim]Your OPENROUTER_API_KEY may be invalid or expired.[/dim]")
-                console.print("[dim]Suggestion: Check your .env file and ensure the key is correct.[/dim]")
-            elif error_source == "llm_timeout":
-                console.print(f"[yellow]⚠ LLM Timeout:[/yellow] {state.error}")
-                console.print("[dim]The request to the AI model took too long.[/dim]")
-                console.print("[dim]Suggestion: Try again, or try a simpler query.[/dim]")
-            elif error_source in ("llm_unknown", "llm"):
-                console.print(f"[yellow]⚠ Answer Synthesis Error:[/yellow] {state.error}")
-                console.print("[dim]Failed to generate the final answer. Data was fetched but answer generation failed.[/dim]")
-                console.print("[dim]Suggestion: Try again or simplify your query.[/dim]")
-            # Data Provider Errors
-            elif error_source == "data_provider":
-                console.print(f"[yellow]⚠ Data Provider Error:[/yellow] {state.error}")
-                console.print("[dim]Could not fetch financial data from available providers.[/dim]")
-                console.print("[dim]Suggestion: Check the ticker symbol (e.g., AAPL, RELIANCE.NS, INFY.NS) or try a different company.[/dim]")
-            # Query Issues
-            elif error_source == "query":
-                console.print(f"[yellow]⚠ Query Error:[/yellow] {state.error}")
-                console.print("[dim]The query could not be understood or mapped to a tool.[/dim]")
-                console.print("[dim]Suggestion: Try rephrasing with a company name or ticker symbol.[/dim]")
-            # Generic
-            else:
+            hint = ERROR_HINTS.get(state.error_source or "unknown")
+            if hint is None:
                 console.print(f"Error: {state.error}")
+            else:
+                title, explanation, suggestion = hint
+                console.print(f"{title} {state.error}")
+                console.print(explanation)
+                console.print(suggestion)
                 
         if state.validation and state.validation.issues:
             console.print("[yellow]Validation Issues:[/yellow]")
@@ -178,21 +341,17 @@ async def execute_research(query: str, console: Console) -> Jasperstate:
         answer = state.final_answer or "No answer generated."
         
         # Extract tickers and sources for the report header
-        tickers = []
+        # Ordered dict keys dedupe tickers while preserving plan order
+        tickers = {}
         sources = set()
         for task in state.plan:
             if task.tool_args:
                 ticker = task.tool_args.get("ticker") or task.tool_args.get("symbol")
                 if ticker:
-                    tickers.append(ticker.upper())
+                    tickers[ticker.upper()] = None
             if task.tool_name:
-                sources.add(task.tool_name.replace("_", " ").title())
-        
-        # Deduplicate tickers while preserving order
-        unique_tickers = []
-        for t in tickers:
-            if t not in unique_tickers:
-                unique_tickers.append(t)
+                sources.add(JasperController._source_label(task.tool_name))
+        unique_tickers = list(tickers)
         
         # Fallbacks
         if not unique_tickers:
@@ -205,7 +364,7 @@ async def execute_research(query: str, console: Console) -> Jasperstate:
             console.print(render_forensic_report(state.report))
             
             # Manual export via /export command (auto-export disabled)
-            console.print(f"[dim]Tip: Use [{THEME['Accent']}]/export[/{THEME['Accent']}] to save PDF[/dim]")
+            console.print(f"[dim]Tip: Use {S.ACCENT}/export{S.ACCENT_END} to save PDF[/dim]")
         else:
             # Fallback to legacy memo
             console.print(render_final_report(answer, unique_tickers, list(sources)))
@@ -231,13 +390,13 @@ def ask_command(query: str = typer.Argument(..., help="Financial research questi
         get_llm_api_key()
         get_financial_api_key()
     except ValueError as e:
-        console.print(f"[bold {THEME['Error']}]Setup Error:[/bold {THEME['Error']}] {str(e)}")
+        console.print(f"{S.ERR}Setup Error:{S.ERR_END} {str(e)}")
         raise typer.Exit(code=1)
     
     # Execute research
     console.clear()
     console.print(render_banner())
-    console.print(f"\n[{THEME['Accent']}]Researching:[/{THEME['Accent']}] {query}\n")
+    console.print(f"\n{S.ACCENT}Researching:{S.ACCENT_END} {query}\n")
     state = asyncio.run(execute_research(query, console))
     
     # Cache the report for export command
@@ -299,12 +458,9 @@ def doctor_command():
     
     # Check 3: Python version
     import sys
+    # pip refuses to install on anything older than requires-python, so this only reports
     py_version = f"{sys.version_info.major}.{sys.version_info.minor}"
-    if sys.version_info >= (3, 9):
-        console.print(f"[green]✓[/green] Python {py_version} (requirement: ≥3.9)")
-    else:
-        console.print(f"[red]✗[/red] Python {py_version} is too old (requirement: ≥3.9)")
-        issues.append(f"Python 3.9+ required (you have {py_version})")
+    console.print(f"[green]✓[/green] Python {py_version} (requirement: ≥3.9)")
     
     # Check 4: Try importing core modules
     try:
@@ -352,21 +508,34 @@ def interactive_command():
         get_llm_api_key()
         get_financial_api_key()
     except ValueError as e:
-        console.print(f"[bold {THEME['Error']}]Setup Error:[/bold {THEME['Error']}] {str(e)}")
+        console.print(f"{S.ERR}Setup Error:{S.ERR_END} {str(e)}")
         raise typer.Exit(code=1)
     
     # REPL Loop
+    # One event loop for the whole session so pooled HTTP connections survive between turns.
+    # Driven with run_until_complete rather than asyncio.run so Ctrl+C at the prompt is a
+    # plain KeyboardInterrupt instead of a cancellation of the whole session.
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+
     console.clear()
     console.print(render_banner())
-    console.print(f"\n[{THEME['Primary Text']}]Interactive Mode. Type 'exit' to quit.[/{THEME['Primary Text']}]")
-    console.print(f"[{THEME['Primary Text']}]Commands: [/{THEME['Primary Text']}][{THEME['Accent']}]/export[/{THEME['Accent']}] (Save PDF), [{THEME['Accent']}]/html[/{THEME['Accent']}] (Save HTML)\n")
+    console.print(f"\n{S.TEXT}Interactive Mode. Type 'exit' to quit.{S.TEXT_END}")
+    console.print(f"{S.TEXT}Commands: {S.TEXT_END}{S.ACCENT}/export{S.ACCENT_END} (Save PDF), {S.ACCENT}/html{S.ACCENT_END} (Save HTML)\n")
     
     global _last_report
     history = []
+    speculative = make_speculative_prompt()
     
     while True:
         try:
-            user_input = Prompt.ask(f"[{THEME['Accent']}]?[/{THEME['Accent']}] Enter Financial Query").strip()
+            if speculative:
+                session, speculator = speculative
+                user_input = loop.run_until_complete(session.prompt_async()).strip()
+                # A matching in-flight plan finishes here and the real run hits the cache
+                loop.run_until_complete(speculator.settle(user_input))
+            else:
+                user_input = Prompt.ask(S.REPL_PROMPT).strip()
             
             if user_input.lower() in ("exit", "quit", "/bye"):
                 console.print("[bold]Goodbye![/bold]")
@@ -384,6 +553,7 @@ def interactive_command():
                 parts = user_input.split()
                 out_file = parts[1] if len(parts) > 1 else "report.pdf"
                 try:
+                    from ..export.pdf import export_report_to_pdf
                     pdf_path = export_report_to_pdf(_last_report, out_file, validate=True)
                     console.print(f"[bold green]✅ PDF exported:[/bold green] {pdf_path}")
                 except Exception as e:
@@ -398,6 +568,7 @@ def interactive_command():
                 parts = user_input.split()
                 out_file = parts[1] if len(parts) > 1 else "report.html"
                 try:
+                    from ..export.pdf import export_report_html
                     html_path = export_report_html(_last_report, out_file)
                     console.print(f"[bold green]✅ HTML exported:[/bold green] {html_path}")
                 except Exception as e:
@@ -405,9 +576,9 @@ def interactive_command():
                 continue
 
             # Execute Research
-            console.print(f"\n[{THEME['Accent']}]Researching:[/{THEME['Accent']}] {user_input}\n")
+            console.print(f"\n{S.ACCENT}Researching:{S.ACCENT_END} {user_input}\n")
             
-            state = asyncio.run(execute_research(user_input, console))
+            state = loop.run_until_complete(execute_research(user_input, console))
             
             # Update cache
             if state.report:
@@ -418,10 +589,19 @@ def interactive_command():
             
             console.print("\n")
             
-        except KeyboardInterrupt:
+        except (KeyboardInterrupt, EOFError):
             console.print("\n[bold]Goodbye![/bold]")
             break
 
+    if speculative:
+        speculative[1].cancel()
+        loop.run_until_complete(asyncio.sleep(0))  # Let cancelled speculations unwind
+    if get_runtime.cache_info().currsize:
+        runtime = get_runtime()
+        loop.run_until_complete(runtime.http_client.aclose())
+        loop.run_until_complete(runtime.llm.aclose())
+    loop.close()
+
 
 # =====================================================================
 # COMMAND 5: export  —  Export research report to PDF
@@ -439,12 +619,10 @@ def export_command(format: str = "pdf", out: str = "report.pdf"):
         format (str): Export format: pdf or html (default: pdf)
         out (str): Output file path (default: report.pdf)
     """
-    global _last_report
-    
     if _last_report is None:
-        console.print(f"[bold {THEME['Error']}]Error:[/bold {THEME['Error']}] No report to export.")
+        console.print(f"{S.ERR}Error:{S.ERR_END} No report to export.")
         console.print("[dim]Run a research query first:[/dim]")
-        console.print(f"  [{THEME['Accent']}]python -m jasper ask 'What is Apple revenue?'[/{THEME['Accent']}]")
+        console.print(f"  {S.ACCENT}python -m jasper ask 'What is Apple revenue?'{S.ACCENT_END}")
         raise typer.Exit(code=1)
     
     format = format.lower().strip()
@@ -452,6 +630,7 @@ def export_command(format: str = "pdf", out: str = "report.pdf"):
     # Export based on format
     try:
         if format == "pdf":
+            from ..export.pdf import export_report_to_pdf
             pdf_path = export_report_to_pdf(_last_report, out, validate=True)
             console.print(f"[bold green]✅ PDF exported:[/bold green] {pdf_path}")
             console.print(f"   Size: {Path(pdf_path).stat().st_size:,} bytes")
@@ -459,21 +638,22 @@ def export_command(format: str = "pdf", out: str = "report.pdf"):
             console.print(f"   Valid: {_last_report.is_valid}")
             
         elif format == "html":
+            from ..export.pdf import export_report_html
             html_path = export_report_html(_last_report, out)
             console.print(f"[bold green]✅ HTML exported:[/bold green] {html_path}")
             console.print("[dim]Open in browser to preview layout[/dim]")
             
         else:
-            console.print(f"[bold {THEME['Error']}]Error:[/bold {THEME['Error']}] Unsupported format '{format}'")
+            console.print(f"{S.ERR}Error:{S.ERR_END} Unsupported format '{format}'")
             console.print("[dim]Supported formats: 'pdf', 'html'[/dim]")
             raise typer.Exit(code=1)
     
     except ValueError as e:
-        console.print(f"[bold {THEME['Error']}]Export Failed:[/bold {THEME['Error']}]")
+        console.print(f"{S.ERR}Export Failed:{S.ERR_END}")
         console.print(f"[yellow]{str(e)}[/yellow]")
         raise typer.Exit(code=1)
     except Exception as e:
-        console.print(f"[bold {THEME['Error']}]Error:[/bold {THEME['Error']}] {str(e)}")
+        console.print(f"{S.ERR}Error:{S.ERR_END} {str(e)}")
         raise typer.Exit(code=1)
 
 
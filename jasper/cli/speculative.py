@@ -0,0 +1,90 @@
+import asyncio
+from typing import Any, Awaitable, Callable, Optional
+
+
+def _consume_result(task: "asyncio.Task[Any]") -> None:
+    if not task.cancelled():
+        task.exception()
+
+
+# --- Speculative Planner ---
+# Starts planning the query while the user is still typing. Each pause in typing
+# (debounced) replaces the in-flight speculation with one for the current text.
+# Planning is deterministic and cached, so when the submitted query matches the last
+# speculation the real run is served from the LLM cache instead of a fresh call.
+class SpeculativePlanner:
+    def __init__(
+        self,
+        plan: Callable[[str], Awaitable[Any]],
+        debounce: float = 0.3,
+        min_chars: int = 12,
+    ):
+        """
+        Args:
+            plan: Coroutine function that plans (and caches) a query
+            debounce: Seconds of typing inactivity before speculating
+            min_chars: Shorter inputs are too ambiguous to be worth a call
+        """
+        self.plan = plan
+        self.debounce = debounce
+        self.min_chars = min_chars
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._task: Optional["asyncio.Task[Any]"] = None
+        self._text: Optional[str] = None
+        self.stats = {"started": 0, "used": 0, "discarded": 0}
+
+    def on_text_changed(self, text: str) -> None:
+        """Restart the debounce timer; called from the prompt on every edit."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        text = text.strip()
+        if len(text) < self.min_chars or text.startswith("/") or text == self._text:
+            return
+        self._timer = asyncio.get_running_loop().call_later(self.debounce, self._start, text)
+
+    def _start(self, text: str) -> None:
+        self._timer = None
+        self._discard()
+        self.stats["started"] += 1
+        self._text = text
+        self._task = asyncio.ensure_future(self.plan(text))
+        # Half-typed queries often fail to plan; a discarded failure must not print over the prompt
+        self._task.add_done_callback(_consume_result)
+
+    def _discard(self) -> None:
+        if self._task is not None:
+            if not self._task.done():
+                self._task.cancel()
+                self.stats["discarded"] += 1
+            self._task = None
+        self._text = None
+
+    async def settle(self, query: str) -> bool:
+        """
+        Finish speculation for the submitted `query`.
+
+        Waits for a matching in-flight speculation so its response lands in the cache,
+        and cancels a stale one. Returns True if the speculation matched.
+        """
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        task, text = self._task, self._text
+        if task is None or text != query.strip():
+            self._discard()
+            return False
+
+        self._task, self._text = None, None
+        try:
+            await task
+        except Exception:
+            return False  # The real run retries and reports the error
+        self.stats["used"] += 1
+        return True
+
+    def cancel(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        self._discard()
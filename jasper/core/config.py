@@ -1,10 +1,21 @@
 from dotenv import load_dotenv
+from functools import cache
 import os
 
-load_dotenv()
+# Env lookups below are memoized: keys are read once per process, so preflight,
+# get_llm and provider construction share one lookup and the demo-key warning
+# fires once. Call `.cache_clear()` on a getter after changing the environment.
 
+@cache
+def _load_env() -> None:
+    load_dotenv()
+
+_load_env()
+
+@cache
 def get_llm_api_key() -> str:
     """Get LLM API key from environment."""
+    _load_env()
     key = os.getenv("OPENROUTER_API_KEY")
     if not key:
         raise ValueError(
@@ -13,8 +24,10 @@ def get_llm_api_key() -> str:
         )
     return key
 
+@cache
 def get_financial_api_key() -> str:
     """Get financial data provider API key from environment."""
+    _load_env()
     key = os.getenv("ALPHA_VANTAGE_API_KEY", "demo")
     if key == "demo":
         import warnings
@@ -25,6 +38,28 @@ def get_financial_api_key() -> str:
         )
     return key
 
+def get_max_concurrency() -> int:
+    """Maximum number of research tasks executed at once (JASPER_MAX_CONCURRENCY, default 8)."""
+    try:
+        return max(1, int(os.getenv("JASPER_MAX_CONCURRENCY", "8")))
+    except ValueError:
+        return 8
+
+def get_llm_cache_ttl() -> float:
+    """Seconds a persisted LLM response stays valid (JASPER_LLM_CACHE_TTL, default 7 days; 0 disables the disk cache)."""
+    try:
+        return max(0.0, float(os.getenv("JASPER_LLM_CACHE_TTL", str(7 * 24 * 3600))))
+    except ValueError:
+        return 7 * 24 * 3600.0
+
+def get_sem_cache_threshold() -> float:
+    """Cosine similarity needed to reuse a cached report (JASPER_SEM_CACHE_THRESHOLD, default 0.92)."""
+    try:
+        return float(os.getenv("JASPER_SEM_CACHE_THRESHOLD", "0.92"))
+    except ValueError:
+        return 0.92
+
+@cache
 def get_config():
     return {
         "LLM_API_KEY": get_llm_api_key(),
@@ -1,19 +1,25 @@
+import asyncio
+import functools
+import json
+from typing import Collection, Dict, List, Optional, Tuple
 from ..agent.planner import Planner
 from ..agent.executor import Executor
 from ..agent.validator import validator
 from ..agent.synthesizer import Synthesizer
-from .state import Jasperstate, FinalReport, TaskExecutionDetail, EvidenceItem, InferenceLink
+from .config import get_max_concurrency
+from .state import Jasperstate, Task, FinalReport, TaskExecutionDetail, EvidenceItem, InferenceLink
 from ..observability.logger import SessionLogger
 
 
 # --- Jasper Controller ---
 # Orchestrates the flow between Planner, Executor, Validator, and Synthesizer
 class JasperController:
-    def __init__(self, planner: Planner, executor: Executor, validator: validator, synthesizer: Synthesizer, logger: SessionLogger | None = None):
+    def __init__(self, planner: Planner, executor: Executor, validator: validator, synthesizer: Synthesizer, logger: SessionLogger | None = None, max_concurrency: int | None = None):
         self.planner = planner
         self.executor = executor
         self.validator = validator
         self.synthesizer = synthesizer
+        self.max_concurrency = max_concurrency or get_max_concurrency()
         # Use provided logger to keep session_id consistent across components
         self.logger = logger or SessionLogger()
 
@@ -22,17 +28,40 @@ class JasperController:
         state = Jasperstate(query=query)
         state.status = "Planning"
         try:
+            # Caps concurrent tool calls across early dispatch and every layer
+            limit = asyncio.Semaphore(self.max_concurrency)
+
+            # Tasks without dependencies start while the planner is still streaming the rest
+            started: Dict[str, "asyncio.Future[None]"] = {}
+            streamed: List[Task] = []
+            # First task per (tool, args); identical later tasks reuse its result
+            primaries: Dict[str, Tuple[Task, "asyncio.Future[None]"]] = {}
+
+            def dispatch(task: Task) -> None:
+                streamed.append(task)
+                if not task.depends_on:
+                    started[task.id] = asyncio.ensure_future(self._run_one(state, task, len(streamed) - 1, limit, primaries))
+
             # Planning phase
-            state.plan, state.report_mode = await self.planner.plan(query)
-            self.logger.log("PLAN_CREATED", {"plan": [t.dict() for t in state.plan], "mode": state.report_mode.value})
+            try:
+                combined = await self.planner.plan_combined(query, on_task=dispatch)
+            except BaseException:
+                await self._discard_early(state, started, primaries, keep=())
+                raise
+            # Anything dispatched early that the final plan did not keep must not leak into results
+            await self._discard_early(state, started, primaries, keep={task.id for task in combined.tasks})
+            state.plan, state.report_mode = combined.tasks, combined.report_mode
+            state.resolved_entities = combined.resolved_entities
+            self.logger.log("PLAN_CREATED", {"plan": [t.model_dump(mode="json") for t in state.plan], "mode": state.report_mode.value})
             state.status = "Executing"
 
-            # Execution phase
-            for idx, task in enumerate(state.plan):
-                state.current_task_index = idx
-                self.logger.log("TASK_STARTED", {"task_id": task.id, "description": task.description})
-                await self.executor.execute_task(state, task)
-                self.logger.log("TASK_COMPLETED", {"task_id": task.id, "status": task.status})
+            # Execution phase: independent tasks in the same layer run concurrently
+            positions = {task.id: idx for idx, task in enumerate(state.plan)}
+            for layer in self._topo_layers(state.plan):
+                await asyncio.gather(*(
+                    started.pop(task.id) if task.id in started else self._run_one(state, task, positions[task.id], limit, primaries)
+                    for task in layer
+                ))
 
             # Validation phase
             state.status = "Validating"
@@ -89,6 +118,110 @@ class JasperController:
             state.error = str(e)
             return state
 
+    async def _discard_early(
+        self,
+        state: Jasperstate,
+        started: Dict[str, "asyncio.Future[None]"],
+        primaries: Dict[str, Tuple[Task, "asyncio.Future[None]"]],
+        keep: Collection[str],
+    ) -> None:
+        """Cancel early-dispatched tasks not in `keep`, wait for them, and drop their outputs."""
+        orphans = {task_id: started.pop(task_id) for task_id in list(started) if task_id not in keep}
+        if not orphans:
+            return
+        for future in orphans.values():
+            future.cancel()
+        await asyncio.gather(*orphans.values(), return_exceptions=True)
+
+        for task_id in orphans:
+            state.task_results.pop(task_id, None)
+        state.financials.drop_tasks(orphans)
+        # Later identical tasks must fetch for themselves rather than alias a discarded one
+        for key in [key for key, (task, _) in primaries.items() if task.id in orphans]:
+            del primaries[key]
+        self.logger.log("EARLY_TASKS_DISCARDED", {"task_ids": list(orphans)})
+
+    async def _run_one(
+        self,
+        state: Jasperstate,
+        task: Task,
+        index: int,
+        limit: asyncio.Semaphore,
+        primaries: Optional[Dict[str, Tuple[Task, "asyncio.Future[None]"]]] = None,
+    ) -> None:
+        # Register before the first await so concurrent duplicates always find the primary
+        key = self._dedupe_key(task) if primaries is not None else None
+        if key is not None and key in primaries:
+            await self._reuse(state, task, *primaries[key])
+            return
+        done = asyncio.get_running_loop().create_future()
+        if key is not None:
+            primaries[key] = (task, done)
+
+        try:
+            async with limit:
+                state.current_task_index = index
+                self.logger.log("TASK_STARTED", {"task_id": task.id, "description": task.description})
+                await self.executor.execute_task(state, task)
+                self.logger.log("TASK_COMPLETED", {"task_id": task.id, "status": task.status})
+        finally:
+            done.set_result(None)
+
+    async def _reuse(self, state: Jasperstate, task: Task, primary: Task, done: "asyncio.Future[None]") -> None:
+        """Complete `task` with the outcome of the identical `primary` instead of fetching again."""
+        task.alias_of = primary.id
+        self.logger.log("TASK_STARTED", {"task_id": task.id, "description": task.description})
+        await asyncio.shield(done)
+        if primary.id in state.task_results:
+            state.task_results[task.id] = state.task_results[primary.id]
+        task.status, task.error = primary.status, primary.error
+        self.logger.log("TASK_DEDUPED", {"task_id": task.id, "alias_of": primary.id})
+        self.logger.log("TASK_COMPLETED", {"task_id": task.id, "status": task.status})
+
+    @staticmethod
+    def _dedupe_key(task: Task) -> Optional[str]:
+        """(tool, args) identity; tasks without explicit args resolve tickers from their description, so never match."""
+        if not task.tool_name or not task.tool_args:
+            return None
+        args = {k: v.upper() if k == "ticker" and isinstance(v, str) else v for k, v in task.tool_args.items()}
+        return json.dumps([task.tool_name, args], sort_keys=True, default=str)
+
+    @staticmethod
+    def _topo_layers(plan: List[Task]) -> List[List[Task]]:
+        """
+        Group tasks into dependency layers (Kahn's algorithm), preserving plan order.
+
+        Every task in a layer only depends on tasks from earlier layers. Unknown
+        dependency IDs are ignored; tasks caught in a cycle run last, one per layer.
+        """
+        ids = {task.id for task in plan}
+        pending = {task.id: {d for d in task.depends_on if d in ids and d != task.id} for task in plan}
+        layers: List[List[Task]] = []
+        remaining = list(plan)
+        while remaining:
+            layer = [task for task in remaining if not pending[task.id]]
+            if not layer:
+                # Cycle: fall back to sequential execution for the rest
+                layers.extend([task] for task in remaining)
+                break
+            layers.append(layer)
+            done = {task.id for task in layer}
+            remaining = [task for task in remaining if task.id not in done]
+            for task in remaining:
+                pending[task.id] -= done
+        return layers
+
+    @staticmethod
+    @functools.cache
+    def _source_label(tool_name: str) -> str:
+        """Display name for a tool ("income_statement" -> "Income Statement")."""
+        return tool_name.replace("_", " ").title()
+
+    @staticmethod
+    def _truncate(value, limit: int = 100) -> str:
+        text = str(value)
+        return text[:limit] + "..." if len(text) > limit else text
+
     def _build_final_report(self, state: Jasperstate) -> FinalReport:
         """
         Construct a FinalReport object from Jasperstate.
@@ -96,7 +229,8 @@ class JasperController:
         This is the single source of truth for PDF exports.
         """
         # Extract tickers and sources from plan
-        tickers = []
+        # Ordered dict keys give O(1) dedupe while preserving plan order
+        tickers = {}
         sources = set()
         audit_trail = []
         
@@ -104,8 +238,7 @@ class JasperController:
             # Audit trail construction
             result_summary = "Pending"
             if task.id in state.task_results:
-                res = state.task_results[task.id]
-                result_summary = str(res)[:100] + "..." if len(str(res)) > 100 else str(res)
+                result_summary = self._truncate(state.task_results[task.id])
             
             audit_trail.append(TaskExecutionDetail(
                 task_id=task.id,
@@ -118,19 +251,13 @@ class JasperController:
             if task.tool_args:
                 ticker = task.tool_args.get("ticker") or task.tool_args.get("symbol")
                 if ticker:
-                    tickers.append(ticker.upper())
+                    tickers[ticker.upper()] = None
             if task.tool_name:
-                sources.add(task.tool_name.replace("_", " ").title())
+                sources.add(self._source_label(task.tool_name))
         
-        # Deduplicate tickers while preserving order
-        unique_tickers = []
-        for t in tickers:
-            if t not in unique_tickers:
-                unique_tickers.append(t)
+        unique_tickers = list(tickers)
         
         # Fallbacks
-        if not unique_tickers:
-            unique_tickers = []
         if not sources:
             sources = {"SEC EDGAR", "Financial Data Providers"}
         
@@ -146,7 +273,7 @@ class JasperController:
                         evidence_log.append(EvidenceItem(
                             id=f"E{len(evidence_log)+1}",
                             metric=f"{task.description} [Ref {i+1}]",
-                            value=str(item)[:100] + "..." if len(str(item)) > 100 else str(item),
+                            value=self._truncate(item),
                             period="HISTORICAL",
                             source=task.tool_name or "Financial Provider",
                             status="VERIFIED"
@@ -155,7 +282,7 @@ class JasperController:
                     evidence_log.append(EvidenceItem(
                         id=f"E{len(evidence_log)+1}",
                         metric=task.description,
-                        value=str(result)[:100] + "..." if len(str(result)) > 100 else str(result),
+                        value=self._truncate(result),
                         period="CURRENT",
                         source=task.tool_name or "Financial Provider",
                         status="VERIFIED"
@@ -1,26 +1,32 @@
 import os
-from langchain_openai import ChatOpenAI
-from pydantic import SecretStr
+from functools import lru_cache
 from .config import get_llm_api_key
+from .openrouter import OpenRouterChat
 
-def get_llm(temperature: float = 0) -> ChatOpenAI:
+def get_llm(temperature: float = 0) -> OpenRouterChat:
     """
-    Get a LangChain-compatible LLM configured with OpenRouter.
+    Get an async chat client configured for OpenRouter.
     OpenRouter provides access to multiple models through an OpenAI-compatible API.
     
+    Clients are shared per (temperature, model), so repeated calls reuse one
+    connection pool instead of re-handshaking every REPL turn.
+    
     Args:
         temperature: Controls randomness (0 = deterministic, 1 = more random)
     
     Returns:
-        Configured ChatOpenAI instance pointing to OpenRouter
+        Configured OpenRouterChat instance
     """
-    api_key = get_llm_api_key()  # Raises ValueError if not set
     model = os.getenv("OPENROUTER_MODEL", "xiaomi/mimo-v2-flash:free")
+    return _build_llm(temperature, model)
+
+@lru_cache(maxsize=4)
+def _build_llm(temperature: float, model: str) -> OpenRouterChat:
+    api_key = get_llm_api_key()  # Raises ValueError if not set
     
-    return ChatOpenAI(
+    return OpenRouterChat(
         model=model,
         temperature=temperature,
-        api_key=SecretStr(api_key),
-        base_url="https://openrouter.ai/api/v1",
-        default_headers={"HTTP-Referer": "https://jasper.local"},
-    )
\ No newline at end of file
+        api_key=api_key,
+        headers={"HTTP-Referer": "https://jasper.local"},
+    )
@@ -0,0 +1,313 @@
+import hashlib
+import json
+import os
+import time
+from collections import OrderedDict
+from typing import Any, AsyncIterator, Callable, Collection, Dict, List, Optional, Protocol, Sequence, Tuple
+from langchain_core.messages import SystemMessage
+
+
+# --- Cache Backends ---
+# Storage layer for cached LLM responses, keyed by a content hash
+class CacheBackend(Protocol):
+    async def get(self, key: str) -> Optional[str]:
+        ...
+
+    async def set(self, key: str, value: str, ttl: Optional[float] = None) -> None:
+        ...
+
+
+class InMemoryBackend:
+    """Process-local LRU backend with optional per-entry expiry."""
+
+    def __init__(self, maxsize: int = 512):
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[str, Tuple[str, Optional[float]]]" = OrderedDict()
+
+    async def get(self, key: str) -> Optional[str]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        value, expires_at = entry
+        if expires_at is not None and expires_at < time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    async def set(self, key: str, value: str, ttl: Optional[float] = None) -> None:
+        expires_at = time.monotonic() + ttl if ttl else None
+        self._entries[key] = (value, expires_at)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+
+class RedisBackend:
+    """Redis backend for sharing cached responses across processes (requires `redis`)."""
+
+    def __init__(self, url: str = "redis://localhost:6379/0", prefix: str = "jasper:llm:"):
+        try:
+            import redis.asyncio as redis
+        except ImportError as e:
+            raise ImportError("RedisBackend requires the 'redis' package (pip install redis)") from e
+        self._client = redis.from_url(url, decode_responses=True)
+        self.prefix = prefix
+
+    async def get(self, key: str) -> Optional[str]:
+        return await self._client.get(self.prefix + key)
+
+    async def set(self, key: str, value: str, ttl: Optional[float] = None) -> None:
+        await self._client.set(self.prefix + key, value, ex=int(ttl) if ttl else None)
+
+
+class SQLiteBackend:
+    """
+    Local file backend so deterministic responses survive process restarts.
+
+    Expiry uses wall-clock time because rows outlive the process that wrote them.
+    """
+
+    def __init__(self, path: str, default_ttl: Optional[float] = None):
+        import sqlite3
+
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self.default_ttl = default_ttl
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS responses (key TEXT PRIMARY KEY, value TEXT NOT NULL, expires_at REAL)"
+        )
+        self._conn.commit()
+
+    async def get(self, key: str) -> Optional[str]:
+        row = self._conn.execute("SELECT value, expires_at FROM responses WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            return None
+        value, expires_at = row
+        if expires_at is not None and expires_at < time.time():
+            self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+            self._conn.commit()
+            return None
+        return value
+
+    async def set(self, key: str, value: str, ttl: Optional[float] = None) -> None:
+        ttl = ttl or self.default_ttl
+        expires_at = time.time() + ttl if ttl else None
+        self._conn.execute(
+            "INSERT OR REPLACE INTO responses (key, value, expires_at) VALUES (?, ?, ?)",
+            (key, value, expires_at),
+        )
+        self._conn.commit()
+
+    def close(self) -> None:
+        self._conn.close()
+
+
+def cacheable_system_message(text: str) -> SystemMessage:
+    """
+    Wrap static instructions in a system message marked for provider-side prompt caching.
+
+    OpenRouter forwards `cache_control` to providers that support explicit caching
+    (Anthropic, Gemini); others cache identical prefixes automatically or ignore it.
+    """
+    return SystemMessage(content=[{"type": "text", "text": text, "cache_control": {"type": "ephemeral"}}])
+
+
+# --- Semantic Index ---
+# Cosine-similarity lookup over embeddings of past queries. Unit vectors are stored
+# as int8 codes (component * 127), a quarter of the float32 footprint; the query
+# stays float32 so only the stored side carries quantization error (~0.4% per component).
+_INT8_SCALE = 127.0
+
+
+class SemanticIndex:
+    def __init__(self, embedder: Callable[[str], Sequence[float]], threshold: float = 0.92):
+        self.embedder = embedder
+        self.threshold = threshold
+        self._codes: Any = None  # numpy int8 matrix; rows past len(self._values) are spare capacity
+        self._values: List[str] = []
+
+    def _embed(self, text: str):
+        import numpy as np
+
+        vec = np.asarray(self.embedder(text), dtype=np.float32)
+        norm = np.linalg.norm(vec)
+        return vec / norm if norm else vec
+
+    def lookup(self, text: str) -> Optional[str]:
+        if not self._values:
+            return None
+        scores = self._codes[:len(self._values)] @ self._embed(text)
+        best = int(scores.argmax())
+        if scores[best] >= self.threshold * _INT8_SCALE:
+            return self._values[best]
+        return None
+
+    def ranked(self, text: str) -> List[int]:
+        """Positions of every stored row at or above the threshold, best match first."""
+        import numpy as np
+
+        if not self._values:
+            return []
+        scores = self._codes[:len(self._values)] @ self._embed(text)
+        above = np.flatnonzero(scores >= self.threshold * _INT8_SCALE)
+        # Stable sort so equal scores keep insertion order
+        return above[np.argsort(-scores[above], kind="stable")].tolist()
+
+    def value(self, position: int) -> str:
+        return self._values[position]
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def remove(self, positions: Collection[int]) -> None:
+        """Drop the rows at `positions`; later rows shift down, keeping their order."""
+        drop = set(positions)
+        if not drop:
+            return
+        keep = [i for i in range(len(self._values)) if i not in drop]
+        self._codes[:len(keep)] = self._codes[keep]
+        self._values = [self._values[i] for i in keep]
+
+    def add(self, text: str, value: str) -> None:
+        import numpy as np
+
+        vec = self._embed(text)
+        size = len(self._values)
+        if self._codes is None:
+            self._codes = np.empty((16, vec.shape[0]), dtype=np.int8)
+        elif size == len(self._codes):
+            # Grow geometrically so adds stay amortized O(1)
+            self._codes = np.concatenate([self._codes, np.empty_like(self._codes)])
+        self._codes[size] = np.rint(vec * _INT8_SCALE)
+        self._values.append(value)
+
+
+def load_default_embedder() -> Optional[Callable[[str], Sequence[float]]]:
+    """Return a small local embedder (fastembed BGE-small) if installed, else None."""
+    try:
+        from fastembed import TextEmbedding
+    except ImportError:
+        return None
+    model = TextEmbedding("BAAI/bge-small-en-v1.5")
+    return lambda text: next(iter(model.embed([text])))
+
+
+# --- LLM Cache ---
+# Two-tier cache for deterministic (temperature=0) LLM calls:
+# exact prompt hash first, then optional embedding similarity on the raw query.
+class LLMCache:
+    def __init__(
+        self,
+        backend: Optional[CacheBackend] = None,
+        ttl: Optional[float] = None,
+        embedder: Optional[Callable[[str], Sequence[float]]] = None,
+        similarity_threshold: float = 0.92,
+    ):
+        self.backend = backend or InMemoryBackend()
+        self.ttl = ttl
+        self.embedder = embedder
+        self.similarity_threshold = similarity_threshold
+        self._semantic: Dict[str, SemanticIndex] = {}
+        self.stats = {"hits": 0, "semantic_hits": 0, "misses": 0}
+
+    @staticmethod
+    def make_key(llm: Any, messages: List[Any]) -> str:
+        """Hash model, temperature and the fully formatted prompt."""
+        model = getattr(llm, "model_name", None) or getattr(llm, "model", None)
+        prompt = [[getattr(m, "type", ""), getattr(m, "content", m)] for m in messages]
+        payload = json.dumps(
+            {"model": str(model), "prompt": prompt, "temp": getattr(llm, "temperature", 0)},
+            sort_keys=True,
+            default=str,
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    async def get(self, key: str) -> Optional[str]:
+        return await self.backend.get(key)
+
+    async def set(self, key: str, value: str) -> None:
+        await self.backend.set(key, value, self.ttl)
+
+    def _index(self, namespace: str) -> Optional[SemanticIndex]:
+        if self.embedder is None:
+            return None
+        if namespace not in self._semantic:
+            self._semantic[namespace] = SemanticIndex(self.embedder, self.similarity_threshold)
+        return self._semantic[namespace]
+
+    async def _lookup(self, key: str, index: Optional[SemanticIndex], query: Optional[str]) -> Optional[str]:
+        """Exact hit first, then the semantic tier; updates hit stats."""
+        cached = await self.get(key)
+        if cached is not None:
+            self.stats["hits"] += 1
+            return cached
+        if index is not None:
+            similar = index.lookup(query)
+            if similar is not None:
+                self.stats["semantic_hits"] += 1
+                return similar
+        return None
+
+    async def generate(
+        self,
+        llm: Any,
+        messages: List[Any],
+        query: Optional[str] = None,
+        namespace: str = "default",
+    ) -> str:
+        """
+        Return the text of `llm.agenerate([messages])`, serving repeats from cache.
+
+        The semantic tier is only consulted when an embedder is configured and the
+        raw `query` is supplied; `namespace` keeps indexes of different prompts apart.
+        """
+        key = self.make_key(llm, messages)
+        index = self._index(namespace) if query else None
+        cached = await self._lookup(key, index, query)
+        if cached is not None:
+            return cached
+
+        self.stats["misses"] += 1
+        generate_result = await llm.agenerate([messages])
+        text = generate_result.generations[0][0].text
+        await self.set(key, text)
+        if index is not None:
+            index.add(query, text)
+        return text
+
+    async def stream(
+        self,
+        llm: Any,
+        messages: List[Any],
+        query: Optional[str] = None,
+        namespace: str = "default",
+    ) -> AsyncIterator[str]:
+        """
+        Like `generate`, but yields the response text as it is produced.
+
+        Cache hits are yielded as a single chunk. Models without `astream`
+        fall back to `generate`; the full text is cached once streaming ends.
+        """
+        if not hasattr(llm, "astream"):
+            yield await self.generate(llm, messages, query=query, namespace=namespace)
+            return
+
+        key = self.make_key(llm, messages)
+        index = self._index(namespace) if query else None
+        cached = await self._lookup(key, index, query)
+        if cached is not None:
+            yield cached
+            return
+
+        self.stats["misses"] += 1
+        parts: List[str] = []
+        async for chunk in llm.astream(messages):
+            content = chunk.content if isinstance(chunk.content, str) else ""
+            if content:
+                parts.append(content)
+                yield content
+        text = "".join(parts)
+        await self.set(key, text)
+        if index is not None:
+            index.add(query, text)
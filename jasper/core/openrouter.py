@@ -0,0 +1,111 @@
+import json
+from typing import Any, AsyncIterator, Dict, List, Optional, Sequence
+
+import httpx
+from langchain_core.messages import AIMessage, AIMessageChunk, BaseMessage
+from langchain_core.outputs import ChatGeneration, LLMResult
+
+
+OPENROUTER_BASE_URL = "https://openrouter.ai/api/v1"
+
+# LangChain message types -> OpenAI chat roles
+_ROLES = {"system": "system", "human": "user", "ai": "assistant", "tool": "tool"}
+
+
+class OpenRouterError(RuntimeError):
+    """Non-success response from OpenRouter; the message keeps the HTTP status for error triage."""
+
+
+# --- OpenRouter Chat ---
+# Minimal async chat-completions client. Exposes the subset of the ChatOpenAI surface
+# Jasper uses (agenerate / ainvoke / astream, model_name, temperature) without loading
+# the OpenAI SDK and langchain-openai at startup.
+class OpenRouterChat:
+    def __init__(
+        self,
+        model: str,
+        api_key: str,
+        temperature: float = 0,
+        base_url: str = OPENROUTER_BASE_URL,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: float = 120.0,
+    ):
+        self.model_name = model
+        self.temperature = temperature
+        self.base_url = base_url
+        self.timeout = timeout
+        self._headers = {"Authorization": f"Bearer {api_key}", **(headers or {})}
+        self._client: Optional[httpx.AsyncClient] = None
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        # Created lazily so it binds to the event loop that first uses it
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                base_url=self.base_url,
+                headers=self._headers,
+                timeout=httpx.Timeout(self.timeout, connect=10.0),
+            )
+        return self._client
+
+    async def aclose(self) -> None:
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    def _payload(self, messages: Sequence[BaseMessage], stream: bool) -> Dict[str, Any]:
+        return {
+            "model": self.model_name,
+            "temperature": self.temperature,
+            "stream": stream,
+            "messages": [
+                {"role": _ROLES.get(m.type, "user"), "content": m.content} for m in messages
+            ],
+        }
+
+    @staticmethod
+    def _raise_for_error(status: int, body: str) -> None:
+        if status != 200:
+            raise OpenRouterError(f"Error code: {status} - {body}")
+
+    async def ainvoke(self, messages: Sequence[BaseMessage]) -> AIMessage:
+        try:
+            r = await self.client.post("/chat/completions", json=self._payload(messages, stream=False))
+        except httpx.TimeoutException as e:
+            raise TimeoutError(f"OpenRouter request timeout: {e}") from e
+        self._raise_for_error(r.status_code, r.text)
+
+        data = r.json()
+        if "error" in data:
+            raise OpenRouterError(f"Provider returned error: {data['error']}")
+        return AIMessage(content=data["choices"][0]["message"].get("content") or "")
+
+    async def agenerate(self, batches: List[Sequence[BaseMessage]]) -> LLMResult:
+        generations = []
+        for messages in batches:
+            message = await self.ainvoke(messages)
+            generations.append([ChatGeneration(message=message)])
+        return LLMResult(generations=generations)
+
+    async def astream(self, messages: Sequence[BaseMessage]) -> AsyncIterator[AIMessageChunk]:
+        """Yield content deltas from the server-sent event stream."""
+        try:
+            async with self.client.stream("POST", "/chat/completions", json=self._payload(messages, stream=True)) as r:
+                if r.status_code != 200:
+                    self._raise_for_error(r.status_code, (await r.aread()).decode("utf-8", "replace"))
+                async for line in r.aiter_lines():
+                    # Skip keep-alive comments (": OPENROUTER PROCESSING") and blank separators
+                    if not line.startswith("data:"):
+                        continue
+                    data = line[5:].strip()
+                    if data == "[DONE]":
+                        break
+                    chunk = json.loads(data)
+                    if "error" in chunk:
+                        raise OpenRouterError(f"Provider returned error: {chunk['error']}")
+                    choices = chunk.get("choices") or []
+                    content = choices[0].get("delta", {}).get("content") if choices else None
+                    if content:
+                        yield AIMessageChunk(content=content)
+        except httpx.TimeoutException as e:
+            raise TimeoutError(f"OpenRouter request timeout: {e}") from e
@@ -0,0 +1,151 @@
+import json
+import re
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Callable, Collection, Dict, List, Optional, Sequence
+
+from .llm_cache import SemanticIndex
+from .state import FinalReport
+
+
+# All-caps words that look like tickers ("MSFT", "RELIANCE.NS"); a cached report must cover each
+_TICKER_WORD = re.compile(r"\b[A-Z]{2,5}(?:\.[A-Z]{1,3})?\b")
+# "Apple Inc." is usually asked about as "Apple"
+_CORPORATE_SUFFIX = re.compile(r"[\s,]+(?:inc|corp|corporation|co|company|ltd|limited|plc|group|holdings)\.?$", re.IGNORECASE)
+
+
+def _mentions(query: str, word: str) -> bool:
+    return re.search(rf"(?<!\w){re.escape(word)}(?!\w)", query, re.IGNORECASE) is not None
+
+
+# --- Report Cache ---
+# Returns a previous FinalReport when a new query is a paraphrase of an earlier one
+# about the same companies, skipping plan → execute → synthesize entirely. Reports
+# older than `max_age` are treated as misses (and evicted) because they carry live
+# market data. Each row keeps the entity -> ticker map its report was built for, since
+# embeddings alone rate "Apple revenue trend" and "Microsoft revenue trend" as close.
+class ReportCache:
+    def __init__(
+        self,
+        embedder: Callable[[str], Sequence[float]],
+        threshold: float = 0.92,
+        path: Optional[Path] = None,
+        max_age: timedelta = timedelta(days=1),
+        maxsize: int = 256,
+    ):
+        # Index values are the JSON rows themselves, so the file can be rewritten from it
+        self.index = SemanticIndex(embedder, threshold)
+        self.path = path
+        self.max_age = max_age
+        self.maxsize = maxsize
+        self.stats = {"hits": 0, "misses": 0}
+        if path is not None:
+            self._load()
+
+    def _fresh(self, report: FinalReport) -> bool:
+        timestamp = report.timestamp
+        if timestamp.tzinfo is None:
+            # FinalReport stamps naive UTC
+            timestamp = timestamp.replace(tzinfo=timezone.utc)
+        return datetime.now(timezone.utc) - timestamp <= self.max_age
+
+    @staticmethod
+    def _covers(entities: Dict[str, str], query: str) -> bool:
+        """True if `query` names every company of a cached report, and no other ticker."""
+        if not entities:
+            return False
+        for name, ticker in entities.items():
+            names = {name, _CORPORATE_SUFFIX.sub("", name), ticker}
+            if not any(word.strip() and _mentions(query, word) for word in names):
+                return False
+        tickers = {ticker.upper() for ticker in entities.values()}
+        return all(word in tickers for word in _TICKER_WORD.findall(query))
+
+    @staticmethod
+    def _same_companies(a: Optional[Dict[str, str]], b: Dict[str, str]) -> bool:
+        return {t.upper() for t in (a or {}).values()} == {t.upper() for t in b.values()}
+
+    def _row(self, position: int) -> dict:
+        return json.loads(self.index.value(position))
+
+    def _load(self) -> None:
+        if not self.path.exists():
+            return
+        entries: List[dict] = []
+        with self.path.open("r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                    report = FinalReport.model_validate_json(entry["report"])
+                except (ValueError, KeyError):
+                    continue  # Skip corrupt or outdated rows
+                # Rows without entities predate the company check and can never hit
+                if entry.get("entities") and self._fresh(report):
+                    entries.append(entry)
+
+        for entry in entries[-self.maxsize:]:
+            self.index.add(entry["query"], json.dumps(entry))
+        # Compact the file so expired rows do not accumulate
+        self._rewrite()
+
+    def _rewrite(self) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self.path.open("w", encoding="utf-8") as f:
+            f.writelines(self.index.value(i) + "\n" for i in range(len(self.index)))
+
+    def _remove(self, positions: Collection[int]) -> None:
+        self.index.remove(positions)
+        if self.path is not None:
+            self._rewrite()
+
+    def lookup(self, query: str) -> Optional[FinalReport]:
+        """Best fresh report for a paraphrase of `query` about the same companies, if any."""
+        report, stale = None, []
+        for position in self.index.ranked(query):
+            row = self._row(position)
+            candidate = FinalReport.model_validate_json(row["report"])
+            if not self._fresh(candidate):
+                stale.append(position)
+            elif self._covers(row.get("entities") or {}, query):
+                report = candidate
+                break
+        if stale:
+            self._remove(stale)
+
+        if report is None:
+            self.stats["misses"] += 1
+            return None
+        self.stats["hits"] += 1
+        return report
+
+    def store(self, query: str, report: FinalReport, entities: Optional[Dict[str, str]] = None) -> None:
+        """
+        Cache `report` for `query`.
+
+        Args:
+            entities: Entity name -> ticker the report was built for; defaults to its tickers.
+                Reports about no identifiable company are not cached
+        """
+        entities = entities or {ticker: ticker for ticker in report.tickers}
+        if not entities:
+            return
+
+        # Replace earlier reports for an equivalent query about the same companies, then
+        # drop the oldest rows beyond maxsize
+        drop = [p for p in self.index.ranked(query) if self._same_companies(self._row(p).get("entities"), entities)]
+        overflow = len(self.index) - len(drop) + 1 - self.maxsize
+        if overflow > 0:
+            dropped = set(drop)
+            drop.extend([p for p in range(len(self.index)) if p not in dropped][:overflow])
+        self.index.remove(drop)
+
+        line = json.dumps({"query": query, "report": report.model_dump_json(), "entities": entities})
+        self.index.add(query, line)
+        if self.path is None:
+            return
+        if drop:
+            self._rewrite()
+        else:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with self.path.open("a", encoding="utf-8") as f:
+                f.write(line + "\n")
@@ -1,7 +1,8 @@
-from pydantic import BaseModel, Field
-from typing import Optional, Dict, Any, List, Literal
+from pydantic import BaseModel, ConfigDict, Field
+from typing import Optional, Dict, Any, List, Literal, Collection
 from datetime import datetime
 from enum import Enum
+import secrets
 from .. import __version__
 
 # --- Report Modes ---
@@ -13,17 +14,56 @@ class ReportMode(str, Enum):
 
 # Schema definitions for Jasper's internal state management
 class Task(BaseModel):
-    id: str = Field(..., description="Unique identifier for the task")
+    # Executor/controller update status, error and depends_on in place; keep those writes unvalidated
+    model_config = ConfigDict(validate_assignment=False)
+
+    id: str = Field(default_factory=lambda: secrets.token_hex(16), description="Unique identifier for the task")
     description: str = Field(..., description="Description of the task")
     tool_name: Optional[str] = Field(default=None, description="Name of the tool to be used for the task")
     tool_args: Optional[Dict[str, Any]] = Field(default=None, description="Arguments for the tool")
     status: Literal["pending", "in_progress", "completed", "failed"] = Field(default="pending", description="Current status of the task")
     error: Optional[str] = Field(default=None, description="Error message if the task failed")
+    depends_on: List[str] = Field(default_factory=list, description="IDs of tasks that must complete before this one runs")
+    alias_of: Optional[str] = Field(default=None, description="ID of an identical task whose result this one reuses")
+
+# --- Financial Columns ---
+# Column-oriented copy of fetched income statements (one row per report) so checks
+# scan flat lists instead of walking nested provider dicts.
+class FinancialColumns(BaseModel):
+    ticker: List[str] = Field(default_factory=list, description="Ticker for each report row")
+    fiscal_date: List[str] = Field(default_factory=list, description="fiscalDateEnding for each report row")
+    total_revenue: List[float] = Field(default_factory=list, description="totalRevenue for each row; NaN when missing or unparseable")
+    task_id: List[str] = Field(default_factory=list, description="ID of the task that fetched each row")
+
+    def append_reports(self, ticker: str, result: Any, task_id: str = "") -> None:
+        """Add every report dict in a task result (a report list or a single report)."""
+        reports = result if isinstance(result, list) else [result]
+        for report in reports:
+            if not isinstance(report, dict):
+                continue
+            try:
+                revenue = float(report.get("totalRevenue"))
+            except (ValueError, TypeError):
+                revenue = float("nan")
+            self.task_id.append(task_id)
+            self.ticker.append(ticker)
+            self.fiscal_date.append(str(report.get("fiscalDateEnding", "")))
+            self.total_revenue.append(revenue)
+
+    def drop_tasks(self, task_ids: Collection[str]) -> None:
+        """Remove every row fetched by one of `task_ids`."""
+        keep = [i for i, task_id in enumerate(self.task_id) if task_id not in task_ids]
+        if len(keep) == len(self.task_id):
+            return
+        for column in (self.task_id, self.ticker, self.fiscal_date, self.total_revenue):
+            column[:] = [column[i] for i in keep]
 
 # --- Confidence Breakdown ---
 # Provides a detailed view of the confidence score components
 
 class ConfidenceBreakdown(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     data_coverage: float      # % of required data fetched
     data_quality: float       # provider reliability
     inference_strength: float # logic depth
@@ -31,6 +71,8 @@ class ConfidenceBreakdown(BaseModel):
 
 # --- Forensic Models ---
 class EvidenceItem(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     id: str = Field(..., description="Evidence ID (e.g., E1.1)")
     metric: str = Field(..., description="Financial metric or data point")
     value: Any = Field(..., description="The value of the metric")
@@ -39,12 +81,16 @@ class EvidenceItem(BaseModel):
     status: str = Field(default="VERIFIED", description="Verification status")
 
 class InferenceLink(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     claim: str = Field(..., description="The analytical claim being made")
     evidence_ids: List[str] = Field(..., description="List of evidence IDs supporting this claim")
     logic_path: str = Field(..., description="Brief description of the logic used")
     confidence: float = Field(default=1.0, description="Confidence in this specific inference")
 
 class TaskExecutionDetail(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     task_id: str
     description: str
     tool: str
@@ -52,6 +98,8 @@ class TaskExecutionDetail(BaseModel):
     result_summary: str
 
 class validationresult(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     is_valid: bool = Field(..., description="Indicates if the state is valid")
     issues: List[str] = Field(default_factory=list, description="List of issues found during validation")
     confidence: float = Field(default=0.0, description="Confidence score of the validation result")
@@ -94,13 +142,18 @@ class FinalReport(BaseModel):
 
 
 class Jasperstate(BaseModel):
+    # Mutated throughout a run (status, plan, results); fields are validated once at construction
+    model_config = ConfigDict(validate_assignment=False)
+
     query: str = Field(..., description="The original user query")
     report_mode: ReportMode = Field(default=ReportMode.GENERAL, description="The inferred analytical mode of the report")
 
     plan: List[Task] = Field(default_factory=list, description="List of tasks in the plan")
+    resolved_entities: Dict[str, str] = Field(default_factory=dict, description="Entity name -> ticker, resolved during planning")
     current_task_index: int = Field(default=0, description="Index of the current task being executed")
 
     task_results: Dict[str, Dict] = Field(default_factory=dict, description="Results of executed tasks, keyed by task ID")
+    financials: FinancialColumns = Field(default_factory=FinancialColumns, description="Columnar view of fetched reports, filled as tasks complete")
 
     validation: Optional[validationresult] = Field(default=None, description="Validation result of the current state")
 
@@ -3,7 +3,8 @@ PDF Export Module for Jasper Finance
 
 Renders audit-ready PDF reports using Jinja2 + WeasyPrint.
 Ensures deterministic, offline-capable output without network access.
-Supports modern CSS features (Grid, Flexbox) for professional layouts.
+Layout sticks to block and fixed-width table CSS (no Flexbox/Grid), which keeps
+WeasyPrint's layout passes linear on long reports and renders in xhtml2pdf too.
 
 Architecture:
   - FinalReport (state.py) is the single source of truth
@@ -12,59 +13,129 @@ Architecture:
   - WeasyPrint compiles HTML+CSS → PDF deterministically
 """
 
+import functools
 import hashlib
 import logging
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO
 from pathlib import Path
+from typing import List, Optional, Sequence
 
-from jinja2 import Environment, FileSystemLoader, select_autoescape
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader, select_autoescape
+from jinja2.environment import TemplateStream
+from jinja2.filters import do_truncate
 from markdown_it import MarkdownIt
 
 from ..core.state import FinalReport
 
 logger = logging.getLogger(__name__)
 
+# WeasyPrint and the streamed HTML export write many small chunks; a large buffer batches them
+_PDF_WRITE_BUFFER = 1 << 20
 
-def render_markdown(text: str) -> str:
-    """Convert Markdown to semantic HTML."""
-    md = MarkdownIt("commonmark", {
+# Per-thread render buffer for xhtml2pdf, reused across exports (batch export renders on
+# worker threads). Buffers that grew past the cap are dropped rather than pinned forever.
+_PDF_RENDER_BUFFERS = threading.local()
+_PDF_RENDER_BUFFER_MAX = 16 << 20
+
+
+def _render_buffer() -> BytesIO:
+    buf = getattr(_PDF_RENDER_BUFFERS, "buf", None)
+    if buf is None:
+        buf = _PDF_RENDER_BUFFERS.buf = BytesIO()
+    # Rewind without truncating so the allocation is reused; callers use tell() as the length
+    buf.seek(0)
+    return buf
+
+
+def _release_render_buffer(buf: BytesIO) -> None:
+    if buf.getbuffer().nbytes > _PDF_RENDER_BUFFER_MAX:
+        _PDF_RENDER_BUFFERS.buf = None
+
+
+@functools.lru_cache(maxsize=1)
+def _markdown_parser() -> MarkdownIt:
+    return MarkdownIt("commonmark", {
         "html": True,
         "typographer": True,
     })
-    return md.render(text)
+
+
+@functools.lru_cache(maxsize=128)
+def render_markdown(text: str) -> str:
+    """Convert Markdown to semantic HTML (memoized; re-exports of a report skip the parse)."""
+    return _markdown_parser().render(text)
+
+
+@functools.lru_cache(maxsize=4096)
+def short_hash(text: str) -> str:
+    """16-hex-char BLAKE2b digest (8 bytes, no truncation); memoized since templates repeat inputs."""
+    return hashlib.blake2b(text.encode(), digest_size=8).hexdigest()
+
+
+# Resolved once; the export path only hands out these Path objects
+_PACKAGE_DIR = Path(__file__).resolve().parent.parent
+_TEMPLATE_DIR = _PACKAGE_DIR / "templates"
+_STYLES_DIR = _PACKAGE_DIR / "styles"
 
 
 def get_report_template_dir() -> Path:
     """Get the templates directory path."""
-    # Relative to this module (jasper/export/pdf.py)
-    module_dir = Path(__file__).parent.parent
-    templates_dir = module_dir / "templates"
-    return templates_dir
+    return _TEMPLATE_DIR
 
 
 def get_styles_dir() -> Path:
     """Get the styles directory path."""
-    # Relative to this module
-    module_dir = Path(__file__).parent.parent
-    styles_dir = module_dir / "styles"
-    return styles_dir
+    return _STYLES_DIR
+
+
+# (mtime, content, minified content) of the last stylesheet read
+_CSS_CACHE = None
 
+# Strings are matched first in both patterns so their contents are never rewritten
+_CSS_STRING = r'"(?:\\.|[^"\\])*"|\'(?:\\.|[^\'\\])*\''
+_CSS_COMMENT_OR_SPACE = re.compile(rf'({_CSS_STRING})|/\*.*?\*/|\s+', re.S)
+# A ';' right before '}' is redundant and dropped with the surrounding space
+_CSS_PUNCT_SPACE = re.compile(rf'({_CSS_STRING})|\s*(?:;\s*)?(}})\s*|\s*([{{;])\s*')
 
-def load_css_content() -> str:
+
+def minify_css(css: str) -> str:
+    """Drop comments and redundant whitespace; rules and selectors are unchanged."""
+    css = _CSS_COMMENT_OR_SPACE.sub(lambda m: m.group(1) or " ", css)
+    css = _CSS_PUNCT_SPACE.sub(lambda m: m.group(1) or m.group(2) or m.group(3), css)
+    return css.strip()
+
+
+def load_css_content(minified: bool = False) -> str:
     """
     Load CSS content from report_v1.css.
     
+    The content is kept in memory and only re-read when the file's mtime
+    changes, so repeated exports skip the disk read while edits still apply.
+    
+    Args:
+        minified: Return the comment- and whitespace-free variant (for PDF engines)
+    
     Returns:
         CSS content as string, safe to embed in HTML
     
     Raises:
         FileNotFoundError: If CSS file not found
     """
+    global _CSS_CACHE
     css_path = get_styles_dir() / "report_v1.css"
-    if not css_path.exists():
-        raise FileNotFoundError(f"CSS stylesheet not found: {css_path}")
-    
-    with open(css_path, "r", encoding="utf-8") as f:
-        return f.read()
+    try:
+        mtime = css_path.stat().st_mtime
+    except FileNotFoundError:
+        raise FileNotFoundError(f"CSS stylesheet not found: {css_path}") from None
+    
+    if _CSS_CACHE is None or _CSS_CACHE[0] != mtime:
+        with open(css_path, "r", encoding="utf-8") as f:
+            css = f.read()
+        _CSS_CACHE = (mtime, css, minify_css(css))
+    return _CSS_CACHE[2] if minified else _CSS_CACHE[1]
 
 
 def setup_jinja_environment() -> Environment:
@@ -84,21 +155,51 @@ def setup_jinja_environment() -> Environment:
         autoescape=select_autoescape(enabled_extensions=('html', 'jinja')),
         trim_blocks=True,
         lstrip_blocks=True,
+        # Compiled template code persists in the temp dir, so cold starts skip codegen
+        bytecode_cache=FileSystemBytecodeCache(),
     )
     
     # Register custom filters for deterministic rendering
-    env.filters['hash'] = lambda x: hashlib.sha256(x.encode()).hexdigest()[:16]
+    env.filters['hash'] = short_hash
     env.filters['markdown'] = render_markdown
     
     return env
 
 
-def render_report_html(report: FinalReport) -> str:
+@functools.lru_cache(maxsize=1)
+def _get_template():
+    """Report template, compiled once per process."""
+    return setup_jinja_environment().get_template("report.html.jinja")
+
+
+def build_report_view(report: FinalReport) -> dict:
+    """
+    Pre-format every derived display field of a report in one pass.
+    
+    The template then only substitutes strings (autoescaping still applies)
+    instead of dispatching truncate/round/upper/hash/markdown filters per use.
+    """
+    return {
+        "title": do_truncate(_get_template().environment, report.query, 40),
+        "query_hash": short_hash(report.query),
+        "timestamp": report.timestamp.strftime('%Y-%m-%d %H:%M:%S UTC'),
+        "entities": ", ".join(report.tickers) or "N/A",
+        "mode": report.report_mode.value.upper(),
+        "confidence": str(round(report.confidence_score, 2)),
+        "constraints": [(category.upper(), constraint) for category, constraint in report.logic_constraints.items()],
+        "inference_confidence": [f"{round(inf.confidence * 100, 0)}%" for inf in report.inference_map],
+        "synthesis_html": render_markdown(report.synthesis_text),
+    }
+
+
+def render_report_html(report: FinalReport, for_pdf: bool = False) -> str:
     """
     Render FinalReport to semantic HTML using Jinja2.
     
     Args:
         report: FinalReport object containing all report data
+        for_pdf: Embed minified CSS; the PDF engines parse every byte of it,
+            while HTML exports keep the readable stylesheet
     
     Returns:
         HTML string (UTF-8 encoded)
@@ -107,25 +208,74 @@ def render_report_html(report: FinalReport) -> str:
         FileNotFoundError: If template or CSS not found
         Exception: If rendering fails
     """
-    env = setup_jinja_environment()
-    
-    # Load CSS content once
-    css_content = load_css_content()
-    
-    # Get template
-    template = env.get_template("report.html.jinja")
-    
-    # Pre-render the synthesis text to HTML
-    synthesis_html = render_markdown(report.synthesis_text)
-    
-    # Render with context
-    html = template.render(
+    # The PDF engines need the whole document as one string anyway
+    return "".join(_report_stream(report, for_pdf))
+
+
+def _report_stream(report: FinalReport, for_pdf: bool = False) -> TemplateStream:
+    """Lazily render the report template, yielding HTML fragments in document order."""
+    # Template and CSS are loaded once and reused across exports
+    template = _get_template()
+    css_content = load_css_content(minified=for_pdf)
+    
+    # Display fields (including rendered markdown) are formatted once up front
+    return template.stream(
         report=report,
+        view=build_report_view(report),
         css_content=css_content,
-        synthesis_html=synthesis_html,
     )
+
+
+@functools.lru_cache(maxsize=1)
+def _weasyprint_html():
+    """
+    Return WeasyPrint's HTML class, or None if it cannot load (e.g. GTK+ missing).
+    
+    Probed once per process on first export, so the module stays cheap to import
+    and each render skips the import attempt and stream redirection.
+    """
+    import contextlib
+    import os
+    import sys
+    
+    # WINDOWS DLL COLLISION FIX: 
+    # Tesseract-OCR often bundles an incompatible libgobject-2.0-0.dll.
+    # We temporarily remove it from PATH to let WeasyPrint find the correct one or fail cleanly.
+    original_path = os.environ.get("PATH", "")
+    if sys.platform == "win32":
+        paths = original_path.split(os.pathsep)
+        # Remove Tesseract paths which are known to cause collisions
+        scrubbed_paths = [p for p in paths if "Tesseract-OCR" not in p]
+        os.environ["PATH"] = os.pathsep.join(scrubbed_paths)
     
-    return html
+    try:
+        # Suppress the library-loading chatter WeasyPrint prints when GTK+ is missing
+        with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull), contextlib.redirect_stderr(devnull):
+            from weasyprint import HTML
+    except (ImportError, OSError) as e:
+        logger.warning(
+            "⚠️  RENDERER FALLBACK: WeasyPrint unavailable. Using xhtml2pdf (basic formatting).\n"
+            "    For full PDF features: use build.ps1 (pre-built executable) or Docker."
+        )
+        logger.debug(f"    Error: {e}")
+        return None
+    finally:
+        # Always restore PATH
+        if sys.platform == "win32":
+            os.environ["PATH"] = original_path
+    
+    logging.getLogger("weasyprint").setLevel(logging.CRITICAL)
+    return HTML
+
+
+def _offline_url_fetcher(url: str, timeout: int = 10, ssl_context=None) -> dict:
+    """WeasyPrint URL fetcher that resolves inline data: URIs and refuses everything else."""
+    if url[:5].lower() == "data:":
+        # Decoded in-process; inline images and fonts in the template rely on it
+        from weasyprint import default_url_fetcher
+        return default_url_fetcher(url, timeout=timeout, ssl_context=ssl_context)
+    # Network and file URLs are never fetched; WeasyPrint logs and skips a failed resource
+    raise ValueError(f"External resources are disabled for PDF export: {url}")
 
 
 def compile_html_to_pdf(html_content: str, output_path: str) -> str:
@@ -149,51 +299,30 @@ def compile_html_to_pdf(html_content: str, output_path: str) -> str:
     pdf_path = Path(output_path)
     pdf_path.parent.mkdir(parents=True, exist_ok=True)
     
-    # --- Try WeasyPrint (Preferred) ---
-    try:
-        import contextlib
-        import sys
-        import logging
-        import os
-        
-        # WINDOWS DLL COLLISION FIX: 
-        # Tesseract-OCR often bundles an incompatible libgobject-2.0-0.dll.
-        # We temporarily remove it from PATH to let WeasyPrint find the correct one or fail cleanly.
-        original_path = os.environ.get("PATH", "")
-        if sys.platform == "win32":
-            paths = original_path.split(os.pathsep)
-            # Remove Tesseract paths which are known to cause collisions
-            scrubbed_paths = [p for p in paths if "Tesseract-OCR" not in p]
-            os.environ["PATH"] = os.pathsep.join(scrubbed_paths)
-
+    # --- WeasyPrint (Preferred) ---
+    weasy_html = _weasyprint_html()
+    # Set once this call has opened the output file, so only our own partial output is removed
+    touched = False
+    if weasy_html is not None:
+        touched = True
         try:
-            # Suppress WeasyPrint loggers and standard error streams (GTK+ missing on Windows)
-            logging.getLogger("weasyprint").setLevel(logging.CRITICAL)
-            with contextlib.redirect_stdout(open(os.devnull, "w")), contextlib.redirect_stderr(open(os.devnull, "w")):
-                from weasyprint import HTML
-                HTML(string=html_content).write_pdf(target=str(pdf_path))
+            with open(pdf_path, "wb", buffering=_PDF_WRITE_BUFFER) as f:
+                # No base_url, so relative references are never resolved against the filesystem
+                weasy_html(string=html_content, base_url=None, url_fetcher=_offline_url_fetcher).write_pdf(target=f)
             logger.info(f"PDF successfully rendered using WeasyPrint: {pdf_path}")
             return str(pdf_path.resolve())
-        finally:
-            # Always restore PATH
-            if sys.platform == "win32":
-                os.environ["PATH"] = original_path
-
-    except (ImportError, Exception) as e:
-        # Gracefully handle missing GTK+ or WeasyPrint
-        logger.warning(
-            "⚠️  RENDERER FALLBACK: WeasyPrint unavailable. Using xhtml2pdf (basic formatting).\n"
-            "    For full PDF features: use build.ps1 (pre-built executable) or Docker."
-        )
-        logger.debug(f"    Error: {e}")
-        pass
+        except OSError as e:
+            # Missing fonts or native libraries surface at render time; other errors are real bugs
+            logger.warning(f"WeasyPrint rendering failed ({e}); falling back to xhtml2pdf.")
+        except Exception as e:
+            pdf_path.unlink(missing_ok=True)  # Don't leave a truncated PDF behind
+            raise RuntimeError(f"PDF compilation failed (WeasyPrint): {str(e)}") from e
 
     # --- Fallback to xhtml2pdf (Compatible) ---
     try:
         from xhtml2pdf import pisa
-        from io import BytesIO
         
-        result_file = BytesIO()
+        result_file = _render_buffer()
         # Providing a base_url prevents 'NoneType' + 'str' errors when resolving paths
         pisa_status = pisa.CreatePDF(
             html_content,
@@ -202,25 +331,25 @@ def compile_html_to_pdf(html_content: str, output_path: str) -> str:
             base_url=str(Path.cwd())
         )
         
-        if getattr(pisa_status, 'err', 0) != 0:
-            # Try once more without explicit encoding if it failed
-            result_file = BytesIO()
-            pisa_status = pisa.CreatePDF(
-                html_content, 
-                dest=result_file,
-                base_url=str(Path.cwd())
-            )
-            
+        # html_content is already a str, so retrying without the encoding would fail the same way
         if getattr(pisa_status, 'err', 0) != 0:
             raise RuntimeError(f"xhtml2pdf fallback failed with status {getattr(pisa_status, 'err', 'unknown')}")
             
-        with open(pdf_path, "wb") as f:
-            result_file.seek(0)
-            f.write(result_file.getvalue())
+        # Rendered into memory first so a failed render never leaves a partial file. The
+        # buffer may hold a longer earlier render, so only the bytes up to tell() are written,
+        # through a view so they are not copied
+        touched = True
+        try:
+            with result_file.getbuffer() as view:
+                pdf_path.write_bytes(view[:result_file.tell()])
+        finally:
+            _release_render_buffer(result_file)
             
         return str(pdf_path.resolve())
         
     except Exception as e:
+        if touched:
+            pdf_path.unlink(missing_ok=True)  # Don't leave WeasyPrint's truncated PDF behind
         raise RuntimeError(f"PDF compilation failed (all engines): {str(e)}") from e
 
 
@@ -266,7 +395,7 @@ def export_report_to_pdf(
             )
     
     # Render HTML from report
-    html = render_report_html(report)
+    html = render_report_html(report, for_pdf=True)
     
     # Compile to PDF
     pdf_path = compile_html_to_pdf(html, output_path)
@@ -290,12 +419,56 @@ def export_report_html(
     Returns:
         Absolute path to generated HTML file
     """
-    html = render_report_html(report)
-    
     html_path = Path(output_path)
     html_path.parent.mkdir(parents=True, exist_ok=True)
     
-    with open(html_path, "w", encoding="utf-8") as f:
-        f.write(html)
+    # Stream fragments straight to disk instead of joining the whole document in memory;
+    # the large buffer turns the many small fragment writes into a few system calls
+    try:
+        with open(html_path, "w", encoding="utf-8", buffering=_PDF_WRITE_BUFFER) as f:
+            _report_stream(report).dump(f)
+    except BaseException:
+        html_path.unlink(missing_ok=True)  # Don't leave a truncated HTML file behind
+        raise
     
     return str(html_path.resolve())
+
+
+def export_reports_batch(
+    reports: Sequence[FinalReport],
+    output_paths: Sequence[str],
+    validate: bool = True,
+    max_workers: Optional[int] = None,
+) -> List[str]:
+    """
+    Export several FinalReports to PDF, overlapping their renders.
+    
+    The compiled template and markdown parser are shared and thread-safe, and
+    WeasyPrint releases the GIL inside its native layout/drawing calls, so reports
+    are exported on a thread pool. The xhtml2pdf fallback (ReportLab keeps
+    module-level state) runs them one after another.
+    
+    Args:
+        reports: FinalReport objects to export
+        output_paths: PDF path for each report, in the same order
+        validate: If True, verify each report is valid before export
+        max_workers: Thread pool size (defaults to ThreadPoolExecutor's)
+    
+    Returns:
+        Absolute paths of the generated PDFs, in input order
+    
+    Raises:
+        ValueError: If the number of reports and paths differ, or a report fails validation
+    """
+    if len(reports) != len(output_paths):
+        raise ValueError(f"Got {len(reports)} reports but {len(output_paths)} output paths")
+    
+    def export(args) -> str:
+        report, path = args
+        return export_report_to_pdf(report, path, validate=validate)
+    
+    jobs = list(zip(reports, output_paths))
+    if _weasyprint_html() is None or len(jobs) < 2:
+        return [export(job) for job in jobs]
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="jasper-export") as pool:
+        return list(pool.map(export, jobs))
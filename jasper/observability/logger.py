@@ -1,6 +1,86 @@
-﻿import json
+﻿import atexit
+import queue
+import sys
+import threading
+import time
 import uuid
-from datetime import datetime
+from datetime import datetime, timedelta
+from typing import List, Optional, Union
+
+import orjson
+
+
+_EPOCH = datetime(1970, 1, 1)
+
+
+def _default(obj):
+    # Payloads occasionally carry raw exceptions or provider objects; log their text
+    return str(obj)
+
+
+# --- Log Writer ---
+# Writes serialized records on a daemon thread so logging never blocks the event loop
+# on stdout. Lines are coalesced (up to `batch_size` or `linger` seconds) into one write.
+# Shared by every SessionLogger so lines from different components stay in order.
+class _LogWriter:
+    def __init__(self, batch_size: int = 64, linger: float = 0.02):
+        self.batch_size = batch_size
+        self.linger = linger
+        self._queue: "queue.SimpleQueue[Union[bytes, threading.Event]]" = queue.SimpleQueue()
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    def put(self, line: bytes) -> None:
+        if self._thread is None:
+            self._start()
+        self._queue.put(line)
+
+    def _start(self) -> None:
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._drain, name="jasper-log-writer", daemon=True)
+                self._thread.start()
+                atexit.register(self.flush)
+
+    def flush(self, timeout: float = 1.0) -> None:
+        """Block until every record queued so far has been written."""
+        if self._thread is None:
+            return
+        done = threading.Event()
+        self._queue.put(done)
+        done.wait(timeout)
+
+    def _drain(self) -> None:
+        while True:
+            batch = [self._queue.get()]
+            deadline = time.monotonic() + self.linger
+            # A flush marker ends the batch early so flush() returns promptly
+            while len(batch) < self.batch_size and isinstance(batch[-1], bytes):
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(self._queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
+            self._write(batch)
+
+    @staticmethod
+    def _write(batch: List[Union[bytes, threading.Event]]) -> None:
+        lines = b"".join(item for item in batch if isinstance(item, bytes))
+        try:
+            if lines:
+                # Resolve stdout per write so redirection (e.g. in tests) is honoured
+                sys.stdout.write(lines.decode())
+                sys.stdout.flush()
+        except (OSError, ValueError):
+            pass  # stdout closed during shutdown; never let the writer thread die
+        for item in batch:
+            if isinstance(item, threading.Event):
+                item.set()
+
+
+_writer = _LogWriter()
 
 
 # --- Session Logger ---
@@ -10,10 +90,24 @@ class SessionLogger:
         self.session_id = str(uuid.uuid4())
 
     def log(self, event_type: str, payload: dict):
-        record = {
-            "session_id": self.session_id,
-            "timestamp": datetime.utcnow().isoformat(),
-            "event": event_type,
-            "payload": payload,
-        }
-        print(json.dumps(record))
+        # Serialized here so callers can keep mutating what they logged (e.g. plan task
+        # dicts); only the write happens on the writer thread
+        _writer.put(orjson.dumps(
+            {
+                "session_id": self.session_id,
+                # Naive UTC, which orjson renders exactly like datetime.isoformat()
+                "timestamp": _EPOCH + timedelta(seconds=time.time()),
+                "event": event_type,
+                "payload": payload,
+            },
+            default=_default,
+            option=orjson.OPT_NON_STR_KEYS | orjson.OPT_APPEND_NEWLINE,
+        ))
+
+    def flush(self) -> None:
+        """Wait until queued records have been written (they are also flushed at exit)."""
+        _writer.flush()
+
+    def log_stream(self, event_type: str, delta: str):
+        """Incremental output (e.g. LLM tokens) for live displays; too granular for the session log."""
+        pass
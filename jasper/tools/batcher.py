@@ -0,0 +1,77 @@
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set
+
+
+# --- Request Coalescer ---
+# Collects keys requested within a short window and resolves them with one batch call.
+# With window=0 the batch covers every request made in the same event-loop tick,
+# e.g. all tasks started by one asyncio.gather, without adding latency.
+class RequestCoalescer:
+    def __init__(
+        self,
+        batch_fetch: Callable[[List[str]], Awaitable[Dict[str, Any]]],
+        window: float = 0.0,
+        max_batch: int = 32,
+    ):
+        """
+        Args:
+            batch_fetch: Resolves a list of keys to {key: value or Exception}
+            window: Seconds to wait for more requests before flushing
+            max_batch: Flush immediately once this many keys are pending
+        """
+        self.batch_fetch = batch_fetch
+        self.window = window
+        self.max_batch = max_batch
+        self._pending: Dict[str, "asyncio.Future[Any]"] = {}
+        self._flush_handle: Optional[asyncio.Handle] = None
+        # The loop only keeps weak references to tasks; hold in-flight batches until they finish
+        self._running: Set["asyncio.Task[None]"] = set()
+        self.stats = {"requests": 0, "batches": 0}
+
+    async def fetch(self, key: str) -> Any:
+        self.stats["requests"] += 1
+        future = self._pending.get(key)
+        if future is None:
+            loop = asyncio.get_running_loop()
+            future = loop.create_future()
+            self._pending[key] = future
+            if len(self._pending) >= self.max_batch:
+                self._schedule(loop, now=True)
+            elif self._flush_handle is None:
+                self._schedule(loop)
+        # Shield so one cancelled waiter does not cancel the result shared by the others
+        return await asyncio.shield(future)
+
+    def _schedule(self, loop: asyncio.AbstractEventLoop, now: bool = False) -> None:
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+        if now or self.window <= 0:
+            self._flush_handle = loop.call_soon(self._flush)
+        else:
+            self._flush_handle = loop.call_later(self.window, self._flush)
+
+    def _flush(self) -> None:
+        self._flush_handle = None
+        batch, self._pending = self._pending, {}
+        if batch:
+            self.stats["batches"] += 1
+            task = asyncio.ensure_future(self._run(batch))
+            self._running.add(task)
+            task.add_done_callback(self._running.discard)
+
+    async def _run(self, batch: Dict[str, "asyncio.Future[Any]"]) -> None:
+        try:
+            results = await self.batch_fetch(list(batch))
+        except Exception as e:
+            results = {key: e for key in batch}
+
+        for key, future in batch.items():
+            if future.done():
+                continue
+            result = results.get(key, KeyError(f"Batch fetch returned no result for {key}"))
+            if isinstance(result, asyncio.CancelledError):
+                future.cancel()
+            elif isinstance(result, BaseException):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
@@ -0,0 +1,82 @@
+import functools
+import hashlib
+import json
+import os
+import time
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+
+# Fundamentals change at most once per filing; anything price-like goes stale fast
+DEFAULT_TTLS: Dict[str, float] = {
+    "INCOME_STATEMENT": 24 * 3600,
+    "BALANCE_SHEET": 24 * 3600,
+    "OVERVIEW": 24 * 3600,
+    "TIME_SERIES_INTRADAY": 3600,
+}
+
+
+# --- Response Cache ---
+# Disk cache for raw provider responses, so repeat runs (even across processes)
+# skip rate-limited APIs. One JSON file per (provider, endpoint, ticker, params).
+class ResponseCache:
+    def __init__(
+        self,
+        root: Path,
+        ttl_map: Optional[Dict[str, float]] = None,
+        default_ttl: float = 3600,
+    ):
+        self.root = Path(root)
+        self.ttl_map = {**DEFAULT_TTLS, **(ttl_map or {})}
+        self.default_ttl = default_ttl
+
+    @staticmethod
+    def make_key(provider: str, endpoint: str, ticker: str, params: Dict[str, Any]) -> str:
+        raw = f"{provider}|{endpoint}|{ticker.upper()}|{sorted(params.items())}"
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def _path(self, provider: str, key: str) -> Path:
+        return self.root / provider / f"{key}.json"
+
+    def get(self, provider: str, endpoint: str, ticker: str, params: Dict[str, Any]) -> Optional[Any]:
+        path = self._path(provider, self.make_key(provider, endpoint, ticker, params))
+        try:
+            with path.open("r", encoding="utf-8") as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+        ttl = self.ttl_map.get(endpoint, self.default_ttl)
+        if time.time() - entry.get("fetched_at", 0) > ttl:
+            return None
+        return entry.get("data")
+
+    def set(self, provider: str, endpoint: str, ticker: str, params: Dict[str, Any], data: Any) -> None:
+        path = self._path(provider, self.make_key(provider, endpoint, ticker, params))
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Write then rename so a concurrent reader never sees a half-written file
+        tmp = path.with_suffix(f".{os.getpid()}.tmp")
+        with tmp.open("w", encoding="utf-8") as f:
+            json.dump({"fetched_at": time.time(), "ticker": ticker.upper(), "data": data}, f)
+        os.replace(tmp, path)
+
+
+def cached(endpoint: str) -> Callable:
+    """
+    Serve a provider method `(self, ticker, **params)` from `self.response_cache` when set.
+
+    The provider must define `name`; failures propagate and are never cached.
+    """
+    def decorator(fn: Callable[..., Awaitable[Any]]) -> Callable[..., Awaitable[Any]]:
+        @functools.wraps(fn)
+        async def wrapper(self, ticker: str, **params: Any) -> Any:
+            cache: Optional[ResponseCache] = getattr(self, "response_cache", None)
+            if cache is None:
+                return await fn(self, ticker, **params)
+            hit = cache.get(self.name, endpoint, ticker, params)
+            if hit is not None:
+                return hit
+            data = await fn(self, ticker, **params)
+            cache.set(self.name, endpoint, ticker, params, data)
+            return data
+        return wrapper
+    return decorator
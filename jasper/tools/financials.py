@@ -1,6 +1,10 @@
+import asyncio
+import importlib.util
 import httpx 
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 from .exceptions import DataProviderError
+from .tool_cache import ToolResultCache
+from .batcher import RequestCoalescer
 
 class FinancialDataError(Exception):
     """Custom exception for financial data retrieval errors."""
@@ -10,16 +14,50 @@ class FinancialDataError(Exception):
 # --- Financial Data Router ---
 # Aggregates multiple data providers to ensure reliability
 class FinancialDataRouter:
-    def __init__(self, providers: List[Any]):
+    def __init__(self, providers: List[Any], cache: Optional[ToolResultCache] = None, coalesce_window: float = 0.0):
         self.providers = providers
+        self.cache = cache
+        # Tickers requested together (e.g. one execution layer) are fetched as one batch
+        self._income_batcher = RequestCoalescer(self._fetch_income_statements, window=coalesce_window)
 
     async def fetch_income_statement(self, ticker: str) -> Dict:
+        if self.cache is None:
+            return await self._income_batcher.fetch(ticker)
+        return await self.cache.get_or_fetch(
+            f"income_statement:{ticker.upper()}",
+            lambda: self._income_batcher.fetch(ticker),
+        )
+
+    async def _fetch_income_statements(self, tickers: List[str]) -> Dict[str, Any]:
+        """Fetch a batch concurrently; each ticker maps to its result or its exception."""
+        results = await asyncio.gather(
+            *(self._fetch_income_statement(ticker) for ticker in tickers),
+            return_exceptions=True,
+        )
+        return dict(zip(tickers, results))
+
+    async def _fetch_income_statement(self, ticker: str) -> Dict:
+        # Every provider starts at once, but results are taken in priority order: the
+        # answer matches the sequential fallback while a failing provider no longer
+        # delays the next one (latency is the slowest attempt needed, not their sum).
+        attempts = [asyncio.ensure_future(provider.income_statement(ticker)) for provider in self.providers]
         errors = []
-        for provider in self.providers:
-            try:
-                return await provider.income_statement(ticker)
-            except Exception as e:
-                errors.append(str(e))
+        try:
+            for provider, attempt in zip(self.providers, attempts):
+                try:
+                    result = await attempt
+                except Exception as e:
+                    errors.append(str(e))
+                    continue
+                if result:
+                    return result
+                errors.append(f"{getattr(provider, 'name', type(provider).__name__)} returned no data")
+        finally:
+            for attempt in attempts:
+                if not attempt.done():
+                    attempt.cancel()
+                # Lower-priority attempts may fail after we return; mark their errors as seen
+                attempt.add_done_callback(_consume_result)
 
         error_details = "; ".join(errors)
         raise DataProviderError(
@@ -29,17 +67,40 @@ class FinancialDataRouter:
         )
 
 
+def _consume_result(future: "asyncio.Future[Any]") -> None:
+    if not future.cancelled():
+        future.exception()
+
+
+# Process-wide pool for FinancialClient instances that are not handed a client,
+# so connections (and TLS sessions) are reused instead of one pool per instance
+_shared_client: Optional[httpx.AsyncClient] = None
+
+
+def _get_shared_client(timeout: float) -> httpx.AsyncClient:
+    """Lazily create the shared client; the first caller's timeout applies."""
+    global _shared_client
+    if _shared_client is None or _shared_client.is_closed:
+        _shared_client = httpx.AsyncClient(
+            timeout=timeout,
+            limits=httpx.Limits(max_keepalive_connections=32, max_connections=64),
+            # HTTP/2 needs the optional h2 package
+            http2=importlib.util.find_spec("h2") is not None,
+        )
+    return _shared_client
+
+
 class FinancialClient:
-    def __init__(self, timeout: float = 10.0):
-        self.client = httpx.AsyncClient(timeout=timeout)
+    def __init__(self, timeout: float = 10.0, client: Optional[httpx.AsyncClient] = None):
+        self.timeout = timeout
+        self._client = client
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        return self._client if self._client is not None else _get_shared_client(self.timeout)
 
     async def fetch_financial_statement(self, entity: str) -> Dict[str, Any]:
-        """Fetch financial statement data for a given entity."""
-        try:
-            # Placeholder URL; replace with actual financial data API endpoint
-            url = f"https://api.example.com/financials/{entity}"
-            request = httpx.Request("GET", url)
-            response = httpx.Response(404, request=request)
-            raise httpx.HTTPStatusError("Not Found", request=request, response=response)  # Placeholder for demonstration
-        except httpx.HTTPStatusError as e:
-            raise FinancialDataError(f"Failed to fetch data for {entity}: {e}") from e
\ No newline at end of file
+        """Fetch financial statement data for a given entity (placeholder, no endpoint yet)."""
+        # Fail fast without building a throwaway Request/Response pair. A real implementation
+        # would `await self.client.get(url)` and `raise_for_status()` on the shared pool.
+        raise FinancialDataError(f"Failed to fetch data for {entity}: financial statement endpoint not implemented")
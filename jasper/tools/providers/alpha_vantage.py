@@ -1,16 +1,22 @@
 import httpx
-from typing import Dict
+from typing import Dict, Optional
 from ..exceptions import DataProviderError
+from ..cache import ResponseCache, cached
 
 
 # --- Alpha Vantage Client ---
 # Handles direct communication with the Alpha Vantage API
 class AlphaVantageClient:
     BASE_URL = "https://www.alphavantage.co/query"
+    name = "alpha_vantage"
 
-    def __init__(self, api_key: str):
+    def __init__(self, api_key: str, client: Optional[httpx.AsyncClient] = None, response_cache: Optional[ResponseCache] = None):
         self.api_key = api_key
+        # Optional shared client so keep-alive connections are reused across calls
+        self.client = client
+        self.response_cache = response_cache
 
+    @cached("INCOME_STATEMENT")
     async def income_statement(self, ticker: str) -> Dict:
         params = {
             "function": "INCOME_STATEMENT",
@@ -18,8 +24,11 @@ class AlphaVantageClient:
             "apikey": self.api_key,
         }
 
-        async with httpx.AsyncClient(timeout=10) as client:
-            r = await client.get(self.BASE_URL, params=params)
+        if self.client is not None:
+            r = await self.client.get(self.BASE_URL, params=params)
+        else:
+            async with httpx.AsyncClient(timeout=10) as client:
+                r = await client.get(self.BASE_URL, params=params)
 
         if r.status_code != 200:
             raise DataProviderError("Alpha Vantage HTTP error")
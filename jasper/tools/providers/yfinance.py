@@ -1,7 +1,9 @@
+import asyncio
 import yfinance as yf
-from typing import Dict, List
+from typing import Dict, List, Optional
 from datetime import datetime
 from ..exceptions import DataProviderError
+from ..cache import ResponseCache, cached
 
 
 # --- YFinance Client ---
@@ -11,12 +13,24 @@ class YFinanceClient:
     YFinance provider for global stocks (US, India, etc.)
     Supports tickers like: AAPL, RELIANCE.NS, INFY.NS, etc.
     """
-    
-    def __init__(self):
-        pass
+    name = "yfinance"
 
+    def __init__(self, response_cache: Optional[ResponseCache] = None):
+        self.response_cache = response_cache
+
+    # yfinance does blocking HTTP (requests/curl_cffi) and pandas work, so each call runs
+    # in a worker thread; otherwise concurrent tasks would serialize on the event loop.
+    @cached("INCOME_STATEMENT")
     async def income_statement(self, ticker: str) -> List[Dict]:
         """Fetch income statement data from yfinance."""
+        return await asyncio.to_thread(self._income_statement, ticker)
+
+    @cached("BALANCE_SHEET")
+    async def balance_sheet(self, ticker: str) -> List[Dict]:
+        """Fetch balance sheet data from yfinance."""
+        return await asyncio.to_thread(self._balance_sheet, ticker)
+
+    def _income_statement(self, ticker: str) -> List[Dict]:
         try:
             stock = yf.Ticker(ticker)
             
@@ -49,8 +63,7 @@ class YFinanceClient:
                 raise
             raise DataProviderError(f"YFinance failed for {ticker}: {str(e)}")
 
-    async def balance_sheet(self, ticker: str) -> List[Dict]:
-        """Fetch balance sheet data from yfinance."""
+    def _balance_sheet(self, ticker: str) -> List[Dict]:
         try:
             stock = yf.Ticker(ticker)
             balance = stock.quarterly_balance_sheet
@@ -0,0 +1,51 @@
+import asyncio
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+
+# --- Tool Result Cache ---
+# In-memory TTL + LRU cache for tool/provider results. Concurrent requests for
+# the same key share a single in-flight fetch; failures are never cached.
+class ToolResultCache:
+    def __init__(self, ttl: float = 900.0, maxsize: int = 256):
+        self.ttl = ttl
+        self.maxsize = maxsize
+        # key -> (value, expires_at monotonic)
+        self._entries: "OrderedDict[str, Tuple[Any, float]]" = OrderedDict()
+        self._inflight: Dict[str, "asyncio.Future[Any]"] = {}
+        self.stats = {"hits": 0, "misses": 0}
+
+    def _lookup(self, key: str) -> Optional[Any]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        value, expires_at = entry
+        if expires_at < time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    async def get_or_fetch(self, key: str, fetch: Callable[[], Awaitable[Any]]) -> Any:
+        value = self._lookup(key)
+        if value is not None:
+            self.stats["hits"] += 1
+            return value
+
+        self.stats["misses"] += 1
+        inflight = self._inflight.get(key)
+        if inflight is None:
+            inflight = asyncio.ensure_future(self._fill(key, fetch))
+            self._inflight[key] = inflight
+            inflight.add_done_callback(lambda _: self._inflight.pop(key, None))
+        # Shield so one cancelled waiter does not cancel the fetch shared by the others
+        return await asyncio.shield(inflight)
+
+    async def _fill(self, key: str, fetch: Callable[[], Awaitable[Any]]) -> Any:
+        value = await fetch()
+        self._entries[key] = (value, time.monotonic() + self.ttl)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+        return value
@@ -0,0 +1,79 @@
+"""
+Tests for the request coalescer used by FinancialDataRouter.
+"""
+
+import asyncio
+
+from jasper.tools.batcher import RequestCoalescer
+from jasper.tools.financials import FinancialDataRouter
+
+
+def test_same_tick_requests_share_one_batch():
+    batches = []
+
+    async def batch_fetch(keys):
+        batches.append(sorted(keys))
+        return {key: key.lower() for key in keys}
+
+    async def run():
+        coalescer = RequestCoalescer(batch_fetch)
+        return await asyncio.gather(*(coalescer.fetch(k) for k in ["AAPL", "MSFT", "AAPL"]))
+
+    assert asyncio.run(run()) == ["aapl", "msft", "aapl"]
+    assert batches == [["AAPL", "MSFT"]]
+
+
+def test_per_key_errors_stay_per_key():
+    async def batch_fetch(keys):
+        return {"AAPL": [1], "BAD": ValueError("no data")}
+
+    async def run():
+        coalescer = RequestCoalescer(batch_fetch)
+        return await asyncio.gather(coalescer.fetch("AAPL"), coalescer.fetch("BAD"), return_exceptions=True)
+
+    ok, err = asyncio.run(run())
+    assert ok == [1]
+    assert isinstance(err, ValueError)
+
+
+def test_in_flight_batches_are_referenced_until_done():
+    in_flight = []
+
+    async def run():
+        async def batch_fetch(keys):
+            in_flight.append(len(coalescer._running))
+            await asyncio.sleep(0)
+            return {key: key for key in keys}
+
+        coalescer = RequestCoalescer(batch_fetch)
+        await coalescer.fetch("AAPL")
+        await asyncio.sleep(0)  # Let the done callback run
+        return coalescer._running
+
+    assert asyncio.run(run()) == set()
+    assert in_flight == [1]
+
+
+def test_router_falls_back_per_ticker_inside_batch():
+    class Provider:
+        def __init__(self, fail=()):
+            self.fail = set(fail)
+            self.calls = []
+
+        async def income_statement(self, ticker):
+            self.calls.append(ticker)
+            if ticker in self.fail:
+                raise RuntimeError("down")
+            return [{"fiscalDateEnding": "2024-12-31", "ticker": ticker}]
+
+    primary, backup = Provider(fail={"MSFT"}), Provider()
+    router = FinancialDataRouter([primary, backup])
+
+    async def run():
+        return await asyncio.gather(router.fetch_income_statement("AAPL"), router.fetch_income_statement("MSFT"))
+
+    aapl, msft = asyncio.run(run())
+    assert aapl[0]["ticker"] == "AAPL" and msft[0]["ticker"] == "MSFT"
+    # Providers are queried concurrently; MSFT's answer comes from the backup
+    assert primary.calls == ["AAPL", "MSFT"] and sorted(backup.calls) == ["AAPL", "MSFT"]
+    assert router._income_batcher.stats["batches"] == 1
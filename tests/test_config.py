@@ -0,0 +1,34 @@
+"""
+Tests for memoized configuration getters.
+"""
+
+import warnings
+
+import pytest
+
+from jasper.core import config
+
+
+def test_demo_key_warning_fires_once(monkeypatch):
+    monkeypatch.delenv("ALPHA_VANTAGE_API_KEY", raising=False)
+    config.get_financial_api_key.cache_clear()
+    try:
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter("always")
+            assert config.get_financial_api_key() == "demo"
+            assert config.get_financial_api_key() == "demo"
+        assert len(caught) == 1
+    finally:
+        config.get_financial_api_key.cache_clear()
+
+
+def test_missing_llm_key_is_not_cached(monkeypatch):
+    monkeypatch.delenv("OPENROUTER_API_KEY", raising=False)
+    config.get_llm_api_key.cache_clear()
+    try:
+        with pytest.raises(ValueError):
+            config.get_llm_api_key()
+        monkeypatch.setenv("OPENROUTER_API_KEY", "sk-test")
+        assert config.get_llm_api_key() == "sk-test"
+    finally:
+        config.get_llm_api_key.cache_clear()
@@ -0,0 +1,199 @@
+"""
+Tests for JasperController task scheduling.
+"""
+
+from jasper.core.controller import JasperController
+from jasper.core.state import Task
+
+
+def _task(task_id: str, depends_on=None) -> Task:
+    return Task(id=task_id, description=f"Task {task_id}", depends_on=depends_on or [])
+
+
+def test_independent_tasks_share_one_layer():
+    plan = [_task("a"), _task("b"), _task("c")]
+    layers = JasperController._topo_layers(plan)
+    assert [[t.id for t in layer] for layer in layers] == [["a", "b", "c"]]
+
+
+def test_dependencies_split_layers():
+    plan = [_task("a"), _task("b", ["a"]), _task("c"), _task("d", ["b", "c"])]
+    layers = JasperController._topo_layers(plan)
+    assert [[t.id for t in layer] for layer in layers] == [["a", "c"], ["b"], ["d"]]
+
+
+def test_cycle_falls_back_to_sequential():
+    plan = [_task("a", ["b"]), _task("b", ["a"]), _task("c", ["missing"])]
+    layers = JasperController._topo_layers(plan)
+    assert [[t.id for t in layer] for layer in layers] == [["c"], ["a"], ["b"]]
+
+
+def test_independent_tasks_start_while_plan_streams():
+    import asyncio
+    import json
+    from types import SimpleNamespace
+
+    from jasper.agent.planner import Planner
+    from jasper.agent.validator import validator
+
+    payload = {
+        "entities": [{"name": "Apple", "type": "company", "ticker": "AAPL"}],
+        "intent": {"category": "quantitative"},
+        "tasks": [
+            {"description": "a", "tool_name": "income_statement", "tool_args": {"ticker": "AAPL"}},
+            {"description": "b", "tool_name": "income_statement", "tool_args": {"ticker": "MSFT"}, "depends_on": [0]},
+        ],
+    }
+    events = []
+
+    class StreamingLLM:
+        model_name = "fake-model"
+        temperature = 0
+
+        async def astream(self, messages):
+            text = json.dumps(payload)
+            for i in range(0, len(text), 5):
+                await asyncio.sleep(0)
+                yield SimpleNamespace(content=text[i:i + 5])
+            events.append("plan streamed")
+
+    class FakeExecutor:
+        async def execute_task(self, state, task):
+            events.append(f"start {task.description}")
+            state.task_results[task.id] = [{"fiscalDateEnding": "2024-12-31", "totalRevenue": "1"}]
+            task.status = "completed"
+
+    class FakeSynthesizer:
+        async def synthesize(self, state):
+            return "ok"
+
+    controller = JasperController(Planner(StreamingLLM()), FakeExecutor(), validator(), FakeSynthesizer())
+    state = asyncio.run(controller.run("Apple revenue"))
+
+    assert state.status == "Completed"
+    assert events == ["start a", "plan streamed", "start b"]
+    assert [t.status for t in state.plan] == ["completed", "completed"]
+
+
+def test_semaphore_caps_concurrent_tasks():
+    import asyncio
+
+    from jasper.core.state import Jasperstate
+
+    running, peak = 0, 0
+
+    class SlowExecutor:
+        async def execute_task(self, state, task):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+
+    controller = JasperController(None, SlowExecutor(), None, None, max_concurrency=2)
+
+    async def run():
+        state = Jasperstate(query="q")
+        limit = asyncio.Semaphore(controller.max_concurrency)
+        await asyncio.gather(*(controller._run_one(state, _task(str(i)), i, limit) for i in range(5)))
+
+    asyncio.run(run())
+    assert peak == 2
+
+
+def test_identical_tasks_fetch_once_and_share_the_result():
+    import asyncio
+
+    from jasper.core.state import Jasperstate
+
+    fetched = []
+
+    class CountingExecutor:
+        async def execute_task(self, state, task):
+            fetched.append(task.id)
+            await asyncio.sleep(0.01)
+            state.task_results[task.id] = [{"totalRevenue": "1"}]
+            task.status = "completed"
+
+    def fetch_task(task_id, ticker):
+        return Task(id=task_id, description=task_id, tool_name="income_statement", tool_args={"ticker": ticker})
+
+    controller = JasperController(None, CountingExecutor(), None, None, max_concurrency=4)
+    tasks = [fetch_task("a", "AAPL"), fetch_task("b", "aapl"), fetch_task("c", "MSFT")]
+
+    async def run():
+        state = Jasperstate(query="q")
+        limit = asyncio.Semaphore(controller.max_concurrency)
+        primaries = {}
+        await asyncio.gather(*(controller._run_one(state, t, i, limit, primaries) for i, t in enumerate(tasks)))
+        return state
+
+    state = asyncio.run(run())
+    assert fetched == ["a", "c"]
+    assert tasks[1].alias_of == "a" and tasks[1].status == "completed"
+    assert state.task_results["b"] is state.task_results["a"]
+
+
+def _early_dispatch_controller(plan_combined, results):
+    from jasper.agent.validator import validator
+
+    class ScriptedPlanner:
+        pass
+
+    class RecordingExecutor:
+        async def execute_task(self, state, task):
+            results.append(task.id)
+            state.task_results[task.id] = [{"fiscalDateEnding": "2024-12-31", "totalRevenue": "1"}]
+            state.financials.append_reports("AAPL", state.task_results[task.id], task.id)
+            task.status = "completed"
+
+    class FakeSynthesizer:
+        async def synthesize(self, state):
+            return "ok"
+
+    planner = ScriptedPlanner()
+    planner.plan_combined = plan_combined
+    return JasperController(planner, RecordingExecutor(), validator(), FakeSynthesizer())
+
+
+def test_early_tasks_missing_from_final_plan_are_discarded():
+    import asyncio
+
+    from jasper.agent.planner import CombinedPlan
+    from jasper.core.state import ReportMode
+
+    kept = _task("kept")
+
+    async def plan_combined(query, on_task):
+        on_task(_task("orphan"))
+        on_task(kept)
+        await asyncio.sleep(0.01)  # Both early tasks finish before planning does
+        return CombinedPlan(tasks=[kept], report_mode=ReportMode.FINANCIAL_EVIDENCE)
+
+    ran = []
+    state = asyncio.run(_early_dispatch_controller(plan_combined, ran).run("q"))
+    assert state.status == "Completed"
+    assert "orphan" in ran
+    assert list(state.task_results) == ["kept"]
+    assert state.financials.task_id == ["kept"]
+    assert state.validation.breakdown.data_coverage == 1.0
+
+
+def test_early_tasks_are_cancelled_and_awaited_when_planning_fails():
+    import asyncio
+
+    early = []
+
+    async def plan_combined(query, on_task):
+        on_task(_task("early"))
+        early.extend(t for t in asyncio.all_tasks() if t is not asyncio.current_task())
+        raise ValueError("no entities")
+
+    async def run():
+        state = await _early_dispatch_controller(plan_combined, []).run("q")
+        # Checked before asyncio.run() cancels leftovers itself
+        return state, [t.cancelled() for t in early]
+
+    state, cancelled = asyncio.run(run())
+    assert state.status == "Failed" and "no entities" in state.error
+    assert cancelled and all(cancelled)
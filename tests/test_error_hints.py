@@ -0,0 +1,21 @@
+"""
+Tests for the CLI's failure guidance table.
+"""
+
+import pytest
+
+from jasper.cli.main import ERROR_HINTS
+
+
+# Sources documented on Jasperstate.error_source, plus the "llm" alias
+ERROR_SOURCES = ["llm_service", "llm_auth", "llm_timeout", "llm_unknown", "llm", "data_provider", "query"]
+
+
+@pytest.mark.parametrize("source", ERROR_SOURCES)
+def test_every_error_source_has_a_hint(source):
+    title, explanation, suggestion = ERROR_HINTS[source]
+    assert title and explanation and suggestion.startswith("[dim]Suggestion:")
+
+
+def test_unknown_sources_have_no_hint():
+    assert ERROR_HINTS.get("unknown") is None
@@ -0,0 +1,68 @@
+"""
+Tests for FinancialDataRouter provider fallback.
+"""
+
+import asyncio
+
+import pytest
+
+from jasper.tools.exceptions import DataProviderError
+from jasper.tools.financials import FinancialDataRouter
+
+
+class TimedProvider:
+    def __init__(self, name, delay, result=None, error=None, events=None):
+        self.name = name
+        self.delay = delay
+        self.result = result
+        self.error = error
+        self.events = events if events is not None else []
+        self.cancelled = False
+
+    async def income_statement(self, ticker):
+        self.events.append(f"start {self.name}")
+        try:
+            await asyncio.sleep(self.delay)
+            self.events.append(f"end {self.name}")
+        except asyncio.CancelledError:
+            self.cancelled = True
+            raise
+        if self.error:
+            raise RuntimeError(self.error)
+        return self.result
+
+
+def test_fallback_overlaps_with_failing_provider():
+    events = []
+    primary = TimedProvider("primary", 0.02, error="rate limited", events=events)
+    backup = TimedProvider("backup", 0.01, result=[{"totalRevenue": "1"}], events=events)
+    router = FinancialDataRouter(providers=[primary, backup])
+
+    result = asyncio.run(router.fetch_income_statement("AAPL"))
+
+    assert result == [{"totalRevenue": "1"}]
+    # The backup was already running (and finished) while the primary was still failing
+    assert events == ["start primary", "start backup", "end backup", "end primary"]
+
+
+def test_higher_priority_result_wins_and_others_are_cancelled():
+    primary = TimedProvider("primary", 0.05, result=[{"source": "primary"}])
+    backup = TimedProvider("backup", 1.0, result=[{"source": "backup"}])
+    router = FinancialDataRouter(providers=[primary, backup])
+
+    async def run():
+        result = await router.fetch_income_statement("AAPL")
+        await asyncio.sleep(0)
+        return result
+
+    assert asyncio.run(run()) == [{"source": "primary"}]
+    assert backup.cancelled
+
+
+def test_empty_results_fall_through_and_all_failures_raise():
+    empty = TimedProvider("empty", 0.01, result=[])
+    down = TimedProvider("down", 0.01, error="provider down")
+    router = FinancialDataRouter(providers=[empty, down])
+
+    with pytest.raises(DataProviderError, match="empty returned no data; provider down"):
+        asyncio.run(router.fetch_income_statement("AAPL"))
@@ -0,0 +1,36 @@
+"""
+Tests for the live mission board.
+"""
+
+from rich.console import Console
+
+from jasper.cli.interface import MissionBoard
+
+
+def render(board) -> str:
+    console = Console(width=80, record=True, color_system=None)
+    console.print(board)
+    return console.export_text()
+
+
+def test_board_updates_tasks_in_place():
+    board = MissionBoard("[PLANNING] Starting...")
+    board.update_task("b", description="Fetch MSFT", status="running", detail="Executing...")
+    board.set_plan([{"id": "a", "description": "Fetch AAPL"}, {"id": "b", "description": "Fetch MSFT"}])
+    node = board._nodes["a"]
+
+    board.update_task("a", status="success")
+    board.update_task("missing", status="failed")  # unknown IDs without a description are ignored
+
+    text = render(board)
+    assert board._nodes["a"] is node
+    assert "missing" not in board
+    assert text.index("✔ Fetch AAPL") < text.index("► Fetch MSFT")
+    assert "Executing..." in text and "[PLANNING] Starting..." in text
+
+
+def test_empty_status_is_hidden():
+    board = MissionBoard()
+    board.set_status("[VALIDATING] Checking")
+    board.set_status("")
+    assert "VALIDATING" not in render(board)
@@ -0,0 +1,132 @@
+"""
+Tests for the LLM response cache used by Planner and EntityExtractor.
+"""
+
+import asyncio
+from types import SimpleNamespace
+
+from langchain_core.messages import HumanMessage
+
+from jasper.core.llm_cache import LLMCache, InMemoryBackend
+
+
+class FakeLLM:
+    """Deterministic LLM stub that counts agenerate calls."""
+
+    model_name = "fake-model"
+    temperature = 0
+
+    def __init__(self, text: str = '{"entities": []}'):
+        self.text = text
+        self.calls = 0
+
+    async def agenerate(self, batches):
+        self.calls += 1
+        return SimpleNamespace(generations=[[SimpleNamespace(text=self.text)]])
+
+
+def test_exact_hit_skips_llm():
+    llm = FakeLLM()
+    cache = LLMCache()
+    messages = [HumanMessage(content="What is Apple's revenue?")]
+
+    async def run():
+        first = await cache.generate(llm, messages)
+        second = await cache.generate(llm, messages)
+        return first, second
+
+    first, second = asyncio.run(run())
+    assert first == second == llm.text
+    assert llm.calls == 1
+    assert cache.stats["hits"] == 1
+    assert cache.stats["misses"] == 1
+
+
+def test_key_depends_on_prompt():
+    llm = FakeLLM()
+    a = LLMCache.make_key(llm, [HumanMessage(content="AAPL")])
+    b = LLMCache.make_key(llm, [HumanMessage(content="MSFT")])
+    assert a != b
+
+
+def test_semantic_tier_matches_similar_query():
+    llm = FakeLLM()
+    # Toy embedder: paraphrases share a direction, unrelated text does not
+    vectors = {"apple revenue": [1.0, 0.0], "aapl revenue": [0.99, 0.05], "ford debt": [0.0, 1.0]}
+    cache = LLMCache(embedder=lambda q: vectors[q])
+
+    async def run():
+        await cache.generate(llm, [HumanMessage(content="p1")], query="apple revenue")
+        await cache.generate(llm, [HumanMessage(content="p2")], query="aapl revenue")
+        await cache.generate(llm, [HumanMessage(content="p3")], query="ford debt")
+
+    asyncio.run(run())
+    assert llm.calls == 2
+    assert cache.stats["semantic_hits"] == 1
+
+
+def test_inmemory_backend_evicts_lru():
+    backend = InMemoryBackend(maxsize=2)
+
+    async def run():
+        await backend.set("a", "1")
+        await backend.set("b", "2")
+        await backend.get("a")
+        await backend.set("c", "3")
+        return await backend.get("a"), await backend.get("b"), await backend.get("c")
+
+    assert asyncio.run(run()) == ("1", None, "3")
+
+
+def test_stream_caches_full_text():
+    class StreamingLLM(FakeLLM):
+        async def astream(self, messages):
+            self.calls += 1
+            for part in ("{\"entities\"", ": []}"):
+                yield SimpleNamespace(content=part)
+
+    llm = StreamingLLM()
+    cache = LLMCache()
+    messages = [HumanMessage(content="What is Apple's revenue?")]
+
+    async def run():
+        first = [c async for c in cache.stream(llm, messages)]
+        second = [c async for c in cache.stream(llm, messages)]
+        return first, second
+
+    first, second = asyncio.run(run())
+    assert first == ['{"entities"', ": []}"]
+    assert second == ['{"entities": []}']
+    assert llm.calls == 1
+
+
+def test_semantic_index_grows_and_stores_int8():
+    from jasper.core.llm_cache import SemanticIndex
+
+    # One-hot embeddings: every query is orthogonal to the others
+    index = SemanticIndex(lambda q: [1.0 if i == int(q) else 0.0 for i in range(40)])
+    for i in range(40):
+        index.add(str(i), f"answer {i}")
+
+    assert index._codes.dtype.name == "int8"
+    assert index.lookup("0") == "answer 0"
+    assert index.lookup("39") == "answer 39"
+
+
+def test_sqlite_backend_persists_and_expires(tmp_path):
+    from jasper.core.llm_cache import SQLiteBackend
+
+    path = str(tmp_path / "cache" / "llm.db")
+
+    async def write():
+        backend = SQLiteBackend(path)
+        await backend.set("fresh", "kept", ttl=60)
+        await backend.set("stale", "dropped", ttl=-1)
+        backend.close()
+
+    async def read():
+        backend = SQLiteBackend(path)
+        return await backend.get("fresh"), await backend.get("stale")
+
+    asyncio.run(write())
+    assert asyncio.run(read()) == ("kept", None)
@@ -0,0 +1,60 @@
+"""
+Tests for structured session logging.
+"""
+
+import json
+from datetime import datetime, timedelta, timezone
+
+from jasper.observability.logger import SessionLogger
+
+
+def drain(capsys):
+    """Discard records other tests queued before this one started."""
+    SessionLogger().flush()
+    capsys.readouterr()
+
+
+def test_log_emits_one_json_record_and_stringifies_unknown_types(capsys):
+    drain(capsys)
+    logger = SessionLogger()
+    logger.log("TASK_FAILED", {"task_id": "t1", "error": ValueError("boom"), "codes": {404: "missing"}})
+    logger.flush()
+
+    record = json.loads(capsys.readouterr().out)
+    assert record["session_id"] == logger.session_id
+    assert record["event"] == "TASK_FAILED"
+    assert record["payload"] == {"task_id": "t1", "error": "boom", "codes": {"404": "missing"}}
+
+
+def test_payload_is_captured_when_logged(capsys):
+    drain(capsys)
+    logger = SessionLogger()
+    plan = [{"task_id": "t1", "status": "pending"}]
+    logger.log("PLAN_CREATED", {"plan": plan})
+    plan[0]["status"] = "completed"
+    plan.append({"task_id": "t2"})
+    logger.flush()
+
+    assert json.loads(capsys.readouterr().out)["payload"] == {"plan": [{"task_id": "t1", "status": "pending"}]}
+
+
+def test_records_from_all_loggers_are_written_in_order(capsys):
+    drain(capsys)
+    first, second = SessionLogger(), SessionLogger()
+    for i in range(100):
+        (first if i % 2 else second).log("EVENT", {"i": i})
+    first.flush()
+
+    lines = capsys.readouterr().out.splitlines()
+    assert [json.loads(line)["payload"]["i"] for line in lines] == list(range(100))
+
+
+def test_timestamp_is_iso_utc(capsys):
+    drain(capsys)
+    before = datetime.now(timezone.utc).replace(tzinfo=None)
+    SessionLogger().log("EVENT", {})
+    SessionLogger().flush()
+
+    stamp = datetime.fromisoformat(json.loads(capsys.readouterr().out)["timestamp"])
+    assert stamp.tzinfo is None
+    assert abs(stamp - before) < timedelta(seconds=5)
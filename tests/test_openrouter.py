@@ -0,0 +1,75 @@
+"""
+Tests for the direct OpenRouter chat client.
+"""
+
+import asyncio
+import json
+
+import httpx
+import pytest
+from langchain_core.messages import HumanMessage, SystemMessage
+
+from jasper.core.openrouter import OpenRouterChat
+
+
+def make_llm(handler):
+    llm = OpenRouterChat(model="test/model", api_key="sk-test")
+    llm._client = httpx.AsyncClient(base_url=llm.base_url, headers=llm._headers, transport=httpx.MockTransport(handler))
+    return llm
+
+
+def test_agenerate_maps_roles_and_returns_text():
+    seen = {}
+
+    def handler(request):
+        seen["auth"] = request.headers["Authorization"]
+        seen["body"] = json.loads(request.content)
+        return httpx.Response(200, json={"choices": [{"message": {"role": "assistant", "content": "hello"}}]})
+
+    llm = make_llm(handler)
+    result = asyncio.run(llm.agenerate([[SystemMessage(content="sys"), HumanMessage(content="hi")]]))
+
+    assert result.generations[0][0].text == "hello"
+    assert seen["auth"] == "Bearer sk-test"
+    assert [m["role"] for m in seen["body"]["messages"]] == ["system", "user"]
+    assert seen["body"]["model"] == "test/model" and seen["body"]["stream"] is False
+
+
+def test_astream_yields_deltas_until_done():
+    events = [
+        ": OPENROUTER PROCESSING",
+        'data: {"choices": [{"delta": {"content": "Hel"}}]}',
+        'data: {"choices": [{"delta": {"content": "lo"}}]}',
+        "data: [DONE]",
+    ]
+
+    def handler(request):
+        return httpx.Response(200, text="\n\n".join(events) + "\n\n")
+
+    async def run():
+        return [chunk.content async for chunk in make_llm(handler).astream([HumanMessage(content="hi")])]
+
+    assert asyncio.run(run()) == ["Hel", "lo"]
+
+
+def test_http_errors_keep_status_code_in_message():
+    llm = make_llm(lambda request: httpx.Response(524, text="timeout upstream"))
+
+    with pytest.raises(RuntimeError, match="524"):
+        asyncio.run(llm.ainvoke([HumanMessage(content="hi")]))
+
+
+def test_get_llm_reuses_client_per_model(monkeypatch):
+    from jasper.core import llm as llm_module
+
+    monkeypatch.setenv("OPENROUTER_API_KEY", "sk-test")
+    monkeypatch.setenv("OPENROUTER_MODEL", "test/model")
+    llm_module._build_llm.cache_clear()
+    try:
+        first = llm_module.get_llm(temperature=0)
+        assert llm_module.get_llm(temperature=0) is first
+
+        monkeypatch.setenv("OPENROUTER_MODEL", "test/other")
+        assert llm_module.get_llm(temperature=0) is not first
+    finally:
+        llm_module._build_llm.cache_clear()
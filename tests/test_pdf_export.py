@@ -10,6 +10,7 @@ Tests:
 """
 
 import pytest
+import re
 import tempfile
 from pathlib import Path
 from datetime import datetime
@@ -85,6 +86,39 @@ def test_css_loading():
     assert "forensic-section" in css
 
 
+def test_css_is_reread_only_when_modified(tmp_path, monkeypatch):
+    """Cached CSS is served until the stylesheet's mtime changes."""
+    import os
+    from jasper.export import pdf
+
+    css_path = tmp_path / "report_v1.css"
+    css_path.write_text("body { color: red; }", encoding="utf-8")
+    monkeypatch.setattr(pdf, "get_styles_dir", lambda: tmp_path)
+    monkeypatch.setattr(pdf, "_CSS_CACHE", None)
+
+    assert "red" in load_css_content()
+    css_path.write_text("body { color: blue; }", encoding="utf-8")
+    stat = css_path.stat()
+    os.utime(css_path, (stat.st_atime, stat.st_mtime + 10))
+    assert "blue" in load_css_content()
+
+
+def test_pdf_css_avoids_flex_and_grid_layouts():
+    """Flex/grid containers make WeasyPrint's layout super-linear on long reports."""
+    css = load_css_content(minified=True)
+    assert not re.search(r"display:\s*(inline-)?(flex|grid)", css)
+    assert re.search(r"table-layout:\s*fixed", css)
+
+
+def test_minified_css_keeps_rules_and_strings():
+    """PDF rendering embeds CSS without comments or padding but with identical rules."""
+    from jasper.export.pdf import minify_css
+
+    css = '/* header */\nbody {\n    font-family: "Helvetica  Neue", sans-serif;\n}\n\ntd > p , th { margin: 0; }\n'
+    assert minify_css(css) == 'body{font-family: "Helvetica  Neue", sans-serif}td > p , th{margin: 0}'
+    assert len(load_css_content(minified=True)) < len(load_css_content())
+
+
 def test_html_rendering(sample_report):
     """Test HTML rendering from FinalReport."""
     html = render_report_html(sample_report)
@@ -98,6 +132,9 @@ def test_html_rendering(sample_report):
     assert "Apple" in html or "AAPL" in html
     assert "92" in html  # confidence_score as percentage
 
+    # Synthesis markdown is rendered exactly once, through the template filter
+    assert html.count("Revenue Performance") == 1
+    
     # Verify semantic structure
     assert "metadata-dashboard" in html
     assert "meta-label" in html
@@ -107,6 +144,50 @@ def test_html_rendering(sample_report):
     assert "http://" not in html.split("<body>")[0]  # No external URLs in head
 
 
+def test_template_is_compiled_once(sample_report):
+    """Repeated renders reuse the cached template and stay byte-identical."""
+    from jasper.export.pdf import _get_template
+
+    template = _get_template()
+    first = render_report_html(sample_report)
+    second = render_report_html(sample_report)
+
+    assert _get_template() is template
+    assert first == second
+
+
+def test_query_hash_is_short_and_stable(sample_report):
+    """The header and footer show the same 16-char digest of the query."""
+    from jasper.export.pdf import short_hash
+
+    digest = short_hash(sample_report.query)
+    assert len(digest) == 16 and int(digest, 16) >= 0
+    assert render_report_html(sample_report).count(digest) == 2
+
+
+def test_report_view_preformats_display_fields(sample_report):
+    """Derived fields are plain strings so the template applies no filters."""
+    from jasper.export.pdf import build_report_view, short_hash
+
+    view = build_report_view(sample_report)
+    assert view["timestamp"] == "2024-12-15 14:30:00 UTC"
+    assert view["entities"] == "AAPL"
+    assert view["query_hash"] == short_hash(sample_report.query)
+    assert view["title"].endswith("...") and len(view["title"]) <= 40
+    assert len(view["inference_confidence"]) == len(sample_report.inference_map)
+
+
+def test_markdown_is_parsed_once_per_text():
+    """Identical synthesis text is served from the render_markdown memo."""
+    from jasper.export.pdf import render_markdown
+
+    text = "### Margin\n\nGross margin held at **46%**."
+    before = render_markdown.cache_info().hits
+    assert render_markdown(text) == render_markdown(text)
+    assert "<strong>46%</strong>" in render_markdown(text)
+    assert render_markdown.cache_info().hits >= before + 2
+
+
 def test_html_export(sample_report):
     """Test exporting report to HTML file."""
     with tempfile.TemporaryDirectory() as tmpdir:
@@ -123,6 +204,26 @@ def test_html_export(sample_report):
         assert "AAPL" in content or "Apple" in content
 
 
+def test_streamed_html_export_matches_rendered_html(sample_report, tmp_path):
+    """The streamed file export must be byte-identical to the in-memory render."""
+    output_path = tmp_path / "streamed.html"
+    export_report_html(sample_report, str(output_path))
+    assert output_path.read_text(encoding="utf-8") == render_report_html(sample_report)
+
+
+def test_failed_html_export_leaves_no_partial_file(sample_report, tmp_path, monkeypatch):
+    from jasper.export import pdf
+
+    def broken_view(report):
+        raise ValueError("bad report field")
+
+    monkeypatch.setattr(pdf, "build_report_view", broken_view)
+    output_path = tmp_path / "broken.html"
+    with pytest.raises(ValueError, match="bad report field"):
+        export_report_html(sample_report, str(output_path))
+    assert not output_path.exists()
+
+
 def test_pdf_compilation_deterministic(sample_report):
     """Test that PDF compilation is deterministic (same input → same output)."""
     html = render_report_html(sample_report)
@@ -147,6 +248,21 @@ def test_pdf_compilation_deterministic(sample_report):
             assert f.read(4) == b"%PDF"
 
 
+def test_reused_render_buffer_does_not_leak_longer_output(sample_report, tmp_path):
+    """A short PDF rendered after a long one must not carry the long one's tail."""
+    short_html = render_report_html(sample_report)
+    sample_report.synthesis_text = "Paragraph of analysis. " * 2000
+    long_html = render_report_html(sample_report)
+
+    long_pdf, short_pdf = tmp_path / "long.pdf", tmp_path / "short.pdf"
+    compile_html_to_pdf(long_html, str(long_pdf))
+    compile_html_to_pdf(short_html, str(short_pdf))
+
+    data = short_pdf.read_bytes()
+    assert len(data) < long_pdf.stat().st_size
+    assert data.rstrip().endswith(b"%%EOF") and data.count(b"%%EOF") == 1
+
+
 def test_pdf_export_valid_report(sample_report):
     """Test exporting a valid report to PDF."""
     with tempfile.TemporaryDirectory() as tmpdir:
@@ -193,6 +309,113 @@ def test_pdf_export_invalid_report_allows_bypass(sample_report):
             assert f.read(4) == b"%PDF"
 
 
+def test_weasyprint_render_errors_are_not_masked(sample_report, tmp_path, monkeypatch):
+    """Only OSError (missing native libs/fonts) falls back; other render errors surface."""
+    from jasper.export import pdf
+
+    class BrokenHTML:
+        def __init__(self, string, **kwargs):
+            pass
+
+        def write_pdf(self, target):
+            target.write(b"%PDF-1.7 partial")
+            raise ValueError("bad stylesheet")
+
+    monkeypatch.setattr(pdf, "_weasyprint_html", lambda: BrokenHTML)
+    out = tmp_path / "out.pdf"
+    with pytest.raises(RuntimeError, match="bad stylesheet"):
+        compile_html_to_pdf(render_report_html(sample_report, for_pdf=True), str(out))
+    assert not out.exists()
+
+
+def test_failed_fallback_removes_partial_weasyprint_output(sample_report, tmp_path, monkeypatch):
+    """An OSError falls back to xhtml2pdf; if that fails too, WeasyPrint's partial file goes."""
+    import xhtml2pdf.pisa
+
+    from jasper.export import pdf
+
+    class MissingFontHTML:
+        def __init__(self, string, **kwargs):
+            pass
+
+        def write_pdf(self, target):
+            target.write(b"%PDF-1.7 partial")
+            raise OSError("cannot load font")
+
+    def failing_create_pdf(*args, **kwargs):
+        raise ValueError("bad markup")
+
+    monkeypatch.setattr(pdf, "_weasyprint_html", lambda: MissingFontHTML)
+    monkeypatch.setattr(xhtml2pdf.pisa, "CreatePDF", failing_create_pdf)
+    out = tmp_path / "out.pdf"
+    with pytest.raises(RuntimeError, match="all engines"):
+        compile_html_to_pdf(render_report_html(sample_report, for_pdf=True), str(out))
+    assert not out.exists()
+
+
+def test_weasyprint_never_fetches_external_resources(sample_report, tmp_path, monkeypatch):
+    """WeasyPrint gets no base URL and a fetcher that rejects every URL up front."""
+    from jasper.export import pdf
+
+    seen = {}
+
+    class RecordingHTML:
+        def __init__(self, string, **kwargs):
+            seen.update(kwargs)
+
+        def write_pdf(self, target):
+            target.write(b"%PDF-1.7")
+
+    monkeypatch.setattr(pdf, "_weasyprint_html", lambda: RecordingHTML)
+    compile_html_to_pdf(render_report_html(sample_report, for_pdf=True), str(tmp_path / "out.pdf"))
+
+    assert seen["base_url"] is None
+    for url in ("https://example.com/logo.png", "file:///etc/passwd"):
+        with pytest.raises(ValueError, match="disabled"):
+            seen["url_fetcher"](url)
+
+
+def test_offline_fetcher_still_resolves_data_uris(monkeypatch):
+    import sys
+    from types import SimpleNamespace
+
+    from jasper.export import pdf
+
+    fetched = []
+    fake = SimpleNamespace(default_url_fetcher=lambda url, **kwargs: fetched.append(url) or {"string": b"x"})
+    monkeypatch.setitem(sys.modules, "weasyprint", fake)
+    uri = "data:image/png;base64,iVBORw0KGgo="
+    assert pdf._offline_url_fetcher(uri) == {"string": b"x"}
+    assert fetched == [uri]
+
+
+def test_batch_export_runs_reports_on_a_thread_pool(sample_report, tmp_path, monkeypatch):
+    """With WeasyPrint available, batch exports overlap; results keep input order."""
+    import threading
+    from jasper.export import pdf
+
+    threads = set()
+
+    class RecordingHTML:
+        def __init__(self, string, **kwargs):
+            self.string = string
+
+        def write_pdf(self, target):
+            threads.add(threading.current_thread().name)
+            target.write(b"%PDF-1.7 " + self.string[:20].encode())
+
+    monkeypatch.setattr(pdf, "_weasyprint_html", lambda: RecordingHTML)
+    paths = [str(tmp_path / f"report_{i}.pdf") for i in range(4)]
+    results = pdf.export_reports_batch([sample_report] * 4, paths, max_workers=4)
+
+    assert results == [str(Path(p).resolve()) for p in paths]
+    assert all(Path(p).read_bytes().startswith(b"%PDF") for p in paths)
+    assert threads and all(name.startswith("jasper-export") for name in threads)
+
+    with pytest.raises(ValueError, match="output paths"):
+        pdf.export_reports_batch([sample_report], [])
+
+
 def test_pdf_export_offline_no_network():
     """Test that PDF export does not make network calls."""
     report = FinalReport(
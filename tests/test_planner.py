@@ -0,0 +1,170 @@
+"""
+Tests for the Planner's fused entity-extraction + planning call.
+"""
+
+import asyncio
+import json
+from types import SimpleNamespace
+
+import pytest
+
+from jasper.agent.planner import Planner
+from jasper.core.state import ReportMode
+
+
+class ScriptedLLM:
+    """Returns a fixed planner response and records every call."""
+
+    model_name = "fake-model"
+    temperature = 0
+
+    def __init__(self, payload: dict):
+        self.text = "```json\n" + json.dumps(payload) + "\n```"
+        self.calls = 0
+
+    async def agenerate(self, batches):
+        self.calls += 1
+        return SimpleNamespace(generations=[[SimpleNamespace(text=self.text)]])
+
+
+def _payload(tasks, category="quantitative", entities=None):
+    return {
+        "entities": entities if entities is not None else [{"name": "Apple", "type": "company", "ticker": "AAPL"}],
+        "intent": {"category": category, "reasoning": "test"},
+        "tasks": tasks,
+    }
+
+
+def _fetch(ticker, depends_on=None):
+    return {
+        "description": f"Fetch income statement for {ticker}",
+        "tool_name": "income_statement",
+        "tool_args": {"ticker": ticker},
+        "depends_on": depends_on or [],
+    }
+
+
+def test_plan_uses_single_llm_call():
+    llm = ScriptedLLM(_payload([_fetch("AAPL"), _fetch("MSFT")]))
+    tasks, mode = asyncio.run(Planner(llm).plan("What is Apple revenue?"))
+    assert llm.calls == 1
+    assert mode == ReportMode.FINANCIAL_EVIDENCE
+    assert [t.tool_args["ticker"] for t in tasks] == ["AAPL", "MSFT"]
+    assert len({t.id for t in tasks}) == 2
+
+
+def test_positional_dependencies_map_to_task_ids():
+    llm = ScriptedLLM(_payload([_fetch("AAPL"), _fetch("MSFT", [0, 5]), _fetch("GOOG", [2])]))
+    tasks, _ = asyncio.run(Planner(llm).plan("Compare Apple and Microsoft revenue"))
+    assert tasks[0].depends_on == []
+    assert tasks[1].depends_on == [tasks[0].id]
+    assert tasks[2].depends_on == []  # self/forward references are ignored
+
+
+def test_qualitative_query_allows_empty_plan():
+    llm = ScriptedLLM(_payload([], category="qualitative"))
+    tasks, mode = asyncio.run(Planner(llm).plan("Explain Uber's business model"))
+    assert tasks == []
+    assert mode == ReportMode.BUSINESS_MODEL
+
+
+def test_unknown_tool_is_rejected():
+    bad = dict(_fetch("AAPL"), tool_name="balance_sheet")
+    llm = ScriptedLLM(_payload([bad]))
+    with pytest.raises(ValueError, match="Unknown tool"):
+        asyncio.run(Planner(llm).plan("What is Apple revenue?"))
+
+
+class StreamingLLM(ScriptedLLM):
+    """Streams the scripted response in small chunks."""
+
+    def __init__(self, payload: dict, chunk_size: int = 7):
+        super().__init__(payload)
+        self.chunk_size = chunk_size
+
+    async def astream(self, messages):
+        self.calls += 1
+        for i in range(0, len(self.text), self.chunk_size):
+            yield SimpleNamespace(content=self.text[i:i + self.chunk_size])
+
+
+def test_streamed_tasks_are_dispatched_before_plan_returns():
+    llm = StreamingLLM(_payload([_fetch("AAPL"), _fetch("MSFT", [0])]))
+    seen = []
+    tasks, _ = asyncio.run(Planner(llm).plan("Compare Apple and Microsoft revenue", on_task=seen.append))
+    assert llm.calls == 1
+    assert seen == tasks  # Same Task objects, so status updates land in the final plan
+    assert tasks[1].depends_on == [tasks[0].id]
+
+
+def test_batch_parse_fallback_keeps_streamed_tasks(monkeypatch):
+    from jasper.agent import planner as planner_module
+    from jasper.agent.json_utils import StreamingArrayParser
+
+    class FirstItemOnly(StreamingArrayParser):
+        """Stops after one item, as if the rest of the array had an unexpected layout."""
+
+        def feed(self, chunk):
+            items = super().feed(chunk)
+            self.seen = getattr(self, "seen", 0)
+            items = items[:max(0, 1 - self.seen)]
+            self.seen += len(items)
+            return items
+
+        @property
+        def done(self):
+            return False
+
+        @done.setter
+        def done(self, value):
+            pass
+
+    monkeypatch.setattr(planner_module, "StreamingArrayParser", FirstItemOnly)
+    llm = StreamingLLM(_payload([_fetch("AAPL"), _fetch("MSFT", [0])]))
+    seen = []
+    tasks, _ = asyncio.run(Planner(llm).plan("Compare Apple and Microsoft revenue", on_task=seen.append))
+    assert len(seen) == 1 and tasks[0] is seen[0]  # Already-dispatched task is not replaced
+    assert tasks[1].tool_args["ticker"] == "MSFT"
+    assert tasks[1].depends_on == [tasks[0].id]
+
+
+def test_streaming_array_parser_handles_split_items():
+    from jasper.agent.json_utils import StreamingArrayParser
+
+    text = '{"reasoning": "mentions \\"tasks\\": [1]", "tasks": [{"a": "}"}, {"b": [1, 2]}]}'
+    parser = StreamingArrayParser("tasks")
+    items = []
+    for ch in text:
+        items.extend(parser.feed(ch))
+    assert items == [{"a": "}"}, {"b": [1, 2]}]
+    assert parser.done
+
+
+def test_plan_combined_resolves_entities():
+    entities = [{"name": "Apple", "type": "company", "ticker": "aapl"}, {"name": "S&P 500", "type": "index", "ticker": None}]
+    llm = ScriptedLLM(_payload([_fetch("AAPL")], entities=entities))
+    combined = asyncio.run(Planner(llm).plan_combined("What is Apple revenue?"))
+    assert combined.resolved_entities == {"Apple": "AAPL"}
+    assert len(combined.tasks) == 1
+
+
+def test_executor_falls_back_to_resolved_entities():
+    from jasper.agent.executor import Executor
+    from jasper.core.state import Jasperstate, Task
+
+    state = Jasperstate(query="q", resolved_entities={"Apple": "AAPL", "Microsoft": "MSFT"})
+    assert Executor._resolve_ticker(state, Task(description="Fetch Microsoft income statement")) == "MSFT"
+    assert Executor._resolve_ticker(state, Task(description="Fetch revenue")) is None
+    state.resolved_entities = {"Apple": "AAPL"}
+    assert Executor._resolve_ticker(state, Task(description="Fetch revenue")) == "AAPL"
+
+
+def test_executor_matches_entity_names_on_word_boundaries():
+    from jasper.agent.executor import Executor
+    from jasper.core.state import Jasperstate, Task
+
+    state = Jasperstate(query="q", resolved_entities={"Meta": "META", "Apple": "AAPL"})
+    assert Executor._resolve_ticker(state, Task(description="Fetch pineapple metadata")) is None
+    assert Executor._resolve_ticker(state, Task(description="Fetch Apple's income statement")) == "AAPL"
+    state.resolved_entities = {"Amazon.com Inc.": "AMZN", "Apple": "AAPL"}
+    assert Executor._resolve_ticker(state, Task(description="Revenue for Amazon.com Inc. (FY24)")) == "AMZN"
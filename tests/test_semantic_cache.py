@@ -0,0 +1,73 @@
+"""
+Tests for the paraphrase-level FinalReport cache.
+"""
+
+from datetime import datetime, timedelta, timezone
+
+from jasper.core.semantic_cache import ReportCache
+from jasper.core.state import FinalReport
+
+VECTORS = {
+    "apple revenue trend": [1.0, 0.0],
+    "aapl revenue over time": [0.98, 0.1],
+    "microsoft revenue trend": [0.99, 0.05],
+    "ford debt": [0.0, 1.0],
+}
+APPLE = {"Apple Inc.": "AAPL"}
+
+
+def _report(query: str, age: timedelta = timedelta(0)) -> FinalReport:
+    return FinalReport(
+        query=query,
+        synthesis_text="## Memo",
+        is_valid=True,
+        timestamp=datetime.now(timezone.utc) - age,
+    )
+
+
+def test_paraphrase_hits_and_survives_reload(tmp_path):
+    path = tmp_path / "sem_cache" / "reports.jsonl"
+    cache = ReportCache(VECTORS.__getitem__, path=path)
+    cache.store("apple revenue trend", _report("apple revenue trend"), APPLE)
+
+    reloaded = ReportCache(VECTORS.__getitem__, path=path)
+    hit = reloaded.lookup("aapl revenue over time")
+    assert hit is not None and hit.query == "apple revenue trend"
+    assert reloaded.lookup("ford debt") is None
+
+
+def test_similar_query_about_another_company_misses():
+    cache = ReportCache(VECTORS.__getitem__)
+    cache.store("apple revenue trend", _report("apple revenue trend"), APPLE)
+    assert cache.lookup("microsoft revenue trend") is None
+
+
+def test_stale_reports_are_misses_and_get_replaced():
+    cache = ReportCache(VECTORS.__getitem__, max_age=timedelta(hours=1))
+    cache.store("apple revenue trend", _report("apple revenue trend", age=timedelta(hours=2)), APPLE)
+    assert cache.lookup("aapl revenue over time") is None
+    assert cache.stats == {"hits": 0, "misses": 1}
+    assert len(cache.index) == 0  # Evicted rather than shadowing newer rows
+
+    cache.store("apple revenue trend", _report("apple revenue trend"), APPLE)
+    assert cache.lookup("aapl revenue over time") is not None
+
+
+def test_store_replaces_equivalent_rows_and_enforces_maxsize(tmp_path):
+    path = tmp_path / "reports.jsonl"
+    cache = ReportCache(VECTORS.__getitem__, path=path, maxsize=2)
+    cache.store("apple revenue trend", _report("apple revenue trend"), APPLE)
+    cache.store("aapl revenue over time", _report("aapl revenue over time"), APPLE)
+    assert len(cache.index) == 1  # Same companies, paraphrased query: replaced
+
+    cache.store("microsoft revenue trend", _report("microsoft revenue trend"), {"Microsoft": "MSFT"})
+    cache.store("ford debt", _report("ford debt"), {"Ford": "F"})
+    assert len(cache.index) == 2
+    assert len(path.read_text(encoding="utf-8").splitlines()) == 2
+    assert cache.lookup("aapl revenue over time") is None  # Oldest row trimmed
+
+
+def test_reports_without_companies_are_not_cached():
+    cache = ReportCache(VECTORS.__getitem__)
+    cache.store("apple revenue trend", _report("apple revenue trend"))
+    assert len(cache.index) == 0
@@ -0,0 +1,84 @@
+"""
+Tests for speculative planning while the query is typed.
+"""
+
+import asyncio
+
+from jasper.cli.speculative import SpeculativePlanner
+
+
+def make_speculator(calls, delay=0.05):
+    async def plan(text):
+        calls.append(text)
+        await asyncio.sleep(delay)
+        return text
+
+    return SpeculativePlanner(plan, debounce=0.01, min_chars=4)
+
+
+def test_matching_speculation_is_awaited_and_reused():
+    calls = []
+
+    async def run():
+        spec = make_speculator(calls)
+        spec.on_text_changed("What is")
+        spec.on_text_changed("What is Apple revenue")  # resets the debounce timer
+        await asyncio.sleep(0.02)
+        return await spec.settle("What is Apple revenue"), spec.stats
+
+    matched, stats = asyncio.run(run())
+    assert matched is True
+    assert calls == ["What is Apple revenue"]
+    assert stats == {"started": 1, "used": 1, "discarded": 0}
+
+
+def test_stale_speculation_is_cancelled():
+    calls = []
+
+    async def run():
+        spec = make_speculator(calls, delay=1.0)
+        spec.on_text_changed("What is Apple")
+        await asyncio.sleep(0.02)
+        task = spec._task
+        matched = await spec.settle("What is Apple revenue")
+        await asyncio.sleep(0)
+        return matched, task.cancelled(), spec.stats
+
+    matched, cancelled, stats = asyncio.run(run())
+    assert matched is False and cancelled
+    assert stats["discarded"] == 1
+
+
+def test_short_inputs_and_commands_are_not_speculated():
+    calls = []
+
+    async def run():
+        spec = make_speculator(calls)
+        spec.on_text_changed("Hi")
+        spec.on_text_changed("/export report.pdf")
+        await asyncio.sleep(0.03)
+        return spec.stats["started"]
+
+    assert asyncio.run(run()) == 0
+    assert calls == []
+
+
+def test_failed_speculation_is_discarded_quietly():
+    import gc
+
+    errors = []
+
+    async def plan(text):
+        raise ValueError("Could not extract financial entities from query")
+
+    async def run():
+        asyncio.get_running_loop().set_exception_handler(lambda loop, context: errors.append(context))
+        spec = SpeculativePlanner(plan, debounce=0.01, min_chars=4)
+        spec.on_text_changed("What is")
+        await asyncio.sleep(0.03)
+        matched = await spec.settle("What is Apple revenue")
+        gc.collect()  # "Task exception was never retrieved" is reported when the task is collected
+        return matched
+
+    assert asyncio.run(run()) is False
+    assert errors == []
@@ -0,0 +1,65 @@
+"""
+Tests for the Synthesizer's prompt assembly and response caching.
+"""
+
+import asyncio
+from types import SimpleNamespace
+
+from jasper.agent.synthesizer import Synthesizer
+from jasper.core.state import Jasperstate, Task, validationresult
+
+
+class RecordingLLM:
+    model_name = "fake-model"
+    temperature = 0
+
+    def __init__(self):
+        self.prompts = []
+
+    async def agenerate(self, batches):
+        self.prompts.append(batches[0][0].content)
+        return SimpleNamespace(generations=[[SimpleNamespace(text="## Memo")]])
+
+
+def _state(revenue: str) -> Jasperstate:
+    state = Jasperstate(query="Apple revenue", plan=[Task(id="a", description="Fetch AAPL")])
+    state.task_results["a"] = [{"fiscalDateEnding": "2024-12-31", "totalRevenue": revenue}]
+    state.validation = validationresult(is_valid=True, confidence=0.9)
+    return state
+
+
+def test_repeat_synthesis_is_served_from_cache():
+    llm = RecordingLLM()
+    synthesizer = Synthesizer(llm)
+
+    async def run():
+        first = await synthesizer.synthesize(_state("100"))
+        second = await synthesizer.synthesize(_state("100"))
+        third = await synthesizer.synthesize(_state("200"))
+        return first, second, third
+
+    assert asyncio.run(run()) == ("## Memo", "## Memo", "## Memo")
+    assert len(llm.prompts) == 2  # Different data is a different prompt
+    assert "Task: Fetch AAPL" in llm.prompts[0]
+
+
+def test_tokens_are_forwarded_to_logger():
+    from jasper.observability.logger import SessionLogger
+
+    class StreamingLLM(RecordingLLM):
+        async def astream(self, messages):
+            for part in ("## Me", "mo"):
+                yield SimpleNamespace(content=part)
+
+    class TokenLogger(SessionLogger):
+        def __init__(self):
+            super().__init__()
+            self.tokens = []
+
+        def log_stream(self, event_type, delta):
+            self.tokens.append((event_type, delta))
+
+    logger = TokenLogger()
+    answer = asyncio.run(Synthesizer(StreamingLLM(), logger=logger).synthesize(_state("100")))
+    assert answer == "## Memo"
+    assert logger.tokens == [("SYNTHESIS_TOKEN", "## Me"), ("SYNTHESIS_TOKEN", "mo")]
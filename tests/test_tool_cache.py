@@ -0,0 +1,90 @@
+"""
+Tests for the provider result cache in front of FinancialDataRouter.
+"""
+
+import asyncio
+
+import pytest
+
+from jasper.tools.exceptions import DataProviderError
+from jasper.tools.financials import FinancialDataRouter
+from jasper.tools.tool_cache import ToolResultCache
+
+
+class CountingProvider:
+    def __init__(self, fail: bool = False):
+        self.calls = 0
+        self.fail = fail
+
+    async def income_statement(self, ticker: str):
+        self.calls += 1
+        await asyncio.sleep(0.01)
+        if self.fail:
+            raise RuntimeError("provider down")
+        return [{"fiscalDateEnding": "2024-09-30", "totalRevenue": "100"}]
+
+
+def test_concurrent_duplicate_fetches_share_one_call():
+    provider = CountingProvider()
+    router = FinancialDataRouter(providers=[provider], cache=ToolResultCache())
+
+    async def run():
+        return await asyncio.gather(*(router.fetch_income_statement(t) for t in ["AAPL", "aapl", "AAPL"]))
+
+    results = asyncio.run(run())
+    assert provider.calls == 1
+    assert results[0] is results[1] is results[2]
+    assert router.cache._lookup("income_statement:AAPL") is results[0]
+
+
+def test_failures_are_not_cached():
+    provider = CountingProvider(fail=True)
+    router = FinancialDataRouter(providers=[provider], cache=ToolResultCache())
+
+    async def run():
+        for _ in range(2):
+            with pytest.raises(DataProviderError, match="provider down"):
+                await router.fetch_income_statement("AAPL")
+
+    asyncio.run(run())
+    assert provider.calls == 2
+
+
+def test_expired_entries_are_refetched():
+    provider = CountingProvider()
+    router = FinancialDataRouter(providers=[provider], cache=ToolResultCache(ttl=0))
+
+    async def run():
+        await router.fetch_income_statement("AAPL")
+        await router.fetch_income_statement("AAPL")
+
+    asyncio.run(run())
+    assert provider.calls == 2
+
+
+def test_response_cache_serves_repeat_provider_calls(tmp_path):
+    from jasper.tools.cache import ResponseCache, cached
+
+    class Provider:
+        name = "fake"
+
+        def __init__(self, response_cache):
+            self.response_cache = response_cache
+            self.calls = 0
+
+        @cached("INCOME_STATEMENT")
+        async def income_statement(self, ticker):
+            self.calls += 1
+            return [{"fiscalDateEnding": "2024-12-31", "ticker": ticker}]
+
+    provider = Provider(ResponseCache(tmp_path))
+    first = asyncio.run(provider.income_statement("AAPL"))
+    # A new process would build a fresh provider; the disk entry still serves it
+    second_provider = Provider(ResponseCache(tmp_path))
+    second = asyncio.run(second_provider.income_statement("aapl"))
+    assert first == second
+    assert (provider.calls, second_provider.calls) == (1, 0)
+
+    expired = Provider(ResponseCache(tmp_path, ttl_map={"INCOME_STATEMENT": -1}))
+    asyncio.run(expired.income_statement("AAPL"))
+    assert expired.calls == 1
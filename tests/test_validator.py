@@ -0,0 +1,81 @@
+"""
+Tests for the validation gate.
+"""
+
+from jasper.agent.validator import validator
+from jasper.core.state import Jasperstate, Task
+
+
+def _reports(n: int, revenue: str = "100"):
+    return [{"fiscalDateEnding": f"202{i}-12-31", "totalRevenue": revenue} for i in range(n)]
+
+
+def test_empty_plan_uses_qualitative_confidence():
+    result = validator().validate(Jasperstate(query="Explain Uber's business model"))
+    assert result.is_valid
+    assert result.breakdown.data_coverage == 1.0
+    assert result.confidence == round(1.0 * 0.85 * 0.8, 2)
+
+
+def test_issue_order_lists_task_issues_before_data_issues():
+    plan = [
+        Task(id="a", description="A", status="completed"),
+        Task(id="b", description="B", status="failed", error="boom"),
+    ]
+    state = Jasperstate(query="q", plan=plan, task_results={})
+    result = validator().validate(state)
+    assert result.issues == [
+        "Incomplete task: B",
+        "Task error: B - boom",
+        "Missing data for completed task: A",
+    ]
+
+
+def test_quality_and_negative_revenue():
+    plan = [Task(id="a", description="A", status="completed"), Task(id="b", description="B", status="completed")]
+    state = Jasperstate(query="q", plan=plan)
+    # Executor stores provider report lists directly (no validation on assignment)
+    state.task_results["a"] = _reports(3)
+    state.task_results["b"] = _reports(1, "-5")
+    result = validator().validate(state)
+    assert result.issues == ["Negative revenue detected"]
+    assert result.breakdown.data_quality == round((1.0 + 1 / 3) / 2, 2)
+
+
+def test_validator_reads_financial_columns_that_match_results():
+    plan = [Task(id="a", description="A", status="completed", tool_args={"ticker": "aapl"})]
+    state = Jasperstate(query="q", plan=plan)
+    state.task_results["a"] = [
+        {"fiscalDateEnding": "2023-12-31", "totalRevenue": "-1"},
+        {"fiscalDateEnding": "2024-12-31", "totalRevenue": "None"},
+    ]
+    state.financials.append_reports("AAPL", state.task_results["a"], "a")
+    assert state.financials.ticker == ["AAPL", "AAPL"]
+    assert validator()._financial_columns(state) is state.financials
+    assert validator().validate(state).issues == ["Negative revenue detected"]
+
+
+def test_validator_rebuilds_columns_out_of_step_with_results():
+    plan = [
+        Task(id="a", description="A", status="completed", tool_args={"ticker": "aapl"}),
+        Task(id="b", description="B", status="completed", tool_args={"ticker": "aapl"}, alias_of="a"),
+    ]
+    state = Jasperstate(query="q", plan=plan)
+    state.task_results["a"] = state.task_results["b"] = _reports(2)
+    # A stale row from a task no longer in the plan, and none for the deduped task "b"
+    state.financials.append_reports("AAPL", [{"fiscalDateEnding": "2024-12-31", "totalRevenue": "-1"}], "gone")
+    state.financials.append_reports("AAPL", state.task_results["a"], "a")
+
+    columns = validator()._financial_columns(state)
+    assert columns.task_id == ["a", "a", "b", "b"]
+    assert validator().validate(state).issues == []
+
+
+def test_negative_revenue_found_behind_leading_nan():
+    plan = [Task(id="a", description="A", status="completed")]
+    state = Jasperstate(query="q", plan=plan)
+    state.task_results["a"] = [{"totalRevenue": None}, {"totalRevenue": "-3"}, {"totalRevenue": "7"}]
+    state.financials.append_reports("AAPL", state.task_results["a"], "a")
+    issues = []
+    validator()._validate_financial_consistency(state, issues)
+    assert issues == ["Negative revenue detected"]
@@ -0,0 +1,41 @@
+"""
+Tests for the yfinance provider's threading behaviour.
+"""
+
+import asyncio
+import threading
+
+import pandas as pd
+
+from jasper.tools.providers import yfinance as yf_provider
+
+
+class SlowTicker:
+    """Stands in for yf.Ticker; property access blocks until both fetches are in flight."""
+
+    # Only passes if two fetches block at the same time, i.e. in separate worker threads
+    overlap = threading.Barrier(2, timeout=5)
+
+    def __init__(self, ticker):
+        self.ticker = ticker
+
+    @property
+    def quarterly_financials(self):
+        self.overlap.wait()
+        return pd.DataFrame({pd.Timestamp("2024-12-31"): {"Total Revenue": 100.0, "Net Income": 10.0}})
+
+
+def test_concurrent_fetches_do_not_block_the_loop(monkeypatch):
+    monkeypatch.setattr(yf_provider.yf, "Ticker", SlowTicker)
+    client = yf_provider.YFinanceClient()
+
+    async def run():
+        return await asyncio.gather(client.income_statement("AAPL"), client.income_statement("MSFT"))
+
+    SlowTicker.overlap.reset()
+    aapl, msft = asyncio.run(run())
+
+    assert aapl[0]["fiscalDateEnding"] == "2024-12-31"
+    assert aapl[0]["totalRevenue"] == "100.0"
+    assert msft == aapl  # The fake returns the same statement for every ticker
+    assert not SlowTicker.overlap.broken